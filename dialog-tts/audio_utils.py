@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import math
+import mmap
+import os
+import struct
 from pathlib import Path
 from typing import Optional, List
 
+import numpy as np
+
 try:
     from pydub import AudioSegment
     from pydub.effects import normalize as pydub_normalize
@@ -242,11 +247,7 @@ class AudioProcessor:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         if format == "wav":
-            audio.export(
-                str(output_path),
-                format="wav",
-                parameters=["-ar", str(self.sample_rate)]
-            )
+            self.export_wav_mmap(audio, output_path)
         elif format == "mp3":
             audio.export(
                 str(output_path),
@@ -259,6 +260,50 @@ class AudioProcessor:
 
         return output_path
 
+    def export_wav_mmap(self, audio: AudioSegment, output_path: Path) -> Path:
+        """
+        Write 16-bit PCM WAV by copying samples straight into a mapped file.
+
+        Avoids the intermediate bytes copy pydub's export makes of the whole
+        buffer, and doesn't need ffmpeg.
+
+        Args:
+            audio: Audio to export (resampled to the target rate if needed)
+            output_path: Output .wav path
+
+        Returns:
+            Path to exported file
+        """
+        if audio.frame_rate != self.sample_rate:
+            audio = audio.set_frame_rate(self.sample_rate)
+        if audio.sample_width != 2:
+            audio = audio.set_sample_width(2)
+
+        samples = np.frombuffer(audio.raw_data, dtype=np.int16)
+        data_size = samples.nbytes
+        block_align = audio.channels * 2
+        header = struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + data_size, b"WAVE",
+            b"fmt ", 16, 1, audio.channels, self.sample_rate,
+            self.sample_rate * block_align, block_align, 16,
+            b"data", data_size,
+        )
+
+        output_path = Path(output_path)
+        total_size = len(header) + data_size
+        fd = os.open(output_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, total_size)
+            with mmap.mmap(fd, total_size) as mm:
+                mm[:len(header)] = header
+                np.frombuffer(mm, dtype=np.int16, count=samples.size, offset=len(header))[:] = samples
+                mm.flush()
+        finally:
+            os.close(fd)
+
+        return output_path
+
     def get_duration_ms(self, audio: AudioSegment) -> int:
         """Get audio duration in milliseconds."""
         return len(audio)
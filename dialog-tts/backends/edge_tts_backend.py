@@ -6,8 +6,7 @@ Edge TTS backend for natural, high-quality Korean speech synthesis.
 from __future__ import annotations
 
 import asyncio
-import os
-import tempfile
+import io
 from pathlib import Path
 
 try:
@@ -77,36 +76,30 @@ class EdgeTTSBackend:
         rate_percent = max(-50, min(100, rate_percent))  # Clamp to valid range
         rate_str = f"{rate_percent:+d}%"
 
-        # Create temp file for MP3 output
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp_file:
-            tmp_path = tmp_file.name
-
-        try:
-            # Synthesize with edge-tts
-            async def _synthesize():
-                communicate = edge_tts.Communicate(
-                    text,
-                    edge_voice,
-                    rate=rate_str,
-                    volume="+0%"  # Keep volume at 0% (default)
-                )
-                await communicate.save(tmp_path)
-
-            # Run async synthesis
-            asyncio.run(_synthesize())
-
-            # Convert MP3 to WAV
-            audio = AudioSegment.from_mp3(tmp_path)
-            audio.export(str(output_path), format='wav')
-
-            return output_path
-
-        finally:
-            # Clean up temp MP3 file
-            try:
-                os.unlink(tmp_path)
-            except Exception:
-                pass
+        # Collect the MP3 stream in memory; no temp file to leak
+        mp3_buffer = io.BytesIO()
+
+        # Synthesize with edge-tts
+        async def _synthesize():
+            communicate = edge_tts.Communicate(
+                text,
+                edge_voice,
+                rate=rate_str,
+                volume="+0%"  # Keep volume at 0% (default)
+            )
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    mp3_buffer.write(chunk["data"])
+
+        # Run async synthesis
+        asyncio.run(_synthesize())
+
+        # Convert MP3 to WAV
+        mp3_buffer.seek(0)
+        audio = AudioSegment.from_file(mp3_buffer, format='mp3')
+        audio.export(str(output_path), format='wav')
+
+        return output_path
 
     def synthesize_to_file(
         self,
@@ -22,7 +22,7 @@ from backends.xtts_backend import XTTSBackend, XTTS_AVAILABLE
 from backends.edge_tts_backend import EdgeTTSBackend, EDGE_TTS_AVAILABLE
 
 # Import utilities
-from parser_utils import DialogParser, DialogLine, Directive, split_sentences
+from parser_utils import DialogParser, DialogElement, DialogLine, Directive, split_sentences
 from audio_utils import AudioProcessor
 
 try:
@@ -31,6 +31,9 @@ except ImportError:
     print("Error: pydub is required. Install with: pip install pydub")
     sys.exit(1)
 
+# libyaml's C loader when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class SpeakerConfig:
     """Configuration for a single speaker."""
@@ -113,6 +116,9 @@ class DialogTTSEngine:
                 self.backend = MacSayBackend()
                 print("Using macOS 'say' command backend")
 
+        # Backend actually in use; differs from engine when a fallback was chosen
+        self.backend_name = selected_engine
+
         # Initialize audio processor
         self.audio_processor = AudioProcessor(sample_rate=sample_rate)
 
@@ -143,16 +149,66 @@ class DialogTTSEngine:
         Returns:
             Path to output audio file
         """
-        # Build speaker aliases for parser
+        parser = self._parser_for(speaker_map)
+        return self._synthesize_elements(
+            parser, parser.parse_file(script_path), speaker_map, output_path,
+            gap_ms, xfade_ms, breath_ms, normalize_dbfs, default_speaker,
+        )
+
+    def synthesize_dialog_text(
+        self,
+        script: str,
+        speaker_map: Dict[str, SpeakerConfig],
+        output_path: Path,
+        gap_ms: int = 250,
+        xfade_ms: int = 20,
+        breath_ms: int = 80,
+        normalize_dbfs: float = -1.0,
+        default_speaker: Optional[str] = None
+    ) -> Path:
+        """
+        Synthesize dialog from an in-memory script.
+
+        Same as synthesize_dialog(), without writing the script to a file first.
+        """
+        parser = self._parser_for(speaker_map)
+        return self._synthesize_elements(
+            parser, parser.parse_lines(script.lstrip('\ufeff').splitlines()), speaker_map, output_path,
+            gap_ms, xfade_ms, breath_ms, normalize_dbfs, default_speaker,
+        )
+
+    @staticmethod
+    def sfx_paths(script: str) -> List[Path]:
+        """Sound effect files referenced by [sfx=...] directives in script."""
+        elements = DialogParser().parse_lines(script.lstrip('\ufeff').splitlines())
+        return [
+            Path(element.params.get('value', ''))
+            for element in elements
+            if isinstance(element, Directive) and element.type == "sfx"
+        ]
+
+    @staticmethod
+    def _parser_for(speaker_map: Dict[str, SpeakerConfig]) -> DialogParser:
+        """Build a parser that knows the speakers' aliases."""
         speaker_aliases = {}
         for speaker, config in speaker_map.items():
             if config.aliases:
                 speaker_aliases[speaker] = config.aliases
+        return DialogParser(speaker_aliases=speaker_aliases)
 
-        # Parse script
-        parser = DialogParser(speaker_aliases=speaker_aliases)
-        elements = parser.parse_file(script_path)
-
+    def _synthesize_elements(
+        self,
+        parser: DialogParser,
+        elements: List[DialogElement],
+        speaker_map: Dict[str, SpeakerConfig],
+        output_path: Path,
+        gap_ms: int,
+        xfade_ms: int,
+        breath_ms: int,
+        normalize_dbfs: float,
+        default_speaker: Optional[str],
+    ) -> Path:
+        """Render parsed dialog elements to output_path."""
         # Check for unknown speakers
         script_speakers = parser.get_speakers(elements)
         unknown_speakers = script_speakers - set(speaker_map.keys())
@@ -392,7 +448,7 @@ def load_speaker_map(
     if file_path:
         # Load from YAML
         with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
 
         speaker_map = {}
         for speaker, config in data.items():
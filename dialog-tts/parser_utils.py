@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional, Union
+from typing import Iterable, List, Dict, Optional, Union
 
 
 @dataclass
@@ -27,19 +27,45 @@ class Directive:
 DialogElement = Union[DialogLine, Directive]
 
 
-class DialogParser:
-    """Parses dialog scripts with speaker labels and directives."""
+# Regex patterns, compiled once at import
+# Matches: "Speaker: text" or "Speaker： text" (full-width colon)
+_SPEAKER_RE = re.compile(r'^(?P<speaker>[\w\-\s가-힣]+)\s*[:：]\s*(?P<line>.*)$')
+
+# Matches: "[key=value param2=value2]"
+_DIRECTIVE_RE = re.compile(r'^\[(?P<content>.+?)\]$')
+
+# Comment/blank line patterns
+_COMMENT_RE = re.compile(r'^\s*#')
+_BLANK_RE = re.compile(r'^\s*$')
 
-    # Regex patterns
-    # Matches: "Speaker: text" or "Speaker： text" (full-width colon)
-    SPEAKER_PATTERN = re.compile(r'^(?P<speaker>[\w\-\s가-힣]+)\s*[:：]\s*(?P<line>.*)$')
+# Whole-script scanner: each line matches exactly one branch, named by
+# lastgroup. Same rules as the per-line patterns above, with horizontal
+# whitespace spelled [^\S\n] so no branch can run across a line break.
+_LINE_RE = re.compile(
+    r'^(?:'
+    r'(?P<skip>[^\S\n]*(?:#.*)?)'
+    r'|(?P<directive>\[(?P<content>.+?)\][^\S\n]*)'
+    r'|(?P<dialog>(?P<speaker>(?:[\w\-가-힣]|[^\S\n])+)[:：][^\S\n]*(?P<line>.*))'
+    r'|(?P<other>.*)'
+    r')$',
+    re.MULTILINE,
+)
 
-    # Matches: "[key=value param2=value2]"
-    DIRECTIVE_PATTERN = re.compile(r'^\[(?P<content>.+?)\]$')
+# A sentence up to and including its ending punctuation (. ? ! ？ ！ …),
+# a trailing fragment with no punctuation, or a bare punctuation run
+_SENTENCE_RE = re.compile(r'[^.?!？！…]+(?:[.?!？！…]+|$)|[.?!？！…]+')
 
-    # Comment/blank line patterns
-    COMMENT_PATTERN = re.compile(r'^\s*#')
-    BLANK_PATTERN = re.compile(r'^\s*$')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class DialogParser:
+    """Parses dialog scripts with speaker labels and directives."""
+
+    # Kept as class attributes for callers that reference them
+    SPEAKER_PATTERN = _SPEAKER_RE
+    DIRECTIVE_PATTERN = _DIRECTIVE_RE
+    COMMENT_PATTERN = _COMMENT_RE
+    BLANK_PATTERN = _BLANK_RE
 
     def __init__(self, speaker_aliases: Optional[Dict[str, List[str]]] = None):
         """
@@ -57,49 +83,64 @@ class DialogParser:
                 self._alias_lookup[alias.strip()] = canonical
 
     def parse_file(self, file_path: Path) -> List[DialogElement]:
-        """Parse a dialog script file."""
+        """Parse a dialog script file, reading it line by line."""
         with open(file_path, 'r', encoding='utf-8-sig') as f:  # Handle BOM
-            lines = f.readlines()
-
-        return self.parse_lines(lines)
+            return self.parse_lines(f)
 
-    def parse_lines(self, lines: List[str]) -> List[DialogElement]:
-        """Parse dialog script lines."""
-        elements: List[DialogElement] = []
+    def parse_lines(self, lines: Iterable[str]) -> List[DialogElement]:
+        """
+        Parse dialog script lines.
 
-        for i, raw_line in enumerate(lines, start=1):
-            # Normalize line: strip trailing whitespace, handle CRLF
-            line = raw_line.rstrip('\r\n').rstrip()
+        Lists and tuples are joined and scanned in one pass; any other
+        iterable (e.g. an open file) is consumed one line at a time.
+        """
+        # Normalize lines: strip trailing whitespace, handle CRLF
+        if isinstance(lines, (list, tuple)):
+            return self.parse_text("\n".join(line.rstrip() for line in lines))
 
-            # Skip comments and blank lines
-            if self.COMMENT_PATTERN.match(line) or self.BLANK_PATTERN.match(line):
-                continue
+        elements: List[DialogElement] = []
+        for i, line in enumerate(lines, start=1):
+            element = self._element_from_match(_LINE_RE.match(line.rstrip()), i)
+            if element is not None:
+                elements.append(element)
 
-            # Try to parse as directive
-            directive = self._parse_directive(line, i)
-            if directive:
-                elements.append(directive)
-                continue
+        return elements
 
-            # Try to parse as speaker line
-            speaker_line = self._parse_speaker_line(line, i)
-            if speaker_line:
-                elements.append(speaker_line)
-                continue
+    def parse_text(self, text: str) -> List[DialogElement]:
+        """Parse a whole dialog script with a single regex scan."""
+        elements: List[DialogElement] = []
 
-            # If neither, log warning but continue
-            print(f"Warning: Could not parse line {i}: {line[:50]}")
+        for i, match in enumerate(_LINE_RE.finditer(text), start=1):
+            element = self._element_from_match(match, i)
+            if element is not None:
+                elements.append(element)
 
         return elements
 
-    def _parse_speaker_line(self, line: str, line_number: int) -> Optional[DialogLine]:
-        """Parse a speaker line like 'A: Hello there'."""
-        match = self.SPEAKER_PATTERN.match(line)
-        if not match:
+    def _element_from_match(self, match: re.Match, line_num: int) -> Optional[DialogElement]:
+        """Build the element for one `_LINE_RE` match (None for skipped lines)."""
+        kind = match.lastgroup
+
+        # Skip comments and blank lines
+        if kind == 'skip':
             return None
 
-        speaker = match.group('speaker').strip()
-        text = match.group('line').strip()
+        element: Optional[DialogElement] = None
+        if kind == 'directive':
+            element = self._make_directive(match.group('content'), line_num)
+        elif kind == 'dialog':
+            element = self._make_dialog_line(match.group('speaker'), match.group('line'), line_num)
+
+        if element is None:
+            # If neither, log warning but continue
+            print(f"Warning: Could not parse line {line_num}: {match.group(0).rstrip()[:50]}")
+
+        return element
+
+    def _make_dialog_line(self, speaker: str, text: str, line_number: int) -> Optional[DialogLine]:
+        """Build a DialogLine from the parts of 'A: Hello there'."""
+        speaker = speaker.strip()
+        text = text.strip()
 
         # Skip if no actual text
         if not text:
@@ -114,13 +155,9 @@ class DialogParser:
             line_number=line_number
         )
 
-    def _parse_directive(self, line: str, line_number: int) -> Optional[Directive]:
-        """Parse a directive like [silence=400] or [sfx=path.wav vol=-6 pan=+0.3]."""
-        match = self.DIRECTIVE_PATTERN.match(line)
-        if not match:
-            return None
-
-        content = match.group('content').strip()
+    def _make_directive(self, content: str, line_number: int) -> Optional[Directive]:
+        """Build a Directive from the inside of [silence=400] or [sfx=path.wav vol=-6 pan=+0.3]."""
+        content = content.strip()
 
         # Parse key=value pairs
         # First token is type (e.g., "silence=400" -> type is "silence")
@@ -163,34 +200,19 @@ def split_sentences(text: str) -> List[str]:
 
     Splits on: . ? ! ？ ！ …
     """
-    # Pattern to split on sentence-ending punctuation
-    # Keep the punctuation with the sentence
-    pattern = r'([.?!？！…]+)'
-    parts = re.split(pattern, text)
-
-    sentences = []
-    current = ""
-
-    for part in parts:
-        if not part.strip():
-            continue
-
-        current += part
-
-        # If this part ends with punctuation, complete the sentence
-        if re.match(pattern, part):
-            sentences.append(current.strip())
-            current = ""
-
-    # Add any remaining text
-    if current.strip():
-        sentences.append(current.strip())
+    # One scan: each match is a sentence with its trailing punctuation,
+    # a trailing fragment without punctuation, or a bare punctuation run
+    sentences = [
+        sentence
+        for sentence in (m.group(0).strip() for m in _SENTENCE_RE.finditer(text))
+        if sentence
+    ]
 
-    return sentences if sentences else [text]
+    return sentences or [text]
 
 
 def normalize_text(text: str) -> str:
     """Normalize text for TTS processing."""
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     return text.strip()
@@ -0,0 +1,43 @@
+"""Shared pytest configuration for dialog-tts tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the dialog-tts modules (backends, parser_utils, ...) importable
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: spawns a real interpreter; deselect with -m 'not slow'"
+    )
+
+
+@pytest.fixture(scope="session")
+def mac_backends():
+    """
+    Probe the macOS backends once per session.
+
+    Returns a dict with the ``say`` backend instance (or None), the
+    ``pyobjc`` availability flag, and the ``errors`` raised while probing,
+    keyed by backend name. Off macOS nothing is imported.
+    """
+    info = {"say": None, "pyobjc": False, "errors": {}}
+    if sys.platform != "darwin":
+        return info
+
+    try:
+        from backends.mac_say_cli import MacSayBackend
+        info["say"] = MacSayBackend()
+    except Exception as e:
+        info["errors"]["say"] = e
+
+    try:
+        from backends.mac_nsspeech import PYOBJC_AVAILABLE
+        info["pyobjc"] = PYOBJC_AVAILABLE
+    except ImportError as e:
+        info["errors"]["pyobjc"] = e
+
+    return info
@@ -137,6 +137,18 @@ class TestAudioProcessor:
             assert output_path.exists()
             assert output_path.stat().st_size > 0
 
+    def test_export_wav_mmap_roundtrip(self, processor, sample_audio):
+        """Test the mapped WAV writer produces a readable file."""
+        stereo = processor.apply_pan(sample_audio.set_frame_rate(24000), -0.5)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.wav"
+            processor.export_wav_mmap(stereo, output_path)
+
+            loaded = AudioSegment.from_wav(str(output_path))
+            assert loaded.frame_rate == 24000
+            assert loaded.channels == 2
+            assert loaded.raw_data == stereo.raw_data
+
     def test_load_audio(self, processor, sample_audio):
         """Test loading audio file."""
         with tempfile.TemporaryDirectory() as tmpdir:
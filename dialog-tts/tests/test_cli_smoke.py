@@ -2,175 +2,177 @@
 
 import pytest
 from pathlib import Path
-import tempfile
 import subprocess
 import sys
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import dialog_tts
+
+
+def run_cli(argv):
+    """Run dialog_tts.main() in-process and return its exit code."""
+    old_argv = sys.argv
+    sys.argv = ["dialog_tts"] + [str(arg) for arg in argv]
+    try:
+        dialog_tts.main()
+    except SystemExit as e:
+        return e.code
+    finally:
+        sys.argv = old_argv
+    return 0
+
+
+SPEAKER_MAP_YAML = """\
+A:
+  voice_hint: ko_KR
+  rate_wpm: 180
+  gain_db: 0.0
+  pan: -0.3
+B:
+  voice_hint: ko_KR
+  rate_wpm: 170
+  gain_db: -1.0
+  pan: 0.3
+"""
+
 
 @pytest.fixture
-def sample_script():
+def sample_script(tmp_path):
     """Create a simple test script."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-        f.write("A: 안녕하세요\n")
-        f.write("B: 반갑습니다\n")
-        f.write("[silence=300]\n")
-        f.write("A: 좋은 하루 되세요\n")
-        temp_path = Path(f.name)
-
-    yield temp_path
-    temp_path.unlink(missing_ok=True)
+    path = tmp_path / "script.txt"
+    path.write_text(
+        "A: 안녕하세요\n"
+        "B: 반갑습니다\n"
+        "[silence=300]\n"
+        "A: 좋은 하루 되세요\n",
+        encoding='utf-8'
+    )
+    return path
 
 
 @pytest.fixture
-def sample_speaker_map():
+def sample_speaker_map(tmp_path):
     """Create a simple speaker map YAML."""
-    import yaml
-
-    config = {
-        'A': {
-            'voice_hint': 'ko_KR',
-            'rate_wpm': 180,
-            'gain_db': 0.0,
-            'pan': -0.3
-        },
-        'B': {
-            'voice_hint': 'ko_KR',
-            'rate_wpm': 170,
-            'gain_db': -1.0,
-            'pan': 0.3
-        }
-    }
-
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False, encoding='utf-8') as f:
-        yaml.dump(config, f, allow_unicode=True)
-        temp_path = Path(f.name)
-
-    yield temp_path
-    temp_path.unlink(missing_ok=True)
+    path = tmp_path / "speakers.yaml"
+    path.write_text(SPEAKER_MAP_YAML, encoding='utf-8')
+    return path
 
 
 class TestCLISmoke:
     """Smoke tests for dialog_tts CLI."""
 
-    def test_help(self):
+    def test_help(self, capsys):
         """Test --help flag."""
-        dialog_tts = Path(__file__).parent.parent / "dialog_tts.py"
-
-        result = subprocess.run(
-            [sys.executable, str(dialog_tts), '--help'],
-            capture_output=True,
-            text=True
-        )
+        returncode = run_cli(['--help'])
+        captured = capsys.readouterr()
 
-        assert result.returncode == 0
-        assert 'Dialog TTS' in result.stdout
-        assert '--script' in result.stdout
-        assert '--out' in result.stdout
+        assert returncode == 0
+        assert 'Dialog TTS' in captured.out
+        assert '--script' in captured.out
+        assert '--out' in captured.out
 
-    def test_missing_args(self):
+    def test_missing_args(self, capsys):
         """Test that missing required args produces error."""
-        dialog_tts = Path(__file__).parent.parent / "dialog_tts.py"
-
-        result = subprocess.run(
-            [sys.executable, str(dialog_tts)],
-            capture_output=True,
-            text=True
-        )
+        returncode = run_cli([])
+        captured = capsys.readouterr()
 
-        assert result.returncode != 0
+        assert returncode != 0
         # Should mention required arguments
-        assert 'required' in result.stderr.lower() or 'error' in result.stderr.lower()
+        assert 'required' in captured.err.lower() or 'error' in captured.err.lower()
 
     @pytest.mark.skipif(sys.platform != 'darwin', reason="macOS only")
-    def test_mac_engine_basic(self, sample_script, sample_speaker_map):
+    def test_mac_engine_basic(self, sample_script, sample_speaker_map, tmp_path, capsys):
         """Test basic execution with mac engine."""
-        dialog_tts = Path(__file__).parent.parent / "dialog_tts.py"
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output = Path(tmpdir) / "output.wav"
-
-            result = subprocess.run(
-                [
-                    sys.executable, str(dialog_tts),
-                    '--script', str(sample_script),
-                    '--speaker-map', str(sample_speaker_map),
-                    '--out', str(output),
-                    '--engine', 'mac'
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-
-            # Print output for debugging
-            if result.returncode != 0:
-                print("STDOUT:", result.stdout)
-                print("STDERR:", result.stderr)
-
-            # Check if it succeeded or at least tried
-            # (It might fail if macOS voices aren't configured, but shouldn't crash)
-            assert result.returncode in [0, 1]
-
-            # If successful, check output file
-            if result.returncode == 0 and output.exists():
-                assert output.stat().st_size > 0
-                print(f"✓ Generated audio file: {output.stat().st_size} bytes")
-
-    def test_inline_voices(self, sample_script):
+        output = tmp_path / "output.wav"
+
+        returncode = run_cli([
+            '--script', sample_script,
+            '--speaker-map', sample_speaker_map,
+            '--out', output,
+            '--engine', 'mac'
+        ])
+
+        # Print output for debugging
+        if returncode != 0:
+            captured = capsys.readouterr()
+            print("STDOUT:", captured.out)
+            print("STDERR:", captured.err)
+
+        # Check if it succeeded or at least tried
+        # (It might fail if macOS voices aren't configured, but shouldn't crash)
+        assert returncode in [0, 1]
+
+        # If successful, check output file
+        if returncode == 0 and output.exists():
+            assert output.stat().st_size > 0
+            print(f"✓ Generated audio file: {output.stat().st_size} bytes")
+
+    def test_inline_voices(self, sample_script, tmp_path, capsys):
         """Test using inline --voices instead of speaker map."""
-        dialog_tts = Path(__file__).parent.parent / "dialog_tts.py"
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output = Path(tmpdir) / "output.wav"
-
-            result = subprocess.run(
-                [
-                    sys.executable, str(dialog_tts),
-                    '--script', str(sample_script),
-                    '--voices',
-                    'A=ko_KR:Yuna,rate=180,pan=-0.3',
-                    'B=ko_KR:Jinho,rate=170,pan=0.3',
-                    '--out', str(output),
-                    '--engine', 'mac'
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-
-            # Should at least parse arguments correctly
-            # Actual synthesis may fail depending on system
-            assert 'speaker' in result.stdout.lower() or result.returncode in [0, 1]
+        output = tmp_path / "output.wav"
+
+        returncode = run_cli([
+            '--script', sample_script,
+            '--voices',
+            'A=ko_KR:Yuna,rate=180,pan=-0.3',
+            'B=ko_KR:Jinho,rate=170,pan=0.3',
+            '--out', output,
+            '--engine', 'mac'
+        ])
+        captured = capsys.readouterr()
+
+        # Should at least parse arguments correctly
+        # Actual synthesis may fail depending on system
+        assert 'speaker' in captured.out.lower() or returncode in [0, 1]
+
+    @pytest.mark.slow
+    def test_help_subprocess(self):
+        """Test --help through a real interpreter to cover the script entry point."""
+        script = Path(__file__).parent.parent / "dialog_tts.py"
+
+        result = subprocess.run(
+            [sys.executable, str(script), '--help'],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 0
+        assert 'Dialog TTS' in result.stdout
+        assert '--script' in result.stdout
 
 
 class TestBackendAvailability:
     """Test backend availability detection."""
 
-    def test_mac_backend_available(self):
+    def test_mac_backend_available(self, mac_backends):
         """Test if mac backend is available on macOS."""
         if sys.platform == 'darwin':
             # Should be able to import
-            try:
-                from backends.mac_say_cli import MacSayBackend
-                backend = MacSayBackend()
-                print("✓ Mac say backend available")
-            except Exception as e:
-                pytest.fail(f"Mac backend should be available on macOS: {e}")
-
-    def test_pyobjc_availability(self):
+            error = mac_backends["errors"].get("say")
+            if error is not None:
+                pytest.fail(f"Mac backend should be available on macOS: {error}")
+            print("✓ Mac say backend available")
+
+    def test_pyobjc_availability(self, mac_backends):
         """Test PyObjC availability."""
         if sys.platform == 'darwin':
-            try:
-                from backends.mac_nsspeech import PYOBJC_AVAILABLE
-                if PYOBJC_AVAILABLE:
-                    print("✓ PyObjC is available")
-                else:
-                    print("ℹ PyObjC not available, will use 'say' fallback")
-            except ImportError:
+            if "pyobjc" in mac_backends["errors"]:
                 pytest.fail("Should be able to import mac_nsspeech module")
+            if mac_backends["pyobjc"]:
+                print("✓ PyObjC is available")
+            else:
+                print("ℹ PyObjC not available, will use 'say' fallback")
+
+
+class TestScriptInspection:
+    """Test helpers that inspect a script without synthesizing it."""
+
+    def test_sfx_paths(self):
+        script = "A: 안녕\n[sfx=sounds/ding.wav vol=-6]\n[silence=300]\n[sfx=pop.wav]"
+        paths = dialog_tts.DialogTTSEngine.sfx_paths(script)
+        assert paths == [Path("sounds/ding.wav"), Path("pop.wav")]
 
 
 if __name__ == "__main__":
@@ -2,7 +2,6 @@
 
 import pytest
 from pathlib import Path
-import tempfile
 import sys
 
 # Add parent directory to path
@@ -11,12 +10,17 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from parser_utils import DialogParser, DialogLine, Directive
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """Shared parser; DialogParser holds no per-parse state."""
+    return DialogParser()
+
+
 class TestDialogParser:
     """Test dialog script parser."""
 
-    def test_parse_speaker_line(self):
+    def test_parse_speaker_line(self, parser):
         """Test parsing speaker lines."""
-        parser = DialogParser()
         lines = [
             "A: Hello there",
             "B: How are you?",
@@ -33,9 +37,8 @@ class TestDialogParser:
         assert elements[1].speaker == "B"
         assert elements[1].text == "How are you?"
 
-    def test_parse_fullwidth_colon(self):
+    def test_parse_fullwidth_colon(self, parser):
         """Test parsing with full-width colon (：)."""
-        parser = DialogParser()
         lines = [
             "A： 안녕하세요",
             "B: 반갑습니다",
@@ -48,9 +51,8 @@ class TestDialogParser:
         assert elements[0].text == "안녕하세요"
         assert elements[1].speaker == "B"
 
-    def test_parse_silence_directive(self):
+    def test_parse_silence_directive(self, parser):
         """Test parsing silence directive."""
-        parser = DialogParser()
         lines = [
             "A: Hello",
             "[silence=400]",
@@ -64,9 +66,8 @@ class TestDialogParser:
         assert elements[1].type == "silence"
         assert elements[1].params['value'] == "400"
 
-    def test_parse_sfx_directive(self):
+    def test_parse_sfx_directive(self, parser):
         """Test parsing sound effect directive."""
-        parser = DialogParser()
         lines = [
             "[sfx=samples/ring.wav vol=-6 pan=+0.2]",
         ]
@@ -80,9 +81,8 @@ class TestDialogParser:
         assert elements[0].params['vol'] == "-6"
         assert elements[0].params['pan'] == "+0.2"
 
-    def test_parse_comments_and_blank_lines(self):
+    def test_parse_comments_and_blank_lines(self, parser):
         """Test that comments and blank lines are ignored."""
-        parser = DialogParser()
         lines = [
             "# This is a comment",
             "",
@@ -120,9 +120,8 @@ class TestDialogParser:
         assert elements[2].speaker == "B"
         assert elements[3].speaker == "B"
 
-    def test_get_speakers(self):
+    def test_get_speakers(self, parser):
         """Test extracting unique speakers."""
-        parser = DialogParser()
         lines = [
             "A: Hello",
             "B: Hi",
@@ -136,45 +135,52 @@ class TestDialogParser:
 
         assert speakers == {"A", "B", "C"}
 
-    def test_parse_file(self):
-        """Test parsing from file."""
-        parser = DialogParser()
+    def test_parse_text_line_numbers(self, parser):
+        """Test whole-script parsing keeps line numbers across skipped lines."""
+        text = "# intro\r\n\nA: Hello  \n[silence=300]   \nnot a line\nB: Bye\n"
 
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-            f.write("# Test dialog\n")
-            f.write("A: Hello\n")
-            f.write("B: Hi\n")
-            f.write("[silence=500]\n")
-            f.write("A: Goodbye\n")
-            temp_path = Path(f.name)
+        elements = parser.parse_text(text)
 
-        try:
-            elements = parser.parse_file(temp_path)
+        assert [e.line_number for e in elements] == [3, 4, 6]
+        assert elements[0].text == "Hello"
+        assert elements[1].params == {"value": "300"}
+        assert elements[2].speaker == "B"
 
-            assert len(elements) == 4
-            assert isinstance(elements[0], DialogLine)
-            assert isinstance(elements[2], Directive)
+    def test_parse_lines_iterator_matches_list(self, parser):
+        """Test streamed lines parse the same as a materialized list."""
+        lines = ["# intro\r\n", "\n", "A: Hello  \n", "[silence=300]\n", "not a line\n", "B: Bye\n"]
 
-        finally:
-            temp_path.unlink()
+        streamed = parser.parse_lines(iter(lines))
 
-    def test_parse_with_bom(self):
-        """Test parsing file with BOM."""
-        parser = DialogParser()
+        assert streamed == parser.parse_lines(lines)
+        assert [e.line_number for e in streamed] == [3, 4, 6]
+
+    def test_parse_file(self, parser, tmp_path):
+        """Test parsing from file."""
+        script = tmp_path / "dialog.txt"
+        script.write_text(
+            "# Test dialog\n"
+            "A: Hello\n"
+            "B: Hi\n"
+            "[silence=500]\n"
+            "A: Goodbye\n",
+            encoding='utf-8'
+        )
+
+        elements = parser.parse_file(script)
 
-        # Create file with BOM
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8-sig') as f:
-            f.write("A: Hello\n")
-            temp_path = Path(f.name)
+        assert len(elements) == 4
+        assert isinstance(elements[0], DialogLine)
+        assert isinstance(elements[2], Directive)
 
-        try:
-            elements = parser.parse_file(temp_path)
-            assert len(elements) == 1
-            assert elements[0].speaker == "A"
+    def test_parse_with_bom(self, parser, tmp_path):
+        """Test parsing file with BOM."""
+        script = tmp_path / "bom.txt"
+        script.write_text("A: Hello\n", encoding='utf-8-sig')
 
-        finally:
-            temp_path.unlink()
+        elements = parser.parse_file(script)
+        assert len(elements) == 1
+        assert elements[0].speaker == "A"
 
 
 class TestSentenceSplitter:
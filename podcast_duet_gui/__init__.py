@@ -7,7 +7,7 @@ Parses A:/B: dialog scripts and synthesizes them using MacTTS.
 __version__ = "0.1.0"
 
 # Core modules (no GUI dependency)
-from .parser_rules import parse_script, ScriptParser, TimelineEvent
+from .parser_rules import parse_script, parse_script_array, ScriptParser, TimelineArray, TimelineEvent
 from .engine_bridge import get_bridge, MacTTSBridge, Voice
 from .audio_pipeline import AudioPipeline, SpeakerSettings
 
@@ -17,9 +17,20 @@ def get_app():
     from .app import main, PodcastDuetWindow
     return main, PodcastDuetWindow
 
+
+def __getattr__(name):
+    """Resolve GUI names on first access so Qt loads only when needed."""
+    if name in ("main", "PodcastDuetWindow"):
+        main, window_cls = get_app()
+        globals().update(main=main, PodcastDuetWindow=window_cls)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'parse_script',
+    'parse_script_array',
     'ScriptParser',
+    'TimelineArray',
     'TimelineEvent',
     'get_bridge',
     'MacTTSBridge',
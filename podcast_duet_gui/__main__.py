@@ -0,0 +1,12 @@
+"""
+Entry point for ``python -m podcast_duet_gui``.
+
+Importing ``app`` through the package keeps a single module object; running
+``python -m podcast_duet_gui.app`` instead loads it as ``__main__`` as well.
+"""
+
+import sys
+
+from .app import main
+
+sys.exit(main())
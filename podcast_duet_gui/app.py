@@ -8,8 +8,9 @@ from __future__ import annotations
 
 import sys
 import json
+from collections import deque
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Callable, Optional, Dict, List, Set, Tuple
 
 from PySide6 import QtWidgets, QtCore, QtGui
 from PySide6.QtCore import Qt
@@ -20,6 +21,33 @@ from .engine_bridge import get_bridge, Voice
 from .audio_pipeline import AudioPipeline, SpeakerSettings, check_ffmpeg_available
 
 
+def _parse_script_text(script_text: str) -> Tuple[List[TimelineEvent], Set[str]]:
+    """Parse a script with a private parser (safe to call off the GUI thread)."""
+    parser = ScriptParser()
+    events = parser.parse(script_text)
+    return events, parser.get_speakers()
+
+
+class _BackgroundTask(QtCore.QObject):
+    """Runs a callable on a worker thread and reports back through signals."""
+
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(str)
+
+    def __init__(self, func: Callable[[], Any]):
+        super().__init__()
+        self._func = func
+
+    @QtCore.Slot()
+    def run(self):
+        try:
+            result = self._func()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(result)
+
+
 class PodcastDuetWindow(QtWidgets.QMainWindow):
     """Main window for podcast synthesis."""
 
@@ -30,7 +58,6 @@ class PodcastDuetWindow(QtWidgets.QMainWindow):
 
         # State
         self.current_script_path: Optional[Path] = None
-        self.parser = ScriptParser()
         self.bridge = get_bridge()
         self.pipeline = AudioPipeline()
 
@@ -38,6 +65,10 @@ class PodcastDuetWindow(QtWidgets.QMainWindow):
         self.speaker_voices: Dict[str, str] = {}  # speaker -> voice_name
         self.speaker_settings: Dict[str, SpeakerSettings] = {}
 
+        # Background work: (thread, task) pairs kept alive until reaped
+        self._background_tasks: Set[Tuple[QtCore.QThread, _BackgroundTask]] = set()
+        self._parse_generation = 0
+
         # Setup UI
         self._setup_ui()
         self._setup_menu()
@@ -81,6 +112,14 @@ class PodcastDuetWindow(QtWidgets.QMainWindow):
         self.log_text = QtWidgets.QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(100)
+        self.log_text.setMaximumBlockCount(1000)
+
+        # Log lines are buffered and appended in one batch per timer tick
+        self._log_buffer: deque = deque()
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
 
         # Add to layout (TODO: proper dock widget)
         # For now, just add log at bottom
@@ -126,6 +165,13 @@ class PodcastDuetWindow(QtWidgets.QMainWindow):
         self.script_edit.setFont(QtGui.QFont("Consolas", 11))
         layout.addWidget(self.script_edit)
 
+        # Re-parse once typing pauses; each edit restarts the single-shot timer
+        self._parse_debounce = QtCore.QTimer(self)
+        self._parse_debounce.setSingleShot(True)
+        self._parse_debounce.setInterval(300)
+        self._parse_debounce.timeout.connect(self._auto_parse_script)
+        self.script_edit.textChanged.connect(self._parse_debounce.start)
+
         return widget
 
     def _create_right_panel(self) -> QtWidgets.QWidget:
@@ -141,7 +187,8 @@ class PodcastDuetWindow(QtWidgets.QMainWindow):
         self.timeline_view = QtWidgets.QTableView()
         self.timeline_view.setModel(self.timeline_model)
         self.timeline_view.setSelectionBehavior(QtWidgets.QTableView.SelectRows)
-        self.timeline_view.horizontalHeader().setStretchLastSection(True)
+        # Fixed row heights and column widths: no per-row size queries
+        TimelineModel.apply_view_defaults(self.timeline_view)
         timeline_layout.addWidget(self.timeline_view)
 
         layout.addWidget(timeline_group, stretch=50)
@@ -214,10 +261,16 @@ class PodcastDuetWindow(QtWidgets.QMainWindow):
 
     def _log(self, message: str):
         """Add message to log."""
-        if hasattr(self, 'log_text'):
-            self.log_text.appendPlainText(message)
+        if hasattr(self, '_log_buffer'):
+            self._log_buffer.append(message)
         print(message)
 
+    def _flush_log(self):
+        """Append buffered log lines to the log panel."""
+        if self._log_buffer:
+            self.log_text.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+
     def _open_script(self):
         """Open script file."""
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
@@ -229,10 +282,7 @@ class PodcastDuetWindow(QtWidgets.QMainWindow):
 
         if path:
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                self.script_edit.setPlainText(content)
+                self.script_edit.setPlainText(Path(path).read_text(encoding='utf-8'))
                 self.current_script_path = Path(path)
                 self._log(f"✓ Loaded: {path}")
 
@@ -257,9 +307,7 @@ class PodcastDuetWindow(QtWidgets.QMainWindow):
             self.current_script_path = Path(path)
 
         try:
-            content = self.script_edit.toPlainText()
-            with open(self.current_script_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            self.current_script_path.write_text(self.script_edit.toPlainText(), encoding='utf-8')
 
             self._log(f"✓ Saved: {self.current_script_path}")
 
@@ -270,8 +318,43 @@ class PodcastDuetWindow(QtWidgets.QMainWindow):
                 f"Failed to save file:\n{e}"
             )
 
+    def _run_in_background(
+        self,
+        func: Callable[[], Any],
+        on_finished: Callable[[Any], None],
+        on_failed: Callable[[str], None]
+    ):
+        """Run func on a worker QThread; results arrive on the GUI thread."""
+        thread = QtCore.QThread(self)
+        task = _BackgroundTask(func)
+        task.moveToThread(thread)
+
+        thread.started.connect(task.run)
+        task.finished.connect(on_finished)
+        task.failed.connect(on_failed)
+        task.finished.connect(thread.quit)
+        task.failed.connect(thread.quit)
+        thread.finished.connect(self._reap_background_tasks)
+
+        self._background_tasks.add((thread, task))
+        thread.start()
+
+    def _reap_background_tasks(self):
+        """Release worker threads that have finished."""
+        for thread, task in list(self._background_tasks):
+            if thread.isFinished():
+                self._background_tasks.discard((thread, task))
+                task.deleteLater()
+                thread.deleteLater()
+
+    def _auto_parse_script(self):
+        """Debounced parse after edits; an empty script is left alone."""
+        if self.script_edit.toPlainText().strip():
+            self._parse_script()
+
     def _parse_script(self):
-        """Parse the current script."""
+        """Parse the current script on a worker thread."""
+        self._parse_debounce.stop()
         script_text = self.script_edit.toPlainText()
 
         if not script_text.strip():
@@ -282,49 +365,67 @@ class PodcastDuetWindow(QtWidgets.QMainWindow):
             )
             return
 
-        try:
-            events = self.parser.parse(script_text)
-            self.timeline_model.set_events(events)
+        self._parse_generation += 1
+        generation = self._parse_generation
 
-            speakers = self.parser.get_speakers()
-            self._log(f"✓ Parsed {len(events)} events, {len(speakers)} speakers: {', '.join(speakers)}")
+        def parse():
+            return generation, _parse_script_text(script_text)
 
-            # Auto-populate voice dropdowns if speakers found
-            if 'A' in speakers or 'B' in speakers:
-                self._log("Speakers A/B detected")
+        self._run_in_background(parse, self._on_parse_finished, self._on_parse_failed)
 
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(
-                self,
-                "Parse Error",
-                f"Failed to parse script:\n{e}"
-            )
-
-    def _load_voices(self):
-        """Load available voices from MacTTS."""
-        try:
-            voices = self.bridge.get_voices()
-
-            self.speaker_a_voice.clear()
-            self.speaker_b_voice.clear()
+    def _on_parse_finished(self, result):
+        """Show parsed events; results from superseded parses are dropped."""
+        generation, (events, speakers) = result
+        if generation != self._parse_generation:
+            return
 
-            for voice in voices:
-                self.speaker_a_voice.addItem(str(voice), voice.name)
-                self.speaker_b_voice.addItem(str(voice), voice.name)
+        self.timeline_model.replace_events(events)
+        self._log(f"✓ Parsed {len(events)} events, {len(speakers)} speakers: {', '.join(speakers)}")
 
-            # Set defaults
-            if len(voices) >= 2:
-                self.speaker_a_voice.setCurrentIndex(0)
-                self.speaker_b_voice.setCurrentIndex(1)
+        # Auto-populate voice dropdowns if speakers found
+        if 'A' in speakers or 'B' in speakers:
+            self._log("Speakers A/B detected")
 
-            self._log(f"✓ Loaded {len(voices)} voices from MacTTS")
+    def _on_parse_failed(self, message: str):
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Parse Error",
+            f"Failed to parse script:\n{message}"
+        )
 
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to load voices:\n{e}"
-            )
+    def _load_voices(self):
+        """Load available voices from MacTTS on a worker thread."""
+        self._run_in_background(self.bridge.get_voices, self._on_voices_loaded, self._on_voices_failed)
+
+    def _on_voices_loaded(self, voices: List[Voice]):
+        labels = [str(voice) for voice in voices]
+        names = [voice.name for voice in voices]
+
+        # Fill each combo in one batch, then announce the final selection once
+        defaults = (0, 1) if len(voices) >= 2 else (0, 0)
+        for combo, default in zip((self.speaker_a_voice, self.speaker_b_voice), defaults):
+            combo.blockSignals(True)
+            combo.setUpdatesEnabled(False)
+            try:
+                combo.clear()
+                combo.addItems(labels)
+                for i, name in enumerate(names):
+                    combo.setItemData(i, name)
+                if voices:
+                    combo.setCurrentIndex(default)
+            finally:
+                combo.setUpdatesEnabled(True)
+                combo.blockSignals(False)
+            combo.currentIndexChanged.emit(combo.currentIndex())
+
+        self._log(f"✓ Loaded {len(voices)} voices from MacTTS")
+
+    def _on_voices_failed(self, message: str):
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to load voices:\n{message}"
+        )
 
     def _synthesize_podcast(self):
         """Start podcast synthesis."""
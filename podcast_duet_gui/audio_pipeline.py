@@ -7,12 +7,24 @@ Handles concatenation, panning, gain, silence, crossfade, and normalization.
 from __future__ import annotations
 
 import re
+import struct
+import subprocess
+import wave
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from dataclasses import dataclass
 
+import numpy as np
 from pydub import AudioSegment
-from pydub.effects import normalize
+
+# Optional: PyAV decodes SFX in-process instead of spawning ffmpeg per file
+try:
+    import av
+    PYAV_AVAILABLE = True
+except ImportError:
+    av = None
+    PYAV_AVAILABLE = False
 
 
 @dataclass
@@ -58,7 +70,8 @@ class AudioPipeline:
     def combine_segments(
         self,
         segments: List[AudioSegment],
-        speaker_settings: Optional[Dict[str, SpeakerSettings]] = None
+        speaker_settings: Optional[Dict[str, SpeakerSettings]] = None,
+        speakers: Optional[List[Optional[str]]] = None
     ) -> AudioSegment:
         """
         Combine multiple audio segments into final podcast.
@@ -66,6 +79,8 @@ class AudioPipeline:
         Args:
             segments: List of AudioSegment objects with metadata
             speaker_settings: Optional speaker-specific settings
+            speakers: Speaker of each segment (None for non-speech), used to
+                apply speaker_settings gain/pan while mixing
 
         Returns:
             Combined AudioSegment
@@ -77,25 +92,30 @@ class AudioPipeline:
                 frame_rate=self.sample_rate
             )
 
-        # Start with first segment
-        combined = segments[0]
-
-        # Add remaining segments with gaps
-        for seg in segments[1:]:
-            # Add gap
-            if self.gap_ms > 0:
-                silence = AudioSegment.silent(
-                    duration=self.gap_ms,
-                    frame_rate=self.sample_rate
-                )
-                combined += silence
-
-            # Add next segment
-            combined += seg
+        speaker_settings = speaker_settings or {}
+        if speakers is None:
+            speakers = [None] * len(segments)
+
+        # Convert once to the output format, then blit into one buffer
+        sources = [self._source_samples(seg) for seg in segments]
+        gap_frames = int(self.gap_ms * self.sample_rate / 1000) if self.gap_ms > 0 else 0
+        total_frames = sum(len(src) for src in sources) + gap_frames * (len(sources) - 1)
+
+        data, out = _pcm_buffer(total_frames, self.channels)
+        offset = 0
+        for i, (src, speaker) in enumerate(zip(sources, speakers)):
+            if i:
+                offset += gap_frames  # Gap is already silence in the zeroed buffer
+            settings = speaker_settings.get(speaker) if speaker else None
+            self._blit(
+                out[offset:offset + len(src)],
+                src,
+                settings.gain_db if settings else 0.0,
+                settings.pan if settings else 0.0
+            )
+            offset += len(src)
 
-        # Convert to target format
-        combined = combined.set_frame_rate(self.sample_rate)
-        combined = combined.set_channels(self.channels)
+        combined = self._from_buffer(data, self.channels)
 
         # Normalize
         if self.normalize_peak_dbfs is not None:
@@ -103,6 +123,58 @@ class AudioPipeline:
 
         return combined
 
+    def _source_samples(self, audio: AudioSegment) -> np.ndarray:
+        """
+        16-bit samples at the output rate, as a (frames, channels) array.
+
+        Mono is left as one channel; _blit upmixes it for free.
+        """
+        audio = audio.set_sample_width(2)
+        if audio.frame_rate != self.sample_rate:
+            audio = audio.set_frame_rate(self.sample_rate)
+        if audio.channels not in (1, self.channels):
+            audio = audio.set_channels(self.channels)
+
+        return np.frombuffer(audio.raw_data, dtype=np.int16).reshape(-1, audio.channels)
+
+    def _blit(self, out: np.ndarray, samples: np.ndarray, gain_db: float, pan: float):
+        """
+        Write samples into out with channel mapping, gain and pan in one pass.
+
+        Args:
+            out: int16 destination of shape (frames, self.channels)
+            samples: int16 source of shape (frames, 1 or 2)
+            gain_db: Gain applied to all channels
+            pan: Stereo pan (stereo output only)
+        """
+        if samples.shape[1] == 2 and self.channels == 1:
+            # Downmix like pydub: average of both channels
+            samples = (samples[:, :1].astype(np.int32) + samples[:, 1:]) >> 1
+
+        gains = np.full(self.channels, 10 ** (gain_db / 20))
+        if self.channels == 2:
+            gains *= _pan_gains(pan)
+
+        if np.all(gains == 1.0):
+            out[...] = samples  # (frames, 1) broadcasts to upmix mono
+        else:
+            _scale_q15(samples, gains, out=out)
+
+    def _render(self, samples: np.ndarray, gain_db: float, pan: float) -> AudioSegment:
+        """Apply gain and pan straight into the storage of a new segment."""
+        data, out = _pcm_buffer(len(samples), self.channels)
+        self._blit(out, samples, gain_db, pan)
+        return self._from_buffer(data, self.channels)
+
+    def _from_buffer(self, data: bytearray, channels: int) -> AudioSegment:
+        """Wrap 16-bit PCM at the output rate as an AudioSegment, without copying."""
+        return AudioSegment(
+            data,
+            frame_rate=self.sample_rate,
+            sample_width=2,
+            channels=channels,
+        )
+
     def apply_speaker_effects(
         self,
         audio: AudioSegment,
@@ -116,17 +188,10 @@ class AudioPipeline:
             settings: Speaker settings
 
         Returns:
-            Processed audio
+            Processed audio in the pipeline's output format
         """
-        # Apply gain
-        if settings.gain_db != 0.0:
-            audio = audio + settings.gain_db
-
-        # Apply stereo pan (only for stereo output)
-        if self.channels == 2 and settings.pan != 0.0:
-            audio = self.apply_pan(audio, settings.pan)
-
-        return audio
+        # Gain and pan (stereo output only) in one pass
+        return self._render(self._source_samples(audio), settings.gain_db, settings.pan)
 
     def apply_pan(self, audio: AudioSegment, pan: float) -> AudioSegment:
         """
@@ -143,37 +208,22 @@ class AudioPipeline:
         if audio.channels == 1:
             audio = audio.set_channels(2)
 
-        # Split into left/right channels
-        samples = audio.split_to_mono()
-
-        if len(samples) != 2:
+        if audio.channels != 2:
             return audio  # Can't pan non-stereo
 
-        left, right = samples
-
-        # Calculate gain adjustments
-        # pan = -1.0 → full left (right muted)
-        # pan = 0.0 → center (equal)
-        # pan = +1.0 → full right (left muted)
+        if pan == 0:
+            return audio
 
-        if pan < 0:
-            # Reduce right channel
-            right_gain_db = pan * 40  # -40dB at pan=-1.0
-            right = right + right_gain_db
-        elif pan > 0:
-            # Reduce left channel
-            left_gain_db = -pan * 40
-            left = left + left_gain_db
+        audio = audio.set_sample_width(2)
+        samples = np.frombuffer(audio.raw_data, dtype=np.int16).reshape(-1, 2)
 
-        # Recombine
-        return AudioSegment.from_mono_audiosegments(left, right)
+        data, out = _pcm_buffer(len(samples), 2)
+        _scale_q15(samples, np.array(_pan_gains(pan)), out=out)
+        return audio._spawn(data)
 
     def create_silence(self, duration_ms: int) -> AudioSegment:
-        """Create silence segment."""
-        return AudioSegment.silent(
-            duration=duration_ms,
-            frame_rate=self.sample_rate
-        ).set_channels(self.channels)
+        """Create silence segment (shared per duration/format)."""
+        return _cached_silence(duration_ms, self.sample_rate, self.channels)
 
     def load_sfx(
         self,
@@ -192,22 +242,45 @@ class AudioPipeline:
         Returns:
             Loaded and processed audio
         """
-        # Load file
-        audio = AudioSegment.from_file(str(path))
-
-        # Convert to target format
-        audio = audio.set_frame_rate(self.sample_rate)
-        audio = audio.set_channels(self.channels)
+        # 16-bit PCM WAVs at the output rate are mapped, not read: only the
+        # pages being scaled into the output are touched, and copied once
+        mapped = _map_pcm16_wav(path)
+        if mapped is not None:
+            samples, frame_rate = mapped
+            if frame_rate == self.sample_rate and samples.shape[1] in (1, 2):
+                return self._render(samples, volume_db, pan)
 
-        # Apply volume
-        if volume_db != 0.0:
-            audio = audio + volume_db
-
-        # Apply pan
-        if self.channels == 2 and pan != 0.0:
-            audio = self.apply_pan(audio, pan)
-
-        return audio
+        # Load file
+        if PYAV_AVAILABLE:
+            audio = self._decode_with_av(path)
+        else:
+            audio = AudioSegment.from_file(str(path))
+
+        # Convert to target format, apply volume and pan in one pass
+        return self._render(self._source_samples(audio), volume_db, pan)
+
+    def _decode_with_av(self, path: Path) -> AudioSegment:
+        """Decode a file with PyAV as 16-bit PCM at the output sample rate."""
+        # Channel layout is kept as-is; _render maps it the same way
+        # as for pydub-decoded audio
+        resampler = av.AudioResampler(format='s16', rate=self.sample_rate)
+
+        # Packed s16 frames are (1, samples * channels) arrays
+        chunks = []
+        with av.open(str(path)) as container:
+            stream = container.streams.audio[0]
+            channels = stream.channels
+            for frame in container.decode(stream):
+                chunks.extend(out.to_ndarray() for out in resampler.resample(frame))
+            chunks.extend(out.to_ndarray() for out in resampler.resample(None))  # Flush
+
+        samples = np.concatenate(chunks, axis=1) if chunks else np.zeros((1, 0), dtype=np.int16)
+        return AudioSegment(
+            samples.astype(np.int16, copy=False).tobytes(),
+            frame_rate=self.sample_rate,
+            sample_width=2,
+            channels=channels
+        )
 
     def normalize_to_peak(
         self,
@@ -224,18 +297,20 @@ class AudioPipeline:
         Returns:
             Normalized audio
         """
-        # pydub normalize() normalizes to -0.1 dBFS by default
-        # We need to adjust to our target
-        normalized = normalize(audio, headroom=0.1)
+        audio = audio.set_sample_width(2)
+        samples = np.frombuffer(audio.raw_data, dtype=np.int16).reshape(-1, 1)
 
-        # Calculate additional gain needed
-        current_peak_dbfs = normalized.max_dBFS
-        gain_needed = target_dbfs - current_peak_dbfs
+        # Peak of |sample|, widened so abs(-32768) doesn't overflow
+        peak = int(np.abs(samples.astype(np.int32)).max()) if samples.size else 0
+        if peak == 0:
+            return audio  # Silence: nothing to scale
 
-        if abs(gain_needed) > 0.1:  # Only adjust if significant
-            normalized = normalized + gain_needed
+        # Same reference as pydub's max_dBFS (full scale = 32768)
+        scale = 10 ** (target_dbfs / 20) * audio.max_possible_amplitude / peak
 
-        return normalized
+        data, out = _pcm_buffer(len(samples), 1)
+        _scale_q15(samples, np.array([scale]), out=out)
+        return audio._spawn(data)
 
     def apply_crossfade_at_sentences(
         self,
@@ -284,26 +359,156 @@ class AudioPipeline:
         Returns:
             Path to exported file
         """
+        # Raw 16-bit PCM is written/piped as-is, without pydub's export roundtrip
+        audio = audio.set_sample_width(2)
+
         if format == 'mp3':
-            audio.export(
-                str(output_path),
-                format='mp3',
-                bitrate=bitrate,
-                parameters=["-q:a", "2"]  # High quality
+            ffmpeg = detect_ffmpeg()
+            if ffmpeg is None:
+                raise RuntimeError("ffmpeg is required for MP3 export")
+
+            result = subprocess.run(
+                [
+                    str(ffmpeg), '-y', '-loglevel', 'error',
+                    '-f', 's16le',
+                    '-ar', str(audio.frame_rate),
+                    '-ac', str(audio.channels),
+                    '-i', '-',
+                    '-b:a', bitrate,
+                    '-q:a', '2',  # High quality
+                    str(output_path)
+                ],
+                input=audio.raw_data,
+                capture_output=True
             )
+            if result.returncode != 0:
+                raise RuntimeError(
+                    f"MP3 export failed: {result.stderr.decode('utf-8', 'replace')}"
+                )
         else:
             # WAV
-            audio.export(
-                str(output_path),
-                format='wav'
-            )
+            with wave.open(str(output_path), 'wb') as wav_file:
+                wav_file.setnchannels(audio.channels)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(audio.frame_rate)
+                wav_file.writeframes(audio.raw_data)
 
         return output_path
 
 
+def _map_pcm16_wav(path: Path) -> Optional[Tuple[np.ndarray, int]]:
+    """
+    Memory-map the sample data of a 16-bit PCM WAV file.
+
+    Returns:
+        (read-only int16 array of shape (frames, channels), sample rate),
+        or None if the file is not a plain 16-bit PCM WAV
+    """
+    if Path(path).suffix.lower() != '.wav':
+        return None
+
+    try:
+        with open(path, 'rb') as f:
+            riff, _, wave_id = struct.unpack('<4sI4s', f.read(12))
+            if riff != b'RIFF' or wave_id != b'WAVE':
+                return None
+
+            fmt = None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return None
+                chunk_id, size = struct.unpack('<4sI', header)
+                if chunk_id == b'fmt ':
+                    fmt = struct.unpack('<HHIIHH', f.read(16))
+                    f.seek(size - 16 + (size & 1), 1)
+                elif chunk_id == b'data':
+                    data_offset = f.tell()
+                    break
+                else:
+                    f.seek(size + (size & 1), 1)  # Chunks are word-aligned
+    except (OSError, struct.error):
+        return None
+
+    if fmt is None:
+        return None
+    audio_format, channels, frame_rate, _, _, bits = fmt
+    if audio_format != 1 or bits != 16 or channels == 0:
+        return None
+
+    frames = min(size, Path(path).stat().st_size - data_offset) // (2 * channels)
+    if frames == 0:
+        return np.zeros((0, channels), dtype=np.int16), frame_rate
+
+    samples = np.memmap(path, dtype='<i2', mode='r', offset=data_offset, shape=(frames, channels))
+    return samples, frame_rate
+
+
+def _pcm_buffer(frames: int, channels: int) -> Tuple[bytearray, np.ndarray]:
+    """
+    Zeroed 16-bit PCM storage and a writable (frames, channels) view of it.
+
+    Samples written through the view land in the bytearray, which
+    AudioSegment keeps as its raw data, so no .tobytes() copy is made.
+    """
+    data = bytearray(frames * channels * 2)
+    return data, np.frombuffer(data, dtype=np.int16).reshape(frames, channels)
+
+
+def _scale_q15(
+    samples: np.ndarray,
+    gains: np.ndarray,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Scale integer samples by per-channel gains in Q15 fixed point.
+
+    Computes round(x * gain) as (x * q + 2**14) >> 15 with q = round(gain * 2**15),
+    saturating to int16. Attenuation stays in int32; boosts widen to int64.
+    If out is given, the result is written into it (e.g. a mix buffer slice).
+    """
+    q15 = np.round(np.asarray(gains, dtype=np.float64) * 32768).astype(np.int64)
+    acc_dtype = np.int32 if np.abs(q15).max(initial=0) <= 32768 else np.int64
+
+    acc = samples.astype(acc_dtype) * q15.astype(acc_dtype)
+    acc += 1 << 14
+    acc >>= 15
+    np.clip(acc, -32768, 32767, out=acc)
+
+    if out is None:
+        return acc.astype(np.int16)
+    out[...] = acc
+    return out
+
+
+@lru_cache(maxsize=None)
+def _pan_gains(pan: float) -> Tuple[float, float]:
+    """
+    Linear (left, right) gains for a pan position.
+
+    The opposite channel is attenuated, reaching -40dB at full pan:
+    pan = -1.0 → full left (right muted), 0.0 → center, +1.0 → full right.
+    """
+    left_db = -max(pan, 0.0) * 40
+    right_db = min(pan, 0.0) * 40
+    return 10 ** (left_db / 20), 10 ** (right_db / 20)
+
+
+@lru_cache(maxsize=32)
+def _cached_silence(duration_ms: int, sample_rate: int, channels: int) -> AudioSegment:
+    """Silence segment; safe to share since AudioSegment operations return new objects."""
+    return AudioSegment.silent(
+        duration=duration_ms,
+        frame_rate=sample_rate
+    ).set_channels(channels)
+
+
+@lru_cache(maxsize=1)
 def detect_ffmpeg() -> Optional[Path]:
     """
-    Detect ffmpeg installation.
+    Detect ffmpeg installation (looked up once per process).
+
+    Call ``detect_ffmpeg.cache_clear()`` to look again.
 
     Returns:
         Path to ffmpeg binary, or None if not found
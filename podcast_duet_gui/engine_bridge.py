@@ -6,12 +6,37 @@ Tries import first, falls back to CLI subprocess if needed.
 
 from __future__ import annotations
 
+import json
+import logging
+import os
+import queue
+import shutil
 import subprocess
-import tempfile
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Tuple
+from dataclasses import asdict, dataclass
+
+logger = logging.getLogger(__name__)
+
+# How long a voice list from the CLI is reused across launches
+VOICE_CACHE_TTL_S = 24 * 60 * 60
+
+# Warm CLI workers running at once
+CLI_WORKER_POOL_SIZE = 4
+
+# How long a worker may take to load its engine, and to answer one utterance
+# (a base allowance plus time per character, so long lines are not cut off)
+CLI_START_TIMEOUT_S = 120
+CLI_REQUEST_TIMEOUT_S = 60
+CLI_REQUEST_TIMEOUT_PER_CHAR_S = 0.1
+
+# Prefix of reply lines from `localkoreantts --serve` (SERVE_REPLY_MARKER in cli.py)
+SERVE_REPLY_MARKER = "@localkoreantts-reply "
 
 
 @dataclass
@@ -25,6 +50,164 @@ class Voice:
         return f"{self.name} ({self.engine})"
 
 
+class _WorkerUnavailable(Exception):
+    """The warm CLI worker could not answer; use a one-shot subprocess instead."""
+
+
+class _ServeUnsupported(_WorkerUnavailable):
+    """The CLI never completed the --serve handshake; warm workers cannot be used."""
+
+
+class _CLIWorker:
+    """
+    A long-lived ``localkoreantts --serve`` process.
+
+    The engine is loaded once and reused for every utterance, instead of
+    paying interpreter start-up and model loading per line.
+    """
+
+    def __init__(self, command: List[str]):
+        self._command = command
+        self._process: Optional[subprocess.Popen] = None
+        self._replies: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
+
+    def _start(self):
+        """Launch the worker and wait for its ready reply.
+
+        A reader thread logs the worker's output and queues its replies.
+        """
+        self._process = subprocess.Popen(
+            self._command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding='utf-8',
+            bufsize=1
+        )
+        self._replies = queue.Queue()
+        threading.Thread(
+            target=_pump_worker_output,
+            args=(self._process.stdout, self._replies),
+            name="tts-worker-output",
+            daemon=True,
+        ).start()
+
+        # `--serve` answers once its engine is loaded; a CLI without it exits instead
+        try:
+            ready = json.loads(self._replies.get(timeout=CLI_START_TIMEOUT_S) or '{}').get('ready')
+        except (queue.Empty, ValueError):
+            ready = False
+        if not ready:
+            self._kill()
+            raise _ServeUnsupported("worker did not start serving")
+
+    def _kill(self):
+        """Stop a hung or broken worker; the next request starts a fresh one."""
+        process, self._process = self._process, None
+        if process is not None:
+            process.kill()
+            process.wait()
+
+    def synthesize(self, text: str, voice_name: str, output_path: Path, speed: float) -> Path:
+        request = json.dumps({
+            'text': text,
+            'voice': voice_name,
+            'output': str(output_path),
+            'speed': speed,
+        }, ensure_ascii=False)
+
+        # One request in flight at a time; replies arrive in order
+        with self._lock:
+            try:
+                if self._process is None or self._process.poll() is not None:
+                    self._start()
+                self._process.stdin.write(request + '\n')
+                self._process.stdin.flush()
+            except OSError as e:
+                raise _WorkerUnavailable(str(e))
+
+            timeout = CLI_REQUEST_TIMEOUT_S + len(text) * CLI_REQUEST_TIMEOUT_PER_CHAR_S
+            try:
+                line = self._replies.get(timeout=timeout)
+            except queue.Empty:
+                self._kill()
+                raise _WorkerUnavailable(f"no reply within {timeout:g}s")
+            if line is None:
+                self._kill()
+                raise _WorkerUnavailable("worker exited")
+
+        try:
+            reply = json.loads(line)
+        except ValueError:
+            raise _WorkerUnavailable(f"unexpected worker reply: {line!r}")
+
+        if not reply.get('ok'):
+            raise RuntimeError(f"CLI synthesis failed: {reply.get('error')}")
+        return Path(reply['output'])
+
+    def close(self):
+        """Close stdin so the worker exits, then reap it."""
+        with self._lock:
+            process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+
+
+def _pump_worker_output(stream, replies: "queue.Queue[Optional[str]]"):
+    """Queue a worker's reply lines and log everything else it prints."""
+    for line in stream:
+        if line.startswith(SERVE_REPLY_MARKER):
+            replies.put(line[len(SERVE_REPLY_MARKER):])
+        elif line.strip():
+            logger.info("TTS worker: %s", line.rstrip())
+    replies.put(None)  # End of output: the worker has exited
+
+
+class _CLIWorkerPool:
+    """
+    Up to CLI_WORKER_POOL_SIZE warm workers, started on demand.
+
+    Each worker answers one request at a time, so concurrent callers such as
+    synthesize_many each borrow their own.
+    """
+
+    def __init__(self, command: List[str], size: int = CLI_WORKER_POOL_SIZE):
+        self._command = command
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: List[_CLIWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def synthesize(self, text: str, voice_name: str, output_path: Path, speed: float) -> Path:
+        with self._slots:
+            with self._lock:
+                worker = self._idle.pop() if self._idle else _CLIWorker(self._command)
+            try:
+                return worker.synthesize(text, voice_name, output_path, speed)
+            finally:
+                with self._lock:
+                    closed = self._closed
+                    if not closed:
+                        self._idle.append(worker)
+                if closed:
+                    worker.close()
+
+    def close(self):
+        """Stop every idle worker; busy ones stop when their request finishes."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+
 class MacTTSBridge:
     """
     Bridge to MacTTS engine.
@@ -32,10 +215,17 @@ class MacTTSBridge:
     Attempts to use the library directly, falls back to CLI.
     """
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            cache_dir: Where the CLI voice list is cached
+                (defaults to a "synthesis" folder in the LocalKoreanTTS cache)
+        """
         self.use_import = False
         self.engine = None
         self._voices_cache: Optional[List[Voice]] = None
+        self._cache_dir = cache_dir
+        self._workers: Optional[_CLIWorkerPool] = None
 
         # Try to import LocalKoreanTTS
         try:
@@ -45,20 +235,44 @@ class MacTTSBridge:
             config = resolve_path_config().ensure()
             self.engine = LocalKoreanTTSEngine(path_config=config)
             self.use_import = True
+            if self._cache_dir is None:
+                self._cache_dir = config.cache_dir / 'synthesis'
             print("✓ MacTTS engine loaded via import")
         except Exception as e:
             print(f"⚠️  MacTTS import failed, will use CLI: {e}")
             self.use_import = False
+            launcher = ['localkoreantts'] if shutil.which('localkoreantts') else ['python', '-m', 'localkoreantts.cli']
+            self._workers = _CLIWorkerPool(launcher + ['--serve'])
+
+        if self._cache_dir is None:
+            self._cache_dir = Path.home() / '.cache' / 'localkoreantts' / 'synthesis'
+
+    def close(self):
+        """Stop the warm CLI workers, if any were started."""
+        workers, self._workers = self._workers, None
+        if workers is not None:
+            workers.close()
 
-    def get_voices(self) -> List[Voice]:
+    def __del__(self):
+        self.close()
+
+    def get_voices(self, refresh: bool = False) -> List[Voice]:
         """
         Get available TTS voices.
 
+        Args:
+            refresh: Re-enumerate instead of returning the cached list
+
         Returns:
             List of Voice objects
         """
+        if refresh:
+            self._voices_cache = None
+            _cached_cli_voices.cache_clear()
+            (self._cache_dir / 'voices.json').unlink(missing_ok=True)
+
         if self._voices_cache:
-            return self._voices_cache
+            return list(self._voices_cache)
 
         if self.use_import:
             voices = self._get_voices_import()
@@ -66,7 +280,7 @@ class MacTTSBridge:
             voices = self._get_voices_cli()
 
         self._voices_cache = voices
-        return voices
+        return list(voices)
 
     def _get_voices_import(self) -> List[Voice]:
         """Get voices via direct import."""
@@ -86,74 +300,23 @@ class MacTTSBridge:
         return voices
 
     def _get_voices_cli(self) -> List[Voice]:
-        """Get voices via CLI command."""
-        voices = []
+        """Get voices via CLI command, reusing the list saved by earlier launches."""
+        cache_file = self._cache_dir / 'voices.json'
+        binary_mtime = _cli_binary_mtime()
 
-        try:
-            # Try: localkoreantts --list-voices
-            result = subprocess.run(
-                ['localkoreantts', '--list-voices'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+        voices = _load_voice_cache(cache_file, binary_mtime)
+        if voices is not None:
+            return voices
 
-            if result.returncode == 0:
-                voices = self._parse_voice_list(result.stdout)
-            else:
-                # Try: python -m localkoreantts.cli --list-voices
-                result = subprocess.run(
-                    ['python', '-m', 'localkoreantts.cli', '--list-voices'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-
-                if result.returncode == 0:
-                    voices = self._parse_voice_list(result.stdout)
-
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            print(f"Error getting voices via CLI: {e}")
-
-        # Fallback: common Edge TTS Korean voices
+        voices = list(_cached_cli_voices())
         if not voices:
+            # Fallback: common Edge TTS Korean voices (never persisted)
             print("Using fallback voice list")
-            voices = self._get_fallback_voices()
-
-        return voices
-
-    def _parse_voice_list(self, output: str) -> List[Voice]:
-        """Parse output from --list-voices command."""
-        voices = []
-
-        # Look for lines like:
-        # - SunHi (edge/ko-KR)
-        # - ko-KR-SunHiNeural (edge)
-        pattern = re.compile(r'^\s*-?\s*(\S+)\s*\((\w+)[/,]?.*\)', re.MULTILINE)
-
-        for match in pattern.finditer(output):
-            name = match.group(1)
-            engine = match.group(2).lower()
-
-            voices.append(Voice(
-                name=name,
-                engine=engine,
-                language='ko'
-            ))
+            return _fallback_voices()
 
+        _save_voice_cache(cache_file, voices, binary_mtime)
         return voices
 
-    def _get_fallback_voices(self) -> List[Voice]:
-        """Return hardcoded fallback Korean voices."""
-        return [
-            Voice('SunHi', 'edge', 'ko'),
-            Voice('JiMin', 'edge', 'ko'),
-            Voice('SeoHyeon', 'edge', 'ko'),
-            Voice('InJoon', 'edge', 'ko'),
-            Voice('Hyunsu', 'edge', 'ko'),
-            Voice('GookMin', 'edge', 'ko'),
-        ]
-
     def synthesize(
         self,
         text: str,
@@ -176,10 +339,38 @@ class MacTTSBridge:
         Raises:
             RuntimeError: If synthesis fails
         """
+        # Repeated lines are served from the engine's own synthesis cache
+        output_path = Path(output_path)
         if self.use_import:
             return self._synthesize_import(text, voice_name, output_path, speed)
-        else:
-            return self._synthesize_cli(text, voice_name, output_path, speed)
+        return self._synthesize_cli(text, voice_name, output_path, speed)
+
+    def synthesize_many(
+        self,
+        items: List[Tuple[str, str, Path, float]],
+        max_workers: int = 8
+    ) -> List[Path]:
+        """
+        Synthesize several utterances concurrently.
+
+        Each call blocks on a subprocess or network request, so threads
+        overlap the latency without contending for the GIL.
+
+        Args:
+            items: (text, voice_name, output_path, speed) tuples
+            max_workers: Upper bound on concurrent synthesis calls
+
+        Returns:
+            Paths to generated audio files, in the same order as items
+
+        Raises:
+            RuntimeError: If any synthesis fails
+        """
+        if not items:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(lambda item: self.synthesize(*item), items))
 
     def _synthesize_import(
         self,
@@ -207,59 +398,158 @@ class MacTTSBridge:
         output_path: Path,
         speed: float
     ) -> Path:
-        """Synthesize via CLI subprocess."""
-
-        # Save text to temporary file
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.txt',
-            delete=False,
-            encoding='utf-8'
-        ) as f:
-            f.write(text)
-            text_file = Path(f.name)
-
-        try:
-            # Build command
-            cmd = [
-                'localkoreantts',
-                '--voice', voice_name,
-                '--output', str(output_path),
-                '--text-file', str(text_file)
-            ]
+        """Synthesize via a warm CLI worker, or a one-shot subprocess piping the text through stdin."""
+        workers = self._workers
+        if workers is not None:
+            try:
+                return workers.synthesize(text, voice_name, output_path, speed)
+            except _ServeUnsupported as e:
+                # Older CLIs without --serve land here once, then stay one-shot
+                logger.warning("Warm TTS workers unsupported, using one-shot CLI: %s", e)
+                self.close()
+            except _WorkerUnavailable as e:
+                # That worker was killed and restarts on its next request
+                logger.warning("Warm TTS worker failed, using one-shot CLI for this line: %s", e)
+
+        # Build command
+        cmd = [
+            'localkoreantts',
+            '--voice', voice_name,
+            '--output', str(output_path),
+            '--input-file', '-'
+        ]
 
-            if speed != 1.0:
-                cmd.extend(['--speed', str(speed)])
+        if speed != 1.0:
+            cmd.extend(['--speed', str(speed)])
 
+        try:
             # Execute
             result = subprocess.run(
                 cmd,
+                input=text,
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                timeout=60
+            )
+        except FileNotFoundError:
+            result = None
+
+        if result is None or result.returncode != 0:
+            # Try python -m fallback
+            cmd[0:1] = ['python', '-m', 'localkoreantts.cli']
+            result = subprocess.run(
+                cmd,
+                input=text,
                 capture_output=True,
                 text=True,
+                encoding='utf-8',
                 timeout=60
             )
 
-            if result.returncode != 0:
-                # Try python -m fallback
-                cmd[0:1] = ['python', '-m', 'localkoreantts.cli']
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
+        if result.returncode != 0:
+            raise RuntimeError(f"CLI synthesis failed: {result.stderr}")
+
+        if not output_path.exists():
+            raise RuntimeError(f"Output file not created: {output_path}")
+
+        return output_path
 
-            if result.returncode != 0:
-                raise RuntimeError(f"CLI synthesis failed: {result.stderr}")
 
-            if not output_path.exists():
-                raise RuntimeError(f"Output file not created: {output_path}")
+@lru_cache(maxsize=1)
+def _cached_cli_voices() -> Tuple[Voice, ...]:
+    """Enumerate voices through the localkoreantts CLI (empty if it is unavailable)."""
+    voices: List[Voice] = []
 
-            return output_path
+    try:
+        # Try: localkoreantts --list-voices
+        result = subprocess.run(
+            ['localkoreantts', '--list-voices'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
 
-        finally:
-            # Clean up temp file
-            text_file.unlink(missing_ok=True)
+        if result.returncode == 0:
+            voices = _parse_voice_list(result.stdout)
+        else:
+            # Try: python -m localkoreantts.cli --list-voices
+            result = subprocess.run(
+                ['python', '-m', 'localkoreantts.cli', '--list-voices'],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+
+            if result.returncode == 0:
+                voices = _parse_voice_list(result.stdout)
+
+    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        print(f"Error getting voices via CLI: {e}")
+
+    return tuple(voices)
+
+
+def _cli_binary_mtime() -> Optional[float]:
+    """Modification time of the localkoreantts launcher, if it is on PATH."""
+    binary = shutil.which('localkoreantts')
+    try:
+        return os.stat(binary).st_mtime if binary else None
+    except OSError:
+        return None
+
+
+def _load_voice_cache(cache_file: Path, binary_mtime: Optional[float]) -> Optional[List[Voice]]:
+    """Return cached voices if fresh and written for the same CLI binary."""
+    try:
+        data = json.loads(cache_file.read_text(encoding='utf-8'))
+        if data['binary_mtime'] != binary_mtime:
+            return None
+        if time.time() - data['created'] > VOICE_CACHE_TTL_S:
+            return None
+        return [Voice(**voice) for voice in data['voices']] or None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_voice_cache(cache_file: Path, voices: List[Voice], binary_mtime: Optional[float]):
+    """Persist voices for later launches (best effort)."""
+    data = {
+        'binary_mtime': binary_mtime,
+        'created': time.time(),
+        'voices': [asdict(voice) for voice in voices],
+    }
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+    except OSError as e:
+        print(f"Warning: could not cache voice list: {e}")
+
+
+# Matches lines like:
+# - SunHi (edge/ko-KR)
+# - ko-KR-SunHiNeural (edge)
+_VOICE_LINE_PATTERN = re.compile(r'^\s*-?\s*(\S+)\s*\((\w+)[/,]?.*\)', re.MULTILINE)
+
+
+def _parse_voice_list(output: str) -> List[Voice]:
+    """Parse output from --list-voices command."""
+    return [
+        Voice(name=match.group(1), engine=match.group(2).lower(), language='ko')
+        for match in _VOICE_LINE_PATTERN.finditer(output)
+    ]
+
+
+def _fallback_voices() -> List[Voice]:
+    """Return hardcoded fallback Korean voices."""
+    return [
+        Voice('SunHi', 'edge', 'ko'),
+        Voice('JiMin', 'edge', 'ko'),
+        Voice('SeoHyeon', 'edge', 'ko'),
+        Voice('InJoon', 'edge', 'ko'),
+        Voice('Hyunsu', 'edge', 'ko'),
+        Voice('GookMin', 'edge', 'ko'),
+    ]
 
 
 # Global singleton instance
@@ -8,12 +8,16 @@ Directives are NEVER synthesized as speech - only processed as audio effects.
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import FrozenSet, Iterator, List, Optional, Sequence, Tuple
 from pathlib import Path
 
+import numpy as np
 
-@dataclass
+
+@dataclass(frozen=True)
 class TimelineEvent:
     """Single event in the podcast timeline."""
     line_number: int
@@ -35,22 +39,94 @@ class TimelineEvent:
         return f"Event(L{self.line_number})"
 
 
+# TimelineArray type codes, indexed by event_type
+EVENT_TYPES = ('speech', 'silence', 'sfx')
+_EVENT_TYPE_CODES = {name: code for code, name in enumerate(EVENT_TYPES)}
+
+
+@dataclass
+class TimelineArray:
+    """
+    Column-wise (structure-of-arrays) view of a timeline.
+
+    Numeric fields are NumPy arrays so large scripts can be filtered and
+    summed without touching per-event objects; strings and paths stay in
+    plain lists. Indexing returns TimelineEvent objects.
+    """
+    line_numbers: np.ndarray  # int32
+    types: np.ndarray  # int8 codes into EVENT_TYPES
+    durations_ms: np.ndarray  # int32, -1 where unset
+    sfx_volume_db: np.ndarray  # float64
+    sfx_pan: np.ndarray  # float64
+    speakers: List[Optional[str]]
+    texts: List[Optional[str]]
+    sfx_paths: List[Optional[Path]]
+
+    @classmethod
+    def from_events(cls, events: Sequence[TimelineEvent]) -> 'TimelineArray':
+        """Build the column view from a list of events."""
+        return cls(
+            line_numbers=np.fromiter((e.line_number for e in events), np.int32, len(events)),
+            types=np.fromiter((_EVENT_TYPE_CODES[e.event_type] for e in events), np.int8, len(events)),
+            durations_ms=np.fromiter(
+                (-1 if e.duration_ms is None else e.duration_ms for e in events), np.int32, len(events)
+            ),
+            sfx_volume_db=np.fromiter((e.sfx_volume_db for e in events), np.float64, len(events)),
+            sfx_pan=np.fromiter((e.sfx_pan for e in events), np.float64, len(events)),
+            speakers=[e.speaker for e in events],
+            texts=[e.text for e in events],
+            sfx_paths=[e.sfx_path for e in events],
+        )
+
+    def __len__(self) -> int:
+        return len(self.line_numbers)
+
+    def __getitem__(self, index: int) -> TimelineEvent:
+        duration = int(self.durations_ms[index])
+        return TimelineEvent(
+            line_number=int(self.line_numbers[index]),
+            event_type=EVENT_TYPES[self.types[index]],
+            speaker=self.speakers[index],
+            text=self.texts[index],
+            duration_ms=None if duration < 0 else duration,
+            sfx_path=self.sfx_paths[index],
+            sfx_volume_db=float(self.sfx_volume_db[index]),
+            sfx_pan=float(self.sfx_pan[index]),
+        )
+
+    def __iter__(self) -> Iterator[TimelineEvent]:
+        return (self[i] for i in range(len(self)))
+
+    def indices_of(self, event_type: str) -> np.ndarray:
+        """Row indices of all events of one type (e.g. 'speech')."""
+        return np.flatnonzero(self.types == _EVENT_TYPE_CODES[event_type])
+
+    def total_silence_ms(self) -> int:
+        """Sum of all silence directive durations."""
+        return int(self.durations_ms[self.types == _EVENT_TYPE_CODES['silence']].sum())
+
+
 class ScriptParser:
     """Parse podcast scripts with speaker labels and directives."""
 
-    # Speaker label: "A: text" or "Speaker Name： text" (full-width colon supported)
-    SPEAKER_PATTERN = re.compile(
-        r'^(?P<speaker>[\w\-\s가-힣]+)\s*[:：]\s*(?P<text>.*)$'
-    )
-
-    # Directive: [key=value]
-    DIRECTIVE_PATTERN = re.compile(
-        r'^\[(?P<key>\w+)\s*=\s*(?P<value>[^\]]+)\]$'
+    # Whole-script scanner: one match per line, lastgroup names its kind.
+    # Speaker label: "A: text" or "Speaker Name： text" (full-width colon
+    # supported); directive: [key=value]. Horizontal whitespace is spelled
+    # [^\S\n] so no branch crosses a line break.
+    SCRIPT_PATTERN = re.compile(
+        r'^[^\S\n]*(?:'
+        r'(?P<skip>(?:#.*)?)'
+        r'|(?P<directive>\[(?P<key>\w+)[^\S\n]*=[^\S\n]*(?P<value>[^\]\n]+)\])'
+        r'|(?P<speech>(?P<speaker>(?:[\w\-가-힣]|[^\S\n])+)[^\S\n]*[:：][^\S\n]*(?P<text>.*?))'
+        r'|(?P<other>.*?)'
+        r')[^\S\n]*$',
+        re.MULTILINE
     )
 
     def __init__(self):
         self.events: List[TimelineEvent] = []
         self.speakers_found: set[str] = set()
+        self.warnings: List[str] = []
 
     def parse(self, script_text: str) -> List[TimelineEvent]:
         """
@@ -62,35 +138,41 @@ class ScriptParser:
         Returns:
             List of TimelineEvent objects
         """
+        events, speakers, warnings = _parse_cached(script_text)
+        self.events = list(events)
+        self.speakers_found = set(speakers)
+        self.warnings = list(warnings)
+        _print_warnings(warnings)
+        return self.events
+
+    def _parse_uncached(self, script_text: str) -> List[TimelineEvent]:
+        """Parse script text without consulting the cache."""
         self.events = []
         self.speakers_found = set()
+        self.warnings = []
 
-        lines = script_text.split('\n')
-
-        for line_num, line in enumerate(lines, start=1):
-            line = line.strip()
+        for line_num, match in enumerate(self.SCRIPT_PATTERN.finditer(script_text), start=1):
+            kind = match.lastgroup
 
             # Skip empty lines and comments
-            if not line or line.startswith('#'):
+            if kind == 'skip':
                 continue
 
-            # Try to parse as directive
-            directive_match = self.DIRECTIVE_PATTERN.match(line)
-            if directive_match:
+            if kind == 'directive':
                 event = self._parse_directive(
                     line_num,
-                    directive_match.group('key'),
-                    directive_match.group('value')
+                    match.group('key'),
+                    match.group('value')
                 )
                 if event:
                     self.events.append(event)
                 continue
 
-            # Try to parse as speaker line
-            speaker_match = self.SPEAKER_PATTERN.match(line)
-            if speaker_match:
-                speaker = speaker_match.group('speaker').strip()
-                text = speaker_match.group('text').strip()
+            if kind == 'speech':
+                # Interned: thousands of lines share a handful of speaker
+                # names, and the timeline keeps them all
+                speaker = sys.intern(match.group('speaker').strip())
+                text = match.group('text').strip()
 
                 if text:  # Only add if there's actual text
                     self.speakers_found.add(speaker)
@@ -104,10 +186,14 @@ class ScriptParser:
                 continue
 
             # Unrecognized format - log warning but continue
-            print(f"Warning: Line {line_num} unrecognized format: {line[:50]}")
+            self._warn(f"Line {line_num} unrecognized format: {match.group('other')[:50]}")
 
         return self.events
 
+    def _warn(self, message: str) -> None:
+        """Record a parse warning; parse() prints it on every call, cached or not."""
+        self.warnings.append(f"Warning: {message}")
+
     def _parse_directive(
         self,
         line_num: int,
@@ -129,7 +215,7 @@ class ScriptParser:
             return self._parse_sfx_directive(line_num, value)
 
         else:
-            print(f"Warning: Unknown directive '{key}' at line {line_num}")
+            self._warn(f"Unknown directive '{key}' at line {line_num}")
             return None
 
     def _parse_duration(self, value: str) -> int:
@@ -154,7 +240,7 @@ class ScriptParser:
         try:
             return int(value)
         except ValueError:
-            print(f"Warning: Invalid duration '{value}', defaulting to 500ms")
+            self._warn(f"Invalid duration '{value}', defaulting to 500ms")
             return 500
 
     def _parse_sfx_directive(self, line_num: int, value: str) -> TimelineEvent:
@@ -162,7 +248,7 @@ class ScriptParser:
         parts = value.split()
 
         if not parts:
-            print(f"Warning: Empty sfx directive at line {line_num}")
+            self._warn(f"Empty sfx directive at line {line_num}")
             return None
 
         sfx_path = Path(parts[0])
@@ -179,13 +265,13 @@ class ScriptParser:
                     try:
                         volume_db = float(val)
                     except ValueError:
-                        print(f"Warning: Invalid volume '{val}' at line {line_num}")
+                        self._warn(f"Invalid volume '{val}' at line {line_num}")
 
                 elif param == 'pan':
                     try:
                         pan = max(-1.0, min(1.0, float(val)))
                     except ValueError:
-                        print(f"Warning: Invalid pan '{val}' at line {line_num}")
+                        self._warn(f"Invalid pan '{val}' at line {line_num}")
 
         return TimelineEvent(
             line_number=line_num,
@@ -200,6 +286,24 @@ class ScriptParser:
         return self.speakers_found.copy()
 
 
+@lru_cache(maxsize=16)
+def _parse_cached(
+    script_text: str,
+) -> Tuple[Tuple[TimelineEvent, ...], FrozenSet[str], Tuple[str, ...]]:
+    """Parse a script once per distinct text; re-parsing unchanged text is a lookup.
+
+    Warnings are returned rather than printed so a cache hit still reports them.
+    """
+    parser = ScriptParser()
+    events = parser._parse_uncached(script_text)
+    return tuple(events), frozenset(parser.speakers_found), tuple(parser.warnings)
+
+
+def _print_warnings(warnings: Sequence[str]) -> None:
+    for warning in warnings:
+        print(warning)
+
+
 def parse_script(script_text: str) -> List[TimelineEvent]:
     """
     Convenience function to parse a script.
@@ -217,3 +321,10 @@ def parse_script(script_text: str) -> List[TimelineEvent]:
     """
     parser = ScriptParser()
     return parser.parse(script_text)
+
+
+def parse_script_array(script_text: str) -> TimelineArray:
+    """Parse a script into a column-wise TimelineArray."""
+    events, _, warnings = _parse_cached(script_text)
+    _print_warnings(warnings)
+    return TimelineArray.from_events(events)
@@ -0,0 +1,216 @@
+"""
+Tests for the audio pipeline.
+"""
+
+import wave
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+
+from .. import audio_pipeline
+from ..audio_pipeline import AudioPipeline, SpeakerSettings
+
+
+def make_segment(samples, frame_rate=24000, channels=1):
+    """Build a 16-bit AudioSegment from interleaved int16 samples."""
+    data = np.asarray(samples, dtype=np.int16)
+    return AudioSegment(data.tobytes(), frame_rate=frame_rate, sample_width=2, channels=channels)
+
+
+def to_array(audio):
+    return np.frombuffer(audio.raw_data, dtype=np.int16).reshape(-1, audio.channels)
+
+
+class TestCombineSegments:
+    """Test segment concatenation."""
+
+    def test_segments_joined_with_gaps(self):
+        """Segments are laid out in order with silent gaps between them."""
+        pipeline = AudioPipeline(sample_rate=1000, channels=2, gap_ms=3, normalize_peak_dbfs=None)
+        first = make_segment([100, 200], frame_rate=1000)
+        second = make_segment([300, 400, 500], frame_rate=1000)
+
+        combined = pipeline.combine_segments([first, second])
+
+        assert combined.frame_rate == 1000
+        assert combined.channels == 2
+        assert to_array(combined)[:, 0].tolist() == [100, 200, 0, 0, 0, 300, 400, 500]
+        assert to_array(combined)[:, 1].tolist() == [100, 200, 0, 0, 0, 300, 400, 500]
+
+    def test_speaker_settings_applied_while_mixing(self):
+        """Each speech segment gets its speaker's gain and pan in the mix."""
+        pipeline = AudioPipeline(sample_rate=1000, channels=2, gap_ms=0, normalize_peak_dbfs=None)
+        settings = {
+            "A": SpeakerSettings(voice_name="SunHi", pan=-1.0),
+            "B": SpeakerSettings(voice_name="InJoon", gain_db=-20.0),
+        }
+        segments = [make_segment([10000], frame_rate=1000) for _ in range(3)]
+
+        combined = pipeline.combine_segments(segments, settings, speakers=["A", "B", None])
+
+        assert to_array(combined).tolist() == [[10000, 100], [1000, 1000], [10000, 10000]]
+
+    def test_normalized_to_target_peak(self):
+        """The combined output peaks at the configured level."""
+        pipeline = AudioPipeline(sample_rate=1000, channels=1, gap_ms=0, normalize_peak_dbfs=-6.0)
+        combined = pipeline.combine_segments([make_segment([1000, -2000, 500], frame_rate=1000)])
+
+        assert combined.max_dBFS == pytest.approx(-6.0, abs=0.2)
+
+    def test_silence_is_not_scaled(self):
+        """All-zero audio passes through normalization unchanged."""
+        pipeline = AudioPipeline(sample_rate=1000, channels=1, gap_ms=0)
+        combined = pipeline.combine_segments([make_segment([0, 0, 0], frame_rate=1000)])
+
+        assert to_array(combined)[:, 0].tolist() == [0, 0, 0]
+
+    def test_empty_returns_silence(self):
+        """No segments yields one second of silence."""
+        pipeline = AudioPipeline()
+        combined = pipeline.combine_segments([])
+
+        assert len(combined) == 1000
+        assert combined.max == 0
+
+
+class TestApplyPan:
+    """Test stereo panning."""
+
+    def test_full_left_attenuates_right_by_40db(self):
+        """Pan -1.0 keeps the left channel and drops the right by 40 dB."""
+        pipeline = AudioPipeline(sample_rate=1000)
+        mono = make_segment([10000, -20000, 30000], frame_rate=1000)
+
+        samples = to_array(pipeline.apply_pan(mono, -1.0))
+
+        assert samples[:, 0].tolist() == [10000, -20000, 30000]
+        assert samples[:, 1].tolist() == [100, -200, 300]
+
+    def test_partial_right_attenuates_left(self):
+        """Positive pan only touches the left channel."""
+        pipeline = AudioPipeline(sample_rate=1000)
+        stereo = make_segment([10000, 10000, -10000, -10000], frame_rate=1000, channels=2)
+
+        samples = to_array(pipeline.apply_pan(stereo, 0.5))
+
+        assert samples[:, 1].tolist() == [10000, -10000]
+        assert samples[:, 0].tolist() == [1000, -1000]
+
+
+class TestSpeakerEffects:
+    """Test the fused format conversion, gain and pan."""
+
+    def test_mono_input_gets_gain_and_pan_in_stereo(self):
+        """Mono speech is upmixed with gain and pan applied together."""
+        pipeline = AudioPipeline(sample_rate=1000, channels=2)
+        settings = SpeakerSettings(voice_name="SunHi", gain_db=-20.0, pan=-1.0)
+
+        out = pipeline.apply_speaker_effects(make_segment([10000, -20000], frame_rate=1000), settings)
+
+        assert out.channels == 2
+        assert to_array(out)[:, 0].tolist() == [1000, -2000]
+        assert to_array(out)[:, 1].tolist() == [10, -20]
+
+    def test_gain_clips_instead_of_wrapping(self):
+        """Boosted samples saturate at the int16 limits."""
+        pipeline = AudioPipeline(sample_rate=1000, channels=1)
+        settings = SpeakerSettings(voice_name="SunHi", gain_db=12.0)
+
+        out = pipeline.apply_speaker_effects(make_segment([20000, -20000], frame_rate=1000), settings)
+
+        assert to_array(out)[:, 0].tolist() == [32767, -32768]
+
+    def test_gain_written_into_segment_storage(self):
+        """The scaled samples are the segment's own bytearray, matching pydub's gain."""
+        pipeline = AudioPipeline(sample_rate=1000, channels=1)
+        settings = SpeakerSettings(voice_name="SunHi", gain_db=-6.0)
+        audio = make_segment([1000, -3000, 12345], frame_rate=1000)
+
+        out = pipeline.apply_speaker_effects(audio, settings)
+
+        assert isinstance(out.raw_data, bytearray)
+        assert out.raw_data == (audio + -6.0).raw_data
+
+    def test_resamples_to_output_rate(self):
+        """Segments at another rate are converted to the output rate."""
+        pipeline = AudioPipeline(sample_rate=2000, channels=1)
+        settings = SpeakerSettings(voice_name="SunHi")
+
+        out = pipeline.apply_speaker_effects(make_segment([100] * 1000, frame_rate=1000), settings)
+
+        assert out.frame_rate == 2000
+        assert len(out) == 1000
+
+
+class TestLoadSfx:
+    """Test sound effect loading."""
+
+    @pytest.fixture
+    def sfx_path(self, tmp_path):
+        """Stereo 16-bit PCM WAV at 8 kHz."""
+        path = tmp_path / "sfx.wav"
+        samples = (np.arange(-1000, 1000, 10, dtype=np.int16) * 16).reshape(-1, 2)
+        with wave.open(str(path), "wb") as w:
+            w.setnchannels(2)
+            w.setsampwidth(2)
+            w.setframerate(8000)
+            w.writeframes(samples.tobytes())
+        return path
+
+    def test_pcm16_wav_is_memory_mapped(self, sfx_path):
+        """A 16-bit PCM WAV is read through a memory map."""
+        samples, frame_rate = audio_pipeline._map_pcm16_wav(sfx_path)
+
+        assert isinstance(samples, np.memmap)
+        assert samples.shape == (100, 2)
+        assert frame_rate == 8000
+
+    def test_mapped_load_matches_decoded_load(self, sfx_path, monkeypatch):
+        """The mapped fast path produces the same audio as decoding."""
+        pipeline = AudioPipeline(sample_rate=8000, channels=2)
+        mapped = pipeline.load_sfx(sfx_path, volume_db=-3.0, pan=0.4)
+
+        monkeypatch.setattr(audio_pipeline, "_map_pcm16_wav", lambda path: None)
+        decoded = pipeline.load_sfx(sfx_path, volume_db=-3.0, pan=0.4)
+
+        assert mapped.raw_data == decoded.raw_data
+
+
+def test_export_wav_writes_pcm(tmp_path):
+    """WAV export writes the samples unchanged with a matching header."""
+    pipeline = AudioPipeline(sample_rate=8000, channels=2)
+    audio = make_segment([1, -2, 3, -4], frame_rate=8000, channels=2)
+
+    path = pipeline.export(audio, tmp_path / "out.wav")
+
+    with wave.open(str(path), "rb") as w:
+        assert (w.getnchannels(), w.getsampwidth(), w.getframerate()) == (2, 2, 8000)
+        assert w.readframes(w.getnframes()) == audio.raw_data
+
+
+def test_create_silence_is_shared_per_duration():
+    """Repeated gaps reuse one silent segment in the output format."""
+    pipeline = AudioPipeline(sample_rate=8000, channels=2)
+
+    silence = pipeline.create_silence(400)
+
+    assert pipeline.create_silence(400) is silence
+    assert len(silence) == 400
+    assert silence.channels == 2
+    assert silence.frame_rate == 8000
+
+
+def test_detect_ffmpeg_looks_up_once(monkeypatch):
+    """Repeated availability checks reuse the first lookup."""
+    import shutil
+
+    lookups = []
+    monkeypatch.setattr(shutil, "which", lambda name: lookups.append(name) or "/usr/bin/ffmpeg")
+    audio_pipeline.detect_ffmpeg.cache_clear()
+    try:
+        assert audio_pipeline.check_ffmpeg_available()
+        assert audio_pipeline.check_ffmpeg_available()
+        assert lookups == ["ffmpeg"]
+    finally:
+        audio_pipeline.detect_ffmpeg.cache_clear()
@@ -0,0 +1,163 @@
+"""
+Tests for the MacTTS bridge CLI voice cache, warm workers and batch synthesis.
+"""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from .. import engine_bridge
+from ..engine_bridge import MacTTSBridge, Voice, _CLIWorker, _CLIWorkerPool
+
+# Stand-in for `localkoreantts --serve`: logs a line like the real engine
+# import does, sends the ready handshake, then one marked JSON reply per
+# request, reporting its pid. Each "." in the text adds 0.2 s of work.
+FAKE_SERVE = (
+    "import json, os, sys, time\n"
+    "print('Note: gTTS not available: install gtts and pydub', flush=True)\n"
+    "print('@localkoreantts-reply ' + json.dumps({'ok': True, 'ready': True}), flush=True)\n"
+    "for line in sys.stdin:\n"
+    "    request = json.loads(line)\n"
+    "    time.sleep(request['text'].count('.') * 0.2)\n"
+    "    open(request['output'], 'w').write(str(os.getpid()))\n"
+    "    reply = {'ok': bool(request['text']), 'output': request['output'], 'error': 'empty'}\n"
+    "    print('@localkoreantts-reply ' + json.dumps(reply), flush=True)\n"
+)
+
+
+def test_cli_voice_list_persists_across_bridges(tmp_path, monkeypatch):
+    """A later launch reads the CLI voice list from disk instead of spawning it."""
+    runs = []
+
+    def fake_cli_voices():
+        runs.append(1)
+        return (Voice("SunHi", "edge", "ko"), Voice("InJoon", "edge", "ko"))
+
+    monkeypatch.setattr(engine_bridge, "_cached_cli_voices", fake_cli_voices)
+
+    voices = []
+    for _ in range(2):
+        bridge = MacTTSBridge(cache_dir=tmp_path / "cache")
+        bridge.use_import = False
+        voices.append(bridge.get_voices())
+
+    assert len(runs) == 1
+    assert voices[0] == voices[1]
+    assert [v.name for v in voices[1]] == ["SunHi", "InJoon"]
+
+
+def test_cli_worker_stays_warm_across_utterances(tmp_path):
+    """Every utterance is answered by the same worker process."""
+    worker = _CLIWorker([sys.executable, "-c", FAKE_SERVE])
+    try:
+        outputs = [worker.synthesize(text, "SunHi", tmp_path / f"{i}.wav", 1.0)
+                   for i, text in enumerate(["하나", "둘"])]
+        with pytest.raises(RuntimeError):
+            worker.synthesize("", "SunHi", tmp_path / "empty.wav", 1.0)
+        pids = {path.read_text() for path in outputs}
+    finally:
+        worker.close()
+
+    assert len(pids) == 1
+
+
+def test_cli_worker_restarts_after_a_hung_request(tmp_path, monkeypatch):
+    """A worker that stops answering is killed, and the next request gets a fresh one."""
+    monkeypatch.setattr(engine_bridge, "CLI_REQUEST_TIMEOUT_S", 0.5)
+    monkeypatch.setattr(engine_bridge, "CLI_REQUEST_TIMEOUT_PER_CHAR_S", 0)
+    worker = _CLIWorker([sys.executable, "-c", FAKE_SERVE])
+    try:
+        first = worker.synthesize("하나", "SunHi", tmp_path / "first.wav", 1.0)
+        with pytest.raises(engine_bridge._WorkerUnavailable):
+            worker.synthesize("...", "SunHi", tmp_path / "slow.wav", 1.0)
+        second = worker.synthesize("둘", "SunHi", tmp_path / "second.wav", 1.0)
+    finally:
+        worker.close()
+
+    assert first.read_text() != second.read_text()
+
+
+def test_cli_without_serve_fails_the_handshake(tmp_path):
+    """A CLI that exits instead of serving is reported as unsupported."""
+    worker = _CLIWorker([sys.executable, "-c", "import sys; sys.exit('unknown option --serve')"])
+    with pytest.raises(engine_bridge._ServeUnsupported):
+        worker.synthesize("하나", "SunHi", tmp_path / "out.wav", 1.0)
+
+
+def test_bridge_keeps_warm_workers_after_one_failure(tmp_path, monkeypatch):
+    """A timed-out line falls back to one-shot alone; the pool stays in use."""
+    monkeypatch.setattr(engine_bridge, "CLI_REQUEST_TIMEOUT_S", 0.5)
+    monkeypatch.setattr(engine_bridge, "CLI_REQUEST_TIMEOUT_PER_CHAR_S", 0)
+    one_shot = []
+
+    def fake_run(cmd, input, **kwargs):
+        one_shot.append(input)
+        Path(cmd[cmd.index('--output') + 1]).write_text("one-shot")
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(engine_bridge.subprocess, "run", fake_run)
+    bridge = MacTTSBridge(cache_dir=tmp_path / "cache")
+    bridge.use_import = False
+    bridge._workers = _CLIWorkerPool([sys.executable, "-c", FAKE_SERVE], size=1)
+    try:
+        bridge.synthesize("...", "SunHi", tmp_path / "slow.wav")
+        bridge.synthesize("하나", "SunHi", tmp_path / "warm.wav")
+        assert bridge._workers is not None
+    finally:
+        bridge.close()
+
+    assert one_shot == ["..."]
+    assert (tmp_path / "warm.wav").read_text() != "one-shot"
+
+
+def test_cli_worker_pool_serves_concurrent_requests(tmp_path):
+    """Overlapping requests are answered by separate worker processes."""
+    pool = _CLIWorkerPool([sys.executable, "-c", FAKE_SERVE], size=2)
+    outputs = [tmp_path / "a.wav", tmp_path / "b.wav"]
+    try:
+        threads = [
+            threading.Thread(target=pool.synthesize, args=("느린 줄..", "SunHi", path, 1.0))
+            for path in outputs
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        pool.close()
+
+    assert len({path.read_text() for path in outputs}) == 2
+
+
+def test_synthesize_many_returns_paths_in_input_order(tmp_path):
+    """Results follow the items, not the order the workers finish in."""
+    bridge = MacTTSBridge(cache_dir=tmp_path / "cache")
+    bridge.use_import = False
+    bridge._workers = _CLIWorkerPool([sys.executable, "-c", FAKE_SERVE], size=2)
+    items = [("느린 줄..", "SunHi", tmp_path / "slow.wav", 1.0),
+             ("빠른 줄", "InJoon", tmp_path / "fast.wav", 1.0)]
+    try:
+        paths = bridge.synthesize_many(items)
+    finally:
+        bridge.close()
+
+    assert paths == [tmp_path / "slow.wav", tmp_path / "fast.wav"]
+    assert all(path.exists() for path in paths)
+
+
+def test_synthesize_many_propagates_a_failed_line(tmp_path):
+    bridge = MacTTSBridge(cache_dir=tmp_path / "cache")
+    bridge.use_import = False
+    bridge._workers = _CLIWorkerPool([sys.executable, "-c", FAKE_SERVE], size=2)
+    items = [("하나", "SunHi", tmp_path / "one.wav", 1.0),
+             ("", "SunHi", tmp_path / "empty.wav", 1.0)]
+    try:
+        with pytest.raises(RuntimeError):
+            bridge.synthesize_many(items)
+    finally:
+        bridge.close()
+
+    assert bridge.synthesize_many([]) == []
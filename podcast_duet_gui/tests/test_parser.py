@@ -7,7 +7,7 @@ Critical requirement: Directives must NEVER be synthesized as speech.
 import pytest
 from pathlib import Path
 
-from ..parser_rules import ScriptParser, TimelineEvent, parse_script
+from ..parser_rules import ScriptParser, TimelineEvent, parse_script, parse_script_array
 
 
 class TestScriptParser:
@@ -120,6 +120,12 @@ Bob-123: Second speaker.
         assert events[1].speaker == 'Bob-123'
         assert events[2].speaker == '전문가'
 
+    def test_repeated_speaker_names_are_shared(self):
+        """Every line by one speaker references the same name object."""
+        events = parse_script("진행자: 하나\n진행자: 둘\n진행자 : 셋\n")
+
+        assert events[0].speaker is events[1].speaker is events[2].speaker
+
     def test_get_speakers(self):
         """Test extracting unique speakers."""
         parser = ScriptParser()
@@ -165,6 +171,69 @@ B: After directive.
             assert '[silence' not in event.text
             assert '[sfx' not in event.text
 
+    def test_reparse_unchanged_script_returns_fresh_list(self):
+        """Re-parsing identical text hits the cache but returns a new list."""
+        script = "A: 안녕하세요.\n[silence=1s]\nB: 반갑습니다."
+        parser = ScriptParser()
+
+        first = parser.parse(script)
+        first.append(TimelineEvent(line_number=99, event_type='silence'))
+        second = parser.parse(script)
+
+        assert len(second) == 3
+        assert second is not first
+        assert parser.get_speakers() == {'A', 'B'}
+
+    def test_cached_events_are_immutable(self):
+        """Events shared through the parse cache cannot be changed by one caller."""
+        events = parse_script("A: 안녕하세요.")
+
+        with pytest.raises(AttributeError):
+            events[0].text = "changed"
+        assert parse_script("A: 안녕하세요.")[0].text == "안녕하세요."
+
+    def test_warnings_repeat_on_cached_reparse(self, capsys):
+        """An unchanged script with bad lines warns on every parse, not just the first."""
+        script = "A: 안녕하세요.\nnot a dialog line\n[volume=3]"
+        parser = ScriptParser()
+
+        parser.parse(script)
+        first = capsys.readouterr().out
+        parser.parse(script)
+        second = capsys.readouterr().out
+
+        assert "Line 2 unrecognized format" in first
+        assert "Unknown directive 'volume' at line 3" in first
+        assert second == first
+        assert len(parser.warnings) == 2
+
+
+class TestTimelineArray:
+    """Test the column-wise timeline view."""
+
+    SCRIPT = """
+A: 안녕하세요.
+[silence=1s]
+B: 반갑습니다.
+[sfx=sound.wav vol=-6 pan=0.3]
+[silence=250ms]
+"""
+
+    def test_round_trips_events(self):
+        """Indexing the array rebuilds the original events."""
+        timeline = parse_script_array(self.SCRIPT)
+
+        assert len(timeline) == 5
+        assert list(timeline) == parse_script(self.SCRIPT)
+
+    def test_column_queries(self):
+        """Type filters and sums run on the numeric columns."""
+        timeline = parse_script_array(self.SCRIPT)
+
+        assert timeline.indices_of('speech').tolist() == [0, 2]
+        assert timeline.total_silence_ms() == 1250
+        assert timeline.line_numbers.tolist() == [2, 3, 4, 5, 6]
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,234 @@
+"""
+Tests for the timeline table model.
+"""
+
+import pytest
+from PySide6.QtTest import QSignalSpy
+
+from ..parser_rules import TimelineEvent
+from ..timeline_model import SynthesisStatus, TimelineModel
+
+
+def speech(line_number, text="안녕하세요"):
+    return TimelineEvent(line_number=line_number, event_type='speech', speaker='A', text=text)
+
+
+def silence(line_number, duration_ms=500):
+    return TimelineEvent(line_number=line_number, event_type='silence', duration_ms=duration_ms)
+
+
+@pytest.fixture
+def model():
+    model = TimelineModel()
+    model.set_events([speech(1), silence(2), speech(3)])
+    return model
+
+
+class TestReplaceEvents:
+    """Test incremental updates on re-parse."""
+
+    def test_unchanged_events_keep_row_state(self, model):
+        """Re-parsing identical text neither resets the model nor clears statuses."""
+        model.set_status(0, SynthesisStatus.COMPLETE)
+        model.set_duration(0, 1200)
+        resets = QSignalSpy(model.modelReset)
+
+        model.replace_events([speech(1), silence(2), speech(3)])
+
+        assert resets.count() == 0
+        assert model.statuses[0] == SynthesisStatus.COMPLETE
+        assert model.durations_ms[0] == 1200
+
+    def test_set_events_resets_row_state(self, model):
+        """set_events starts over, even with identical events."""
+        model.set_status(0, SynthesisStatus.ERROR, "boom")
+        resets = QSignalSpy(model.modelReset)
+
+        model.set_events([speech(1), silence(2), speech(3)])
+
+        assert resets.count() == 1
+        assert model.statuses[0] == SynthesisStatus.PENDING
+        assert model.error_messages[0] is None
+
+    def test_appended_events_are_inserted(self, model):
+        """New trailing events are inserted after the existing rows."""
+        model.set_status(0, SynthesisStatus.COMPLETE)
+        inserts = QSignalSpy(model.rowsInserted)
+        resets = QSignalSpy(model.modelReset)
+
+        model.replace_events([speech(1), silence(2), speech(3), speech(4, "새 줄")])
+
+        assert resets.count() == 0
+        assert inserts.count() == 1
+        assert inserts.at(0)[1:] == [3, 3]
+        assert model.rowCount() == 4
+        assert model.statuses[0] == SynthesisStatus.COMPLETE
+        assert model.data(model.index(3, 3), 0) == "새 줄"
+
+    def test_removed_trailing_events_are_truncated(self, model):
+        """Dropping trailing events removes just those rows."""
+        removes = QSignalSpy(model.rowsRemoved)
+
+        model.replace_events([speech(1)])
+
+        assert removes.count() == 1
+        assert removes.at(0)[1:] == [1, 2]
+        assert model.rowCount() == 1
+        assert len(model.statuses) == len(model.durations_ms) == 1
+
+    def test_changed_event_resets_model(self, model):
+        """An edit before the end resets every row."""
+        model.set_status(2, SynthesisStatus.COMPLETE)
+        resets = QSignalSpy(model.modelReset)
+
+        model.replace_events([speech(1, "바뀐 줄"), silence(2), speech(3)])
+
+        assert resets.count() == 1
+        assert model.statuses[2] == SynthesisStatus.PENDING
+        assert model.data(model.index(0, 3), 0) == "바뀐 줄"
+
+
+class TestBulkUpdates:
+    """Test batched status and duration updates."""
+
+    def test_statuses_emit_one_change_over_the_span(self, model):
+        """A batch repaints every column of the rows between its first and last update."""
+        changes = QSignalSpy(model.dataChanged)
+
+        model.set_statuses_bulk([
+            (2, SynthesisStatus.COMPLETE, None),
+            (0, SynthesisStatus.ERROR, "boom"),
+        ])
+
+        assert changes.count() == 1
+        top_left, bottom_right = changes.at(0)[0], changes.at(0)[1]
+        assert (top_left.row(), top_left.column()) == (0, 0)
+        assert (bottom_right.row(), bottom_right.column()) == (2, 5)
+        assert model.statuses[0] == SynthesisStatus.ERROR
+        assert model.error_messages[0] == "boom"
+
+    def test_durations_emit_one_change_in_the_duration_column(self, model):
+        changes = QSignalSpy(model.dataChanged)
+
+        model.set_durations_bulk([(0, 900), (2, 1500)])
+
+        assert changes.count() == 1
+        top_left, bottom_right = changes.at(0)[0], changes.at(0)[1]
+        assert (top_left.row(), top_left.column()) == (0, 4)
+        assert (bottom_right.row(), bottom_right.column()) == (2, 4)
+        assert model.data(model.index(2, 4), 0) == "1500ms"
+
+    def test_out_of_range_rows_are_ignored(self, model):
+        changes = QSignalSpy(model.dataChanged)
+
+        model.set_statuses_bulk([(-1, SynthesisStatus.COMPLETE, None),
+                                 (3, SynthesisStatus.COMPLETE, None)])
+        model.set_durations_bulk([(99, 100)])
+
+        assert changes.count() == 0
+        assert model.durations_ms == [None, None, None]
+
+    def test_unexposed_rows_update_without_signals(self):
+        """Rows the view has not fetched yet are updated silently."""
+        model = TimelineModel()
+        model.set_events([speech(i) for i in range(TimelineModel.FETCH_BATCH + 10)])
+        hidden = TimelineModel.FETCH_BATCH + 5
+        changes = QSignalSpy(model.dataChanged)
+
+        model.set_statuses_bulk([(hidden, SynthesisStatus.COMPLETE, None)])
+        model.set_durations_bulk([(1, 700), (hidden, 800)])
+
+        assert changes.count() == 1
+        assert changes.at(0)[1].row() == 1
+        assert model.statuses[hidden] == SynthesisStatus.COMPLETE
+        assert model.durations_ms[hidden] == 800
+
+
+class TestStatusStorage:
+    """Test the compact status codes behind the statuses view."""
+
+    @pytest.mark.parametrize("status", list(SynthesisStatus))
+    def test_statuses_round_trip(self, model, status):
+        model.set_status(0, status)
+
+        assert model.statuses[0] is status
+        assert model.data(model.index(0, 5), 0) == status.value
+
+    def test_new_rows_start_pending_or_skipped(self, model):
+        assert model.statuses == [SynthesisStatus.PENDING, SynthesisStatus.SKIPPED,
+                                  SynthesisStatus.PENDING]
+
+    def test_status_string_is_mapped(self, model):
+        model.set_status(0, SynthesisStatus.COMPLETE.value)
+
+        assert model.statuses[0] is SynthesisStatus.COMPLETE
+
+    def test_unknown_status_is_rejected(self, model):
+        with pytest.raises(ValueError):
+            model.set_status(0, "done")
+
+        assert model.statuses[0] is SynthesisStatus.PENDING
+
+
+class TestLazyRows:
+    """Test batched row exposure through canFetchMore/fetchMore."""
+
+    BATCH = TimelineModel.FETCH_BATCH
+
+    def make_model(self, count):
+        model = TimelineModel()
+        model.set_events([speech(i) for i in range(count)])
+        return model
+
+    def test_rows_are_exposed_one_batch_at_a_time(self):
+        model = self.make_model(1200)
+        assert model.rowCount() == self.BATCH
+        assert model.canFetchMore()
+
+        model.fetchMore()
+        assert model.rowCount() == 2 * self.BATCH
+
+        model.fetchMore()
+        assert model.rowCount() == 1200
+        assert not model.canFetchMore()
+
+        model.fetchMore()
+        assert model.rowCount() == 1200
+
+    def test_append_while_fully_exposed_shows_new_rows(self):
+        model = self.make_model(10)
+        model.replace_events([speech(i) for i in range(20)])
+
+        assert model.rowCount() == 20
+        assert len(model._line_strs) == model._exposed
+
+    def test_append_while_partly_exposed_stays_hidden(self):
+        model = self.make_model(1200)
+        model.replace_events([speech(i) for i in range(1300)])
+
+        assert model.rowCount() == self.BATCH
+        assert model.canFetchMore()
+        model.fetchMore()
+        model.fetchMore()
+        assert model.rowCount() == 1300
+        assert model.data(model.index(1299, 0), 0) == "1299"
+
+    def test_truncate_below_exposed_rows(self):
+        model = self.make_model(1200)
+        model.replace_events([speech(i) for i in range(300)])
+
+        assert model.rowCount() == 300
+        assert not model.canFetchMore()
+        assert len(model._line_strs) == model._exposed == 300
+
+    def test_truncate_within_hidden_rows(self):
+        model = self.make_model(1200)
+        removes = QSignalSpy(model.rowsRemoved)
+
+        model.replace_events([speech(i) for i in range(800)])
+
+        assert removes.count() == 0
+        assert model.rowCount() == self.BATCH
+        model.fetchMore()
+        assert model.rowCount() == 800
+        assert not model.canFetchMore()
@@ -6,10 +6,11 @@ Displays parsed events with synthesis status.
 
 from __future__ import annotations
 
-from typing import List, Optional
+from array import array
+from typing import Iterable, List, Optional, Tuple
 from enum import Enum
 
-from PySide6 import QtCore
+from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt
 
 from .parser_rules import TimelineEvent
@@ -24,40 +25,169 @@ class SynthesisStatus(Enum):
     SKIPPED = "— Skipped"  # For non-speech events
 
 
+# Rows store statuses as small int codes (index into _STATUSES);
+# the enum is only used at the public API boundary
+_STATUSES = tuple(SynthesisStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_STATUS_STRINGS = tuple(status.value for status in _STATUSES)
+_PENDING = _STATUS_CODES[SynthesisStatus.PENDING]
+_SKIPPED = _STATUS_CODES[SynthesisStatus.SKIPPED]
+
+# Row background by status code, built once and shared by every cell
+_BRUSH_BY_STATUS = {
+    SynthesisStatus.ERROR: QtGui.QBrush(Qt.red),
+    SynthesisStatus.COMPLETE: QtGui.QBrush(Qt.green),
+    SynthesisStatus.SYNTHESIZING: QtGui.QBrush(Qt.yellow),
+}
+_STATUS_BRUSHES = tuple(_BRUSH_BY_STATUS.get(status) for status in _STATUSES)
+
+
 class TimelineModel(QtCore.QAbstractTableModel):
     """
     Qt model for timeline events.
 
     Columns: Line#, Type, Speaker, Text/Info, Duration, Status
+
+    All events are held, but rows are handed to the view in batches of
+    FETCH_BATCH through canFetchMore/fetchMore as it scrolls.
     """
 
+    # Rows exposed per fetchMore (and on reset)
+    FETCH_BATCH = 500
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.events: List[TimelineEvent] = []
-        self.statuses: List[SynthesisStatus] = []
+        self._exposed = 0  # Rows the view currently knows about
+
+        # Fixed display text of columns 0-3, one list per column, built once
+        # per row when it is exposed
+        self._line_strs: List[str] = []
+        self._type_strs: List[Optional[str]] = []
+        self._speaker_strs: List[str] = []
+        self._content_strs: List[Optional[str]] = []
+        self._static_columns = (self._line_strs, self._type_strs,
+                                self._speaker_strs, self._content_strs)
+
+        self._status_codes = array('B')
         self.durations_ms: List[Optional[int]] = []  # Actual durations after synthesis
         self.error_messages: List[Optional[str]] = []
 
         self.headers = ["Line", "Type", "Speaker", "Content", "Duration", "Status"]
 
+    # Preset widths (px) for the columns above; Status stretches to fill
+    COLUMN_WIDTHS = (60, 90, 100, 400, 80, 160)
+
+    @classmethod
+    def apply_view_defaults(cls, view: QtWidgets.QTableView):
+        """
+        Configure a view so it never sizes rows or columns from their contents.
+
+        Fixed sections mean Qt doesn't ask every row for its text or size
+        hint, which otherwise grows with the number of events.
+        """
+        header = view.horizontalHeader()
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        for col, width in enumerate(cls.COLUMN_WIDTHS):
+            header.resizeSection(col, width)
+        header.setStretchLastSection(True)
+
+        view.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+
     def set_events(self, events: List[TimelineEvent]):
-        """Set timeline events."""
+        """Set timeline events, resetting every row's status and duration."""
+        self._reset_events(list(events))
+
+    def replace_events(self, events: List[TimelineEvent]):
+        """
+        Replace timeline events, touching only the rows that changed.
+
+        Appends and trailing removals are applied as row inserts/removes;
+        the model is only reset when existing rows differ. Rows that are
+        kept keep their status, duration and error, so re-parsing unchanged
+        text is a no-op; use set_events to start over.
+        """
+        events = list(events)
+        old_count = len(self.events)
+        new_count = len(events)
+        common = min(old_count, new_count)
+
+        if self.events[:common] != events[:common]:
+            self._reset_events(events)
+        elif new_count > old_count:
+            self._append_rows(events[old_count:])
+            if self._exposed == old_count:
+                # View had every row: show the new ones too (up to a batch)
+                self._expose_rows(old_count + self.FETCH_BATCH)
+        elif new_count < old_count:
+            if self._exposed > new_count:
+                self.beginRemoveRows(QtCore.QModelIndex(), new_count, self._exposed - 1)
+                self._truncate_rows(new_count)
+                self.endRemoveRows()
+            else:
+                self._truncate_rows(new_count)
+
+    def _reset_events(self, events: List[TimelineEvent]):
+        """Replace all rows with a full model reset."""
         self.beginResetModel()
-        self.events = events
-        self.statuses = [
-            SynthesisStatus.PENDING if e.event_type == 'speech'
-            else SynthesisStatus.SKIPPED
-            for e in events
-        ]
-        self.durations_ms = [None] * len(events)
-        self.error_messages = [None] * len(events)
+        self._truncate_rows(0)
+        self._append_rows(events)
+        self._build_display_rows(self.FETCH_BATCH)
         self.endResetModel()
 
+    def _expose_rows(self, count: int):
+        """Insert hidden rows into the view up to count (capped at the event count)."""
+        count = min(count, len(self.events))
+        if count > self._exposed:
+            self.beginInsertRows(QtCore.QModelIndex(), self._exposed, count - 1)
+            self._build_display_rows(count)
+            self.endInsertRows()
+
+    def _build_display_rows(self, count: int):
+        """Build fixed column text for rows up to count and mark them exposed."""
+        count = min(count, len(self.events))
+        events = self.events[self._exposed:count]
+        self._line_strs.extend([str(e.line_number) for e in events])
+        self._type_strs.extend([_TYPE_LABELS.get(e.event_type) for e in events])
+        self._speaker_strs.extend([e.speaker or "—" for e in events])
+        self._content_strs.extend([_content_text(e) for e in events])
+        self._exposed = max(self._exposed, count)
+
+    def _append_rows(self, events: List[TimelineEvent]):
+        """Append per-row state for events, not yet exposed to the view."""
+        self.events.extend(events)
+        self._status_codes.extend(
+            _PENDING if e.event_type == 'speech' else _SKIPPED
+            for e in events
+        )
+        self.durations_ms.extend([None] * len(events))
+        self.error_messages.extend([None] * len(events))
+
+    def _truncate_rows(self, count: int):
+        """Drop per-row state past count, in place (caller emits the model signals)."""
+        for rows in (self.events, *self._static_columns, self._status_codes,
+                     self.durations_ms, self.error_messages):
+            del rows[count:]
+        self._exposed = min(self._exposed, count)
+
+    @property
+    def statuses(self) -> List[SynthesisStatus]:
+        """Synthesis status of every row."""
+        return [_STATUSES[code] for code in self._status_codes]
+
     def rowCount(self, parent=QtCore.QModelIndex()) -> int:
-        return len(self.events)
+        return 0 if parent.isValid() else self._exposed
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()) -> bool:
+        return not parent.isValid() and self._exposed < len(self.events)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if not parent.isValid():
+            self._expose_rows(self._exposed + self.FETCH_BATCH)
 
     def columnCount(self, parent=QtCore.QModelIndex()) -> int:
-        return len(self.headers)
+        return 0 if parent.isValid() else len(self.headers)
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int):
         if role == Qt.DisplayRole and orientation == Qt.Horizontal:
@@ -68,73 +198,93 @@ class TimelineModel(QtCore.QAbstractTableModel):
         if not index.isValid():
             return None
 
-        event = self.events[index.row()]
+        row = index.row()
         col = index.column()
 
         if role == Qt.DisplayRole:
-            if col == 0:  # Line number
-                return str(event.line_number)
-            elif col == 1:  # Type
-                if event.event_type == 'speech':
-                    return "🎤 Speech"
-                elif event.event_type == 'silence':
-                    return "🔇 Silence"
-                elif event.event_type == 'sfx':
-                    return "🔊 SFX"
-            elif col == 2:  # Speaker
-                return event.speaker or "—"
-            elif col == 3:  # Content
-                if event.event_type == 'speech':
-                    text = event.text or ""
-                    return text[:50] + "..." if len(text) > 50 else text
-                elif event.event_type == 'silence':
-                    return f"{event.duration_ms}ms"
-                elif event.event_type == 'sfx':
-                    return str(event.sfx_path.name) if event.sfx_path else "?"
+            if col < 4:  # Line, Type, Speaker, Content (precomputed)
+                return self._static_columns[col][row]
             elif col == 4:  # Duration
-                duration = self.durations_ms[index.row()]
+                duration = self.durations_ms[row]
                 if duration is not None:
                     return f"{duration}ms"
-                elif event.event_type == 'silence':
+                event = self.events[row]
+                if event.event_type == 'silence':
                     return f"{event.duration_ms}ms"
                 return "—"
             elif col == 5:  # Status
-                status = self.statuses[index.row()]
-                error = self.error_messages[index.row()]
+                status = _STATUS_STRINGS[self._status_codes[row]]
+                error = self.error_messages[row]
                 if error:
-                    return f"{status.value}: {error[:30]}"
-                return status.value
+                    return f"{status}: {error[:30]}"
+                return status
 
         elif role == Qt.BackgroundRole:
             # Color-code by status
-            status = self.statuses[index.row()]
-            if status == SynthesisStatus.ERROR:
-                return QtCore.Qt.red
-            elif status == SynthesisStatus.COMPLETE:
-                return QtCore.Qt.green
-            elif status == SynthesisStatus.SYNTHESIZING:
-                return QtCore.Qt.yellow
+            return _STATUS_BRUSHES[self._status_codes[row]]
 
         return None
 
     def set_status(self, row: int, status: SynthesisStatus, error: Optional[str] = None):
         """Update synthesis status for a row."""
-        if 0 <= row < len(self.statuses):
-            self.statuses[row] = status
-            self.error_messages[row] = error
+        self.set_statuses_bulk([(row, status, error)])
+
+    def set_statuses_bulk(
+        self,
+        updates: Iterable[Tuple[int, SynthesisStatus, Optional[str]]]
+    ):
+        """
+        Update several rows' status, then emit one dataChanged for the span.
+
+        Args:
+            updates: (row, status, error) tuples; out-of-range rows are ignored.
+                A status may also be given as its display string.
+
+        Raises:
+            ValueError: If a status is not a SynthesisStatus or its value
+        """
+        # Validate the whole batch before changing any row
+        updates = [(row, _STATUS_CODES[SynthesisStatus(status)], error)
+                   for row, status, error in updates]
+        changed = []
+        for row, code, error in updates:
+            if 0 <= row < len(self._status_codes):
+                self._status_codes[row] = code
+                self.error_messages[row] = error
+                changed.append(row)
 
-            # Emit data changed for status column
-            idx = self.index(row, 5)
-            self.dataChanged.emit(idx, idx)
+        # Status colors the whole row, so every column is repainted
+        self._emit_rows_changed(changed, 0, len(self.headers) - 1,
+                                [Qt.DisplayRole, Qt.BackgroundRole])
 
     def set_duration(self, row: int, duration_ms: int):
         """Set actual duration after synthesis."""
-        if 0 <= row < len(self.durations_ms):
-            self.durations_ms[row] = duration_ms
+        self.set_durations_bulk([(row, duration_ms)])
 
-            # Emit data changed for duration column
-            idx = self.index(row, 4)
-            self.dataChanged.emit(idx, idx)
+    def set_durations_bulk(self, updates: Iterable[Tuple[int, int]]):
+        """
+        Set several rows' actual duration, then emit one dataChanged for the span.
+
+        Args:
+            updates: (row, duration_ms) pairs; out-of-range rows are ignored
+        """
+        changed = []
+        for row, duration_ms in updates:
+            if 0 <= row < len(self.durations_ms):
+                self.durations_ms[row] = duration_ms
+                changed.append(row)
+
+        self._emit_rows_changed(changed, 4, 4, [Qt.DisplayRole])
+
+    def _emit_rows_changed(self, rows: List[int], first_col: int, last_col: int, roles: List[int]):
+        """Emit a single dataChanged covering the exposed rows among rows."""
+        rows = [row for row in rows if row < self._exposed]
+        if rows:
+            self.dataChanged.emit(
+                self.index(min(rows), first_col),
+                self.index(max(rows), last_col),
+                roles
+            )
 
     def get_event(self, row: int) -> Optional[TimelineEvent]:
         """Get event at row."""
@@ -144,9 +294,24 @@ class TimelineModel(QtCore.QAbstractTableModel):
 
     def clear(self):
         """Clear all events."""
-        self.beginResetModel()
-        self.events = []
-        self.statuses = []
-        self.durations_ms = []
-        self.error_messages = []
-        self.endResetModel()
+        self._reset_events([])
+
+
+# Type column text by event type
+_TYPE_LABELS = {
+    'speech': "🎤 Speech",
+    'silence': "🔇 Silence",
+    'sfx': "🔊 SFX",
+}
+
+
+def _content_text(event: TimelineEvent) -> Optional[str]:
+    """Display text for the Content column."""
+    if event.event_type == 'speech':
+        text = event.text or ""
+        return text[:50] + "..." if len(text) > 50 else text
+    elif event.event_type == 'silence':
+        return f"{event.duration_ms}ms"
+    elif event.event_type == 'sfx':
+        return str(event.sfx_path.name) if event.sfx_path else "?"
+    return None
@@ -4,13 +4,19 @@
 from __future__ import annotations
 
 import argparse
+import errno
+import http.client
 import os
 import shutil
 import sys
 import tempfile
+import threading
+import time
+import urllib.error
 import urllib.parse
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from localkoreantts.paths import resolve_path_config
@@ -30,6 +36,15 @@ DEFAULT_FILE_SOURCES = [
     },
 ]
 
+# Model weights are several MB; copy in large chunks
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_RETRIES = 3
+# Seconds a stalled connection may wait on a single read before it is retried
+DOWNLOAD_TIMEOUT_S = 30
+
+# Keeps progress lines from concurrent downloads intact
+_print_lock = threading.Lock()
+
 
 def download_file(url: str, destination: Path) -> None:
     parsed = urllib.parse.urlparse(url)
@@ -42,28 +57,82 @@ def download_file(url: str, destination: Path) -> None:
         shutil.copy2(local_path, destination)
         return
 
-    with urllib.request.urlopen(url) as response, destination.open("wb") as fh:
-        shutil.copyfileobj(response, fh)
+    for attempt in range(DOWNLOAD_RETRIES):
+        try:
+            with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT_S) as response, destination.open("wb") as fh:
+                shutil.copyfileobj(response, fh, length=DOWNLOAD_CHUNK_SIZE)
+            return
+        except (urllib.error.URLError, OSError, http.client.HTTPException) as exc:
+            # Client errors won't change on retry; network/server errors might
+            client_error = isinstance(exc, urllib.error.HTTPError) and exc.code < 500
+            if client_error or attempt == DOWNLOAD_RETRIES - 1:
+                raise
+            delay = 2**attempt
+            with _print_lock:
+                print(f"Download of {url} failed ({exc}); retrying in {delay}s")
+            time.sleep(delay)
 
 
 def extract_zip(archive: Path, destination: Path) -> None:
     with zipfile.ZipFile(archive) as zf:
-        zf.extractall(destination)
+        members = zf.infolist()
+    # Create parent directories up front so workers never race on makedirs;
+    # unusual names are left to zipfile's own sanitizing
+    for info in members:
+        name = Path(info.filename)
+        if not name.is_absolute() and ".." not in name.parts:
+            parent = name if info.is_dir() else name.parent
+            (destination / parent).mkdir(parents=True, exist_ok=True)
+
+    workers = min(os.cpu_count() or 1, 8, len(members)) or 1
+    batches = [members[i::workers] for i in range(workers)]
+
+    def extract_batch(batch: list[zipfile.ZipInfo]) -> None:
+        # Each worker reads through its own handle; zlib inflates without the GIL
+        with zipfile.ZipFile(archive) as zf:
+            for info in batch:
+                zf.extract(info, destination)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(extract_batch, batches))
+
+
+def _remove_existing(path: Path) -> None:
+    if path.exists():
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+
+
+def _copy_entry(entry: Path, dest: Path) -> None:
+    if entry.is_dir():
+        shutil.copytree(entry, dest)
+    else:
+        shutil.copy2(entry, dest)
 
 
 def copy_to_model_dir(source_root: Path, target_root: Path) -> None:
     target_root.mkdir(parents=True, exist_ok=True)
     for entry in source_root.iterdir():
         dest = target_root / entry.name
-        if dest.exists():
-            if dest.is_dir():
-                shutil.rmtree(dest)
-            else:
-                dest.unlink()
-        if entry.is_dir():
-            shutil.copytree(entry, dest)
-        else:
-            shutil.copy2(entry, dest)
+        _remove_existing(dest)
+        _copy_entry(entry, dest)
+
+
+def move_to_model_dir(source_root: Path, target_root: Path) -> None:
+    """Like copy_to_model_dir, but renames entries when on the same filesystem."""
+    target_root.mkdir(parents=True, exist_ok=True)
+    for entry in source_root.iterdir():
+        dest = target_root / entry.name
+        _remove_existing(dest)
+        try:
+            os.replace(entry, dest)
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+            _copy_entry(entry, dest)
+
 
 def write_license_file(target_root: Path, sources: list[str]) -> None:
     license_note = target_root / "MODEL_SOURCE.txt"
@@ -77,19 +146,26 @@ def write_license_file(target_root: Path, sources: list[str]) -> None:
 
 
 def install_default_bundle(target_dir: Path) -> None:
-    sources: list[str] = []
     target_dir.mkdir(parents=True, exist_ok=True)
-    for spec in DEFAULT_FILE_SOURCES:
-        dest = target_dir / spec["target"]
-        print(f"Downloading {spec['note']} from {spec['url']}")
-        download_file(spec["url"], dest)
-        sources.append(spec["url"])
-    write_license_file(target_dir, sources)
+
+    def fetch(spec: dict[str, str]) -> None:
+        with _print_lock:
+            print(f"Downloading {spec['note']} from {spec['url']}")
+        download_file(spec["url"], target_dir / spec["target"])
+        with _print_lock:
+            print(f"Finished {spec['target']}")
+
+    # Downloads are network-bound, so they overlap well in threads
+    with ThreadPoolExecutor(max_workers=min(8, len(DEFAULT_FILE_SOURCES))) as executor:
+        list(executor.map(fetch, DEFAULT_FILE_SOURCES))
+    write_license_file(target_dir, [spec["url"] for spec in DEFAULT_FILE_SOURCES])
 
 
 def install_from_archive(archive_url: str, target_dir: Path) -> None:
     print(f"Downloading sample model from {archive_url}")
-    with tempfile.TemporaryDirectory() as tmpdir:
+    # Extract next to the target so the files can be renamed into place
+    target_dir.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=target_dir.parent) as tmpdir:
         tmp_path = Path(tmpdir)
         archive_path = tmp_path / "model.zip"
         download_file(archive_url, archive_path)
@@ -104,8 +180,8 @@ def install_from_archive(archive_url: str, target_dir: Path) -> None:
             source_root = candidates[0]
         else:
             source_root = extract_dir
-        print(f"Copying files into {target_dir}")
-        copy_to_model_dir(source_root, target_dir)
+        print(f"Moving files into {target_dir}")
+        move_to_model_dir(source_root, target_dir)
     write_license_file(target_dir, [archive_url])
 
 
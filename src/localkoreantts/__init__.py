@@ -6,10 +6,14 @@ paths, and entry points so both the CLI and GUI can share the same core
 logic regardless of platform.
 """
 
+from typing import TYPE_CHECKING
+
 from .config import describe_environment, get_paths
-from .engine import LocalKoreanTTSEngine, VoiceProfile
 from .paths import PathConfig, resolve_path_config
 
+if TYPE_CHECKING:
+    from .engine import LocalKoreanTTSEngine, VoiceProfile
+
 __all__ = [
     "LocalKoreanTTSEngine",
     "VoiceProfile",
@@ -20,3 +24,14 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+# The engine pulls in the TTS backends, so it is only imported on first use.
+_ENGINE_EXPORTS = {"LocalKoreanTTSEngine", "VoiceProfile"}
+
+
+def __getattr__(name: str):
+    if name in _ENGINE_EXPORTS:
+        from . import engine
+
+        return getattr(engine, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
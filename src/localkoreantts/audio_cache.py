@@ -0,0 +1,99 @@
+"""On-disk cache of rendered audio files, shared by the engine and the GUI."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+import ctypes
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+
+def fetch(cached: Path, target: Path) -> bool:
+    """Copy a cached file to target and mark it recently used; False on a miss."""
+    try:
+        materialize(cached, target)
+        os.utime(cached)
+    except OSError:
+        return False
+    return True
+
+
+def store(cached: Path, data: bytes, max_files: int) -> None:
+    """Write data to cached atomically, then evict beyond max_files of its type.
+
+    Every writer uses its own temporary file, so threads storing the same
+    key at once never see each other's partial output. Raises OSError.
+    """
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    fd, partial = tempfile.mkstemp(dir=cached.parent, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(partial, cached)
+    except OSError:
+        Path(partial).unlink(missing_ok=True)
+        raise
+    evict_oldest(cached.parent, max_files, pattern=f"*{cached.suffix}")
+
+
+@lru_cache(maxsize=1)
+def _macos_clonefile():
+    """libSystem's clonefile(2), or None where it is unavailable."""
+    if sys.platform != "darwin":
+        return None
+    try:
+        clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+
+def materialize(source: Path, target: Path) -> None:
+    """Copy a cached file to target, sharing disk extents where the filesystem allows.
+
+    Uses clonefile on macOS (APFS) and copy_file_range on Linux (reflinks on
+    btrfs/XFS, in-kernel copy elsewhere), falling back to shutil.copyfile.
+    A hardlink is never used: callers rewrite output files in place.
+    """
+    clonefile = _macos_clonefile()
+    if clonefile is not None:
+        # clonefile refuses an existing destination; clone beside the target and
+        # rename over it, so a missing source never costs the user's old output
+        staging = target.with_name(f".{target.name}.{os.getpid()}-{threading.get_ident()}.clone")
+        staging.unlink(missing_ok=True)
+        if clonefile(os.fsencode(source), os.fsencode(staging), 0) == 0:
+            os.replace(staging, target)
+            return
+    elif hasattr(os, "copy_file_range"):
+        try:
+            with open(source, "rb") as src, open(target, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(source, target)
+
+
+def evict_oldest(directory: Path, max_files: int, pattern: str = "*.wav") -> None:
+    """Delete the least recently used files matching pattern beyond max_files."""
+    entries = []
+    for path in directory.glob(pattern):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    entries.sort()
+    for _, path in entries[: len(entries) - max_files]:
+        path.unlink(missing_ok=True)
@@ -10,6 +10,9 @@ import numpy as np
 
 LK_TTS_SAMPLE_RATE_ENV = "LK_TTS_SAMPLE_RATE"
 
+# Frames decoded and written per step when streaming playback
+STREAM_BLOCKSIZE = 4096
+
 try:
     import soundfile as sf
 except Exception:  # pragma: no cover - optional dependency path
@@ -32,7 +35,8 @@ class AudioPlaybackError(RuntimeError):
 
 def _load_wave(path: Path) -> Tuple[np.ndarray, int]:
     if sf is not None:
-        data, rate = sf.read(str(path), always_2d=False)
+        # soundfile scales integer PCM straight to float32 while decoding
+        data, rate = sf.read(str(path), dtype="float32", always_2d=False)
         return _coerce_to_float32(data), rate
     if scipy_wavfile is not None:
         rate, data = scipy_wavfile.read(str(path))
@@ -49,9 +53,10 @@ def _coerce_to_float32(data: np.ndarray) -> np.ndarray:
     if np.issubdtype(arr.dtype, np.integer):
         info = np.iinfo(arr.dtype)
         max_abs = max(abs(info.min), info.max)
-        if max_abs == 0:
-            return arr.astype(np.float32)
-        return (arr.astype(np.float32) / max_abs).astype(np.float32)
+        # Scale while converting: one float32 allocation, no float64 temporary
+        out = np.empty(arr.shape, dtype=np.float32)
+        np.multiply(arr, np.float32(1.0 / max_abs), out=out, casting="unsafe")
+        return out
     return arr.astype(np.float32)
 
 
@@ -94,14 +99,43 @@ def play_wav(
             "sounddevice is unavailable. Re-run with skip_play=True to bypass playback."
         )
 
-    audio, detected_rate = _load_wave(target)
-    rate = _resolve_sample_rate(samplerate, detected_rate)
+    if sf is None:
+        # No streaming reader: load the whole file and hand it to sounddevice
+        audio, detected_rate = _load_wave(target)
+        rate = _resolve_sample_rate(samplerate, detected_rate)
+        try:
+            sd.play(audio, samplerate=rate, device=device)
+            sd.wait()
+        except Exception as exc:  # pragma: no cover - depends on host audio stack
+            raise _playback_failed() from exc
+        return
 
-    try:
-        sd.play(audio, samplerate=rate, device=device)
-        sd.wait()
-    except Exception as exc:  # pragma: no cover - depends on host audio stack
-        raise AudioPlaybackError(
-            "Audio playback failed (device unavailable?). "
-            "Re-run with skip_play=True to generate files only."
-        ) from exc
+    with sf.SoundFile(str(target)) as source:
+        rate = _resolve_sample_rate(samplerate, source.samplerate)
+        try:
+            _stream_blocks(source, rate, device)
+        except Exception as exc:  # pragma: no cover - depends on host audio stack
+            raise _playback_failed() from exc
+
+
+def _stream_blocks(source, rate: int, device: Optional[str | int]) -> None:
+    """Decode and play one block at a time so memory stays O(blocksize)."""
+    with sd.OutputStream(
+        samplerate=rate,
+        channels=source.channels,
+        dtype="float32",
+        device=device,
+        blocksize=STREAM_BLOCKSIZE,
+    ) as stream:
+        for block in source.blocks(
+            blocksize=STREAM_BLOCKSIZE, dtype="float32", always_2d=True
+        ):
+            stream.write(block)
+    # Leaving the stream context stops it after queued blocks finish playing
+
+
+def _playback_failed() -> AudioPlaybackError:
+    return AudioPlaybackError(
+        "Audio playback failed (device unavailable?). "
+        "Re-run with skip_play=True to generate files only."
+    )
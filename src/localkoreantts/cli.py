@@ -7,11 +7,18 @@ examples; ARCHITECTURE.md summarizes the entry-point wiring.
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency path
+    orjson = None
 
 from . import __version__
 from .audio_io import AudioPlaybackError, play_wav
@@ -21,9 +28,12 @@ from .ffmpeg import describe_ffmpeg, detect_ffmpeg_path
 from .models import ModelNotReadyError, ensure_model_ready
 from .paths import PathConfig, resolve_path_config
 
+# Prefix of every --serve reply line, so clients can skip any other output
+SERVE_REPLY_MARKER = "@localkoreantts-reply "
+
 
-def _voice_lines(voices: Iterable[VoiceProfile]) -> List[str]:
-    return [f"{voice.name} ({voice.locale}, {voice.sample_rate} Hz)" for voice in voices]
+def _voice_lines(voices: Iterable[VoiceProfile]) -> Iterator[str]:
+    return (f"{voice.name} ({voice.locale}, {voice.sample_rate} Hz)" for voice in voices)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -32,7 +42,10 @@ def build_parser() -> argparse.ArgumentParser:
         description="Offline Korean TTS with optional GUI launcher.",
     )
     parser.add_argument("--text", help="Text to synthesize. Use --input-file for files.")
-    parser.add_argument("--input-file", help="Path to a UTF-8 text file to synthesize.")
+    parser.add_argument(
+        "--input-file",
+        help="Path to a UTF-8 text file to synthesize ('-' reads stdin).",
+    )
     parser.add_argument("--in", dest="input_alias", help="Alias for --input-file.")
     parser.add_argument("--voice", default="standard-female", help="Voice preset name.")
     parser.add_argument("--lang", default=None, help="Language/locale hint (e.g., ko-KR).")
@@ -48,6 +61,11 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--out", dest="output_alias", help="Alias for --output.")
     parser.add_argument("--list-voices", action="store_true", help="List available voices.")
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep the engine loaded and answer JSON-lines requests on stdin.",
+    )
     parser.add_argument("--play", action="store_true", help="Play result via sounddevice.")
     parser.add_argument(
         "--skip-play",
@@ -97,6 +115,16 @@ def main(argv: Optional[List[str]] = None) -> int:
     if ffmpeg_error:
         print(f"FFmpeg notice: {ffmpeg_error}", file=sys.stderr)
 
+    if args.serve:
+        return _serve(config, ffmpeg_path, lang=args.lang)
+
+    ffmpeg_probe: Optional[Future] = None
+    if args.describe and ffmpeg_path:
+        # Run `ffmpeg -version` while the engine starts up
+        probe_pool = ThreadPoolExecutor(max_workers=1)
+        ffmpeg_probe = probe_pool.submit(describe_ffmpeg, ffmpeg_path)
+        probe_pool.shutdown(wait=False)
+
     engine = LocalKoreanTTSEngine(
         path_config=config,
         ffmpeg_path=ffmpeg_path,
@@ -104,20 +132,19 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     if args.describe:
         ffmpeg_line = "ffmpeg=unset"
-        if engine.ffmpeg_path:
-            ffmpeg_line = describe_ffmpeg(engine.ffmpeg_path)
+        if ffmpeg_probe is not None:
+            ffmpeg_line = ffmpeg_probe.result()
         print(describe_environment())
         print(ffmpeg_line)
 
     if args.list_voices:
-        for line in _voice_lines(engine.voices()):
-            print(line)
+        sys.stdout.writelines(f"{line}\n" for line in _voice_lines(engine.voices()))
         return 0
 
     text = args.text
     input_file = args.input_file or args.input_alias
     if input_file:
-        text = Path(input_file).read_text(encoding="utf-8")
+        text = _read_input_text(input_file)
     if not text:
         parser.error("Either --text or --input-file must be provided.")
 
@@ -152,6 +179,62 @@ def main(argv: Optional[List[str]] = None) -> int:
     return 0
 
 
+def _serve(config: PathConfig, ffmpeg_path: Optional[str], lang: Optional[str] = None) -> int:
+    """Synthesize one request per stdin line until EOF.
+
+    Requests are JSON objects with ``text``, ``output`` and optional ``voice``
+    and ``speed``; each gets a one-line JSON reply on stdout, prefixed with
+    SERVE_REPLY_MARKER, after an initial ``{"ok": true, "ready": true}``
+    handshake. Engine chatter goes to stderr, but anything printed at import
+    time still lands on stdout, so clients must skip unmarked lines.
+    """
+    with contextlib.redirect_stdout(sys.stderr):
+        engine = LocalKoreanTTSEngine(path_config=config, ffmpeg_path=ffmpeg_path)
+    # Handshake: tells clients the engine is loaded and requests are understood
+    _serve_reply({"ok": True, "ready": True})
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            voice = engine.voice_for(request.get("voice", "standard-female"))
+            speed = float(request.get("speed", 1.0))
+            with contextlib.redirect_stdout(sys.stderr):
+                result = engine.synthesize_to_file(
+                    text=request["text"],
+                    voice_name=voice.name,
+                    output_path=Path(request["output"]),
+                    speed=speed,
+                )
+            _write_metadata(
+                output_path=result,
+                voice=voice,
+                text=request["text"],
+                lang=lang,
+                speed=speed,
+                config_path=config,
+                ffmpeg_path=engine.ffmpeg_path,
+            )
+            reply = {"ok": True, "output": str(result)}
+        except Exception as exc:  # a bad request must not stop the server
+            reply = {"ok": False, "error": str(exc)}
+        _serve_reply(reply)
+    return 0
+
+
+def _serve_reply(reply: dict) -> None:
+    sys.stdout.write(SERVE_REPLY_MARKER + json.dumps(reply, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def _read_input_text(input_file: str) -> str:
+    if input_file != "-":
+        return Path(input_file).read_text(encoding="utf-8")
+    # Decode stdin as UTF-8 regardless of the console locale (e.g. cp949 on Windows)
+    stream = getattr(sys.stdin, "buffer", None)
+    return stream.read().decode("utf-8") if stream is not None else sys.stdin.read()
+
+
 def entry_point() -> None:
     raise SystemExit(main())
 
@@ -181,7 +264,10 @@ def _write_metadata(
         "created_at": datetime.now(timezone.utc).isoformat(),
         "cli_version": __version__,
     }
-    meta_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    if orjson is not None:
+        meta_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        meta_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
     return meta_path
 
 
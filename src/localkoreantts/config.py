@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+from functools import lru_cache
+from pathlib import Path, PurePath
 import os
 import platform
 from typing import Dict, Optional
@@ -19,21 +20,37 @@ from .ffmpeg import (
 )
 
 
-def _redact_path(path: Path) -> str:
-    home = Path.home().expanduser()
-    path = Path(path).expanduser()
-    try:
-        relative = path.relative_to(home)
-        return f"~/{relative}"
-    except ValueError:
-        return str(path)
+@lru_cache(maxsize=4)
+def _home_prefix(home_env: Optional[str], userprofile_env: Optional[str]) -> str:
+    """Home directory with a trailing separator; arguments only key the cache."""
+    return os.path.join(str(Path.home().expanduser()), "")
 
 
-def _stringify_path(value: Optional[Path], redact: bool) -> Optional[str]:
+def _path_text(value: str | os.PathLike) -> str:
+    """Normalized, user-expanded string form; Path objects are used as-is."""
+    if not isinstance(value, PurePath):
+        value = Path(value)
+    text = os.fspath(value)
+    return os.path.expanduser(text) if text.startswith("~") else text
+
+
+def _redact_path(path: str | os.PathLike) -> str:
+    text = _path_text(path)
+    home = _home_prefix(os.environ.get("HOME"), os.environ.get("USERPROFILE"))
+    if text.startswith(home):
+        return f"~/{text[len(home):]}"
+    if text == home[:-1]:
+        return "~/."
+    return text
+
+
+def _stringify_path(value: Optional[str | os.PathLike], redact: bool) -> Optional[str]:
     if value is None:
         return None
     if redact:
         return _redact_path(value)
+    if isinstance(value, PurePath):
+        return os.fspath(value)
     return str(Path(value))
 
 
@@ -2,64 +2,98 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
-import math
-from array import array
-from typing import Iterable, List, Optional
-import wave
+from typing import Awaitable, Callable, Iterable, List, Optional
+import hashlib
 import os
-import sys
+import struct
+import subprocess
+import threading
 import asyncio
+import io
+import re
+import zlib
 
+import numpy as np
+
+from . import audio_cache
+from .ffmpeg import binary_search_paths, detect_ffmpeg_path, find_ffmpeg_binaries
 from .paths import PathConfig, resolve_path_config
 
-# Try importing edge-tts first (best quality for Korean)
+# Backend libraries are imported on first use; availability is checked
+# without importing them so unused backends cost nothing at startup.
 edge_tts = None
-_edge_tts_available = False
+gTTS = None
+AudioSegment = None
+TTS = None
 
-try:
-    import edge_tts as EdgeTTS
-    edge_tts = EdgeTTS
-    _edge_tts_available = True
-except ImportError:
-    pass
+# edge-tts first (best quality for Korean)
+_edge_tts_available = find_spec("edge_tts") is not None
+
+# pydub decodes MP3 without a direct ffmpeg binary and is used by dialog-tts
+_pydub_available = find_spec("pydub") is not None
 
 # Fall back to gTTS (simpler, more reliable for Korean)
-gTTS = None
-AudioSegment = None
-_gtts_available = False
-
-try:
-    from gtts import gTTS as GoogleTTS
-    from pydub import AudioSegment as AudioSegmentClass
-    import shutil
-
-    gTTS = GoogleTTS
-    AudioSegment = AudioSegmentClass
-    _gtts_available = True
-
-    # Configure pydub to find ffmpeg - CRITICAL for TTS to work!
-    # Try multiple locations in order of likelihood
-    ffmpeg_candidates = [
-        shutil.which('ffmpeg'),  # System PATH
-        '/opt/homebrew/bin/ffmpeg',  # Homebrew Apple Silicon (most common)
-        '/usr/local/bin/ffmpeg',  # Homebrew Intel
-        '/opt/local/bin/ffmpeg',  # MacPorts
-        '/usr/bin/ffmpeg',  # Linux/macOS system
-    ]
+_gtts_available = find_spec("gtts") is not None and _pydub_available
+if not _gtts_available:
+    print("Note: gTTS not available: install gtts and pydub")
+
+# Fall back to Coqui TTS if others not available
+_coqui_available = (
+    not _edge_tts_available and not _gtts_available and find_spec("TTS") is not None
+)
+
+
+def _load_edge_tts():
+    """Import edge-tts on first use."""
+    global edge_tts
+    if edge_tts is None:
+        import edge_tts as EdgeTTS
+        edge_tts = EdgeTTS
+    return edge_tts
+
+
+def _load_gtts():
+    """Import gTTS on first use."""
+    global gTTS
+    if gTTS is None:
+        from gtts import gTTS as GoogleTTS
+        gTTS = GoogleTTS
+    return gTTS
+
+
+def _load_pydub():
+    """Import pydub on first use and point it at ffmpeg."""
+    global AudioSegment
+    if AudioSegment is None:
+        from pydub import AudioSegment as AudioSegmentClass
+        AudioSegment = AudioSegmentClass
+    _configure_pydub_ffmpeg()
+    return AudioSegment
+
+
+def _load_coqui():
+    """Import Coqui TTS (pulls in torch) on first use."""
+    global TTS
+    if TTS is None:
+        from TTS.api import TTS as CoquiTTS
+        TTS = CoquiTTS
+    return TTS
 
-    # Also check if running from a bundled app
-    if getattr(sys, 'frozen', False):
-        # Running in PyInstaller bundle
-        bundle_dir = Path(sys._MEIPASS)
-        ffmpeg_candidates.insert(0, str(bundle_dir / 'ffmpeg'))
 
-    ffmpeg_found = None
-    for candidate in ffmpeg_candidates:
-        if candidate and Path(candidate).exists():
-            ffmpeg_found = candidate
-            break
+@lru_cache(maxsize=1)
+def _configure_pydub_ffmpeg() -> None:
+    """Configure pydub to find ffmpeg - CRITICAL for TTS to work!
+
+    Runs once per process, when pydub is first loaded. Engines load pydub
+    on construction whenever it is installed, so dialog-tts and macOS app
+    launches without Homebrew on PATH see the configured ffmpeg too.
+    """
+    ffmpeg_found, ffprobe_path = find_ffmpeg_binaries()
 
     if ffmpeg_found:
         # Set all possible pydub ffmpeg paths
@@ -67,8 +101,7 @@ try:
         AudioSegment.ffmpeg = ffmpeg_found
 
         # Also try to set ffprobe
-        ffprobe_path = ffmpeg_found.replace('ffmpeg', 'ffprobe')
-        if Path(ffprobe_path).exists():
+        if ffprobe_path:
             AudioSegment.ffprobe = ffprobe_path
             # Set environment variable for ffprobe (needed by dialog-tts)
             os.environ['FFPROBE_BINARY'] = ffprobe_path
@@ -76,7 +109,7 @@ try:
             print(f"✓ Configured ffprobe: {ffprobe_path}")
         else:
             print(f"✓ Configured pydub to use ffmpeg: {ffmpeg_found}")
-            print(f"⚠️  Warning: ffprobe not found at {ffprobe_path}")
+            print("⚠️  Warning: ffprobe not found")
 
         # Set environment variables as backup (for subprocess calls)
         os.environ['FFMPEG_BINARY'] = ffmpeg_found
@@ -91,9 +124,9 @@ try:
         print("⚠️  WARNING: ffmpeg NOT FOUND!")
         print("=" * 60)
         print("Checked locations:")
-        for candidate in ffmpeg_candidates:
-            if candidate:
-                print(f"  ✗ {candidate}")
+        print("  ✗ PATH")
+        for candidate in binary_search_paths("ffmpeg"):
+            print(f"  ✗ {candidate}")
         print()
         print("TTS will generate sine wave test tones instead of speech!")
         print()
@@ -102,20 +135,21 @@ try:
         print("  Linux: sudo apt install ffmpeg")
         print("=" * 60)
 
-except ImportError as e:
-    print(f"Note: gTTS not available: {e}")
 
-# Fall back to Coqui TTS if others not available
-TTS = None
-_coqui_available = False
+# Synthesized utterances kept in the cache; least recently used beyond this are evicted
+TTS_CACHE_MAX_FILES = 512
 
-if not _edge_tts_available and not _gtts_available:
-    try:
-        from TTS.api import TTS as CoquiTTS
-        TTS = CoquiTTS
-        _coqui_available = True
-    except ImportError:
-        pass
+# Most recent synthesized WAVs also kept in memory, bounded by count and size
+TTS_MEMORY_CACHE_MAX_ITEMS = 64
+TTS_MEMORY_CACHE_MAX_BYTES = 64 << 20
+
+# Sentences fetched from edge-tts ahead of the one being decoded
+EDGE_TTS_MAX_CONCURRENCY = 4
+
+# Seconds ffmpeg may take to finish decoding once all MP3 input is written
+FFMPEG_DECODE_TIMEOUT_S = 30
+
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?。…])\s+|\n+")
 
 
 @dataclass(frozen=True)
@@ -142,6 +176,16 @@ AVAILABLE_VOICES: List[VoiceProfile] = [
     VoiceProfile(name="GookMin (남성, 권위있고 전문적)", locale="ko-KR", sample_rate=24000, edge_voice="ko-KR-GookMinNeural"),
     VoiceProfile(name="BongJin (남성, 명료하고 차분함)", locale="ko-KR", sample_rate=24000, edge_voice="ko-KR-BongJinNeural"),
 ]
+_VOICE_LOOKUP = {voice.name: voice for voice in AVAILABLE_VOICES}
+_DEFAULT_VOICE = AVAILABLE_VOICES[0]
+
+
+@dataclass(frozen=True)
+class _Backend:
+    """A synthesis backend: writes speech for (text, voice, output_path, speed) or raises."""
+
+    name: str
+    synthesize: Callable[[str, VoiceProfile, Path, float], None]
 
 
 class LocalKoreanTTSEngine:
@@ -153,12 +197,24 @@ class LocalKoreanTTSEngine:
         ffmpeg_path: Optional[Path] = None,
     ) -> None:
         self.path_config = (path_config or resolve_path_config()).ensure()
-        self._voice_lookup = {voice.name: voice for voice in AVAILABLE_VOICES}
         self.ffmpeg_path = ffmpeg_path
+        # Resolved once; MP3 decoding calls this binary directly
+        ffmpeg_binary = ffmpeg_path or detect_ffmpeg_path() or find_ffmpeg_binaries()[0]
+        self._ffmpeg_binary = str(ffmpeg_binary) if ffmpeg_binary else None
+        if _pydub_available:
+            _load_pydub()  # Configures pydub's ffmpeg once per process
         self._tts_model = None
         self._use_edge_tts = _edge_tts_available
         self._use_gtts = _gtts_available
         self._use_coqui = False
+        self._cache_dir = self.path_config.cache_dir / "tts"
+        self._memory_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_cache_bytes = 0
+        self._memory_cache_lock = threading.Lock()
+        # Event loop for edge-tts requests, started on first use and reused
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
 
         # Prefer edge-tts (best quality for Korean with natural prosody)
         if self._use_edge_tts:
@@ -170,7 +226,7 @@ class LocalKoreanTTSEngine:
         elif _coqui_available:
             try:
                 print("Loading Coqui TTS model...")
-                self._tts_model = TTS(model_name="tts_models/multilingual/multi-dataset/xtts_v2", progress_bar=True)
+                self._tts_model = _load_coqui()(model_name="tts_models/multilingual/multi-dataset/xtts_v2", progress_bar=True)
                 self._use_coqui = True
                 print("Coqui TTS model loaded successfully!")
             except Exception as e:
@@ -181,6 +237,53 @@ class LocalKoreanTTSEngine:
             print("Install edge-tts with: pip install edge-tts")
             print("Or install gTTS with: pip install gtts pydub")
 
+        # Backends tried in priority order before falling back to placeholder audio
+        self._backends: List[_Backend] = []
+        if self._use_edge_tts:
+            self._backends.append(_Backend("edge-tts", self._synthesize_edge))
+        if self._use_gtts:
+            self._backends.append(_Backend("gtts", self._synthesize_gtts))
+        if self._use_coqui:
+            self._backends.append(_Backend("coqui", self._synthesize_coqui))
+
+        # First backend tried; part of the cache key so switching engines misses
+        self._backend: Optional[str] = self._backends[0].name if self._backends else None
+
+    def close(self) -> None:
+        """Stop the background event loop, if one was started."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+            thread, self._loop_thread = self._loop_thread, None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
+
+    def __del__(self):
+        if hasattr(self, "_loop_lock"):
+            self.close()
+
+    def _run_async(self, coro):
+        """Run coro on the engine's background loop and wait for its result."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="tts-event-loop", daemon=True
+                )
+                self._loop_thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def set_model_dir(self, model_dir: Path) -> None:
+        """Point the engine at another model directory, keeping loaded backends and caches."""
+        self.path_config = PathConfig(
+            model_dir=Path(model_dir),
+            cache_dir=self.path_config.cache_dir,
+        ).ensure()
+
     def voices(self) -> Iterable[VoiceProfile]:
         return list(AVAILABLE_VOICES)
 
@@ -197,112 +300,44 @@ class LocalKoreanTTSEngine:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Try edge-tts first (best quality for Korean)
-        if self._use_edge_tts:
-            try:
-                # Generate speech using Microsoft Edge TTS
-                import tempfile
-
-                # edge-tts produces MP3, save to temp first
-                with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp_file:
-                    tmp_path = tmp_file.name
-
-                # Get the edge voice for this profile
-                edge_voice = voice.edge_voice or "ko-KR-SunHiNeural"
-
-                # Calculate rate percentage from speed multiplier
-                # speed: 1.0 = 0%, 0.5 = -50%, 2.0 = +100%
-                rate_percent = int((speed - 1.0) * 100)
-                rate_percent = max(-50, min(100, rate_percent))  # Clamp to valid range
-                rate_str = f"{rate_percent:+d}%"
-
-                # Run async synthesis with rate adjustment
-                async def _synthesize():
-                    communicate = edge_tts.Communicate(text, edge_voice, rate=rate_str, volume="+0%")
-                    await communicate.save(tmp_path)
-
-                asyncio.run(_synthesize())
-
-                # Convert MP3 to WAV using pydub (requires ffmpeg)
-                try:
-                    audio = AudioSegment.from_mp3(tmp_path)
-                    audio.export(str(output_path), format='wav')
-                except Exception as conv_err:
-                    # Clean up temp file before raising
-                    os.unlink(tmp_path)
-                    raise Exception(
-                        f"MP3 to WAV conversion failed. ffmpeg is required!\n"
-                        f"Install ffmpeg:\n"
-                        f"  macOS: brew install ffmpeg\n"
-                        f"  Linux: sudo apt install ffmpeg\n"
-                        f"  Windows: Download from ffmpeg.org\n"
-                        f"Error: {conv_err}"
-                    )
-
-                # Clean up temporary MP3 file
-                os.unlink(tmp_path)
-
-                print(f"✓ Generated speech using edge-tts ({edge_voice})")
-                return output_path
-            except Exception as e:
-                print(f"✗ edge-tts synthesis failed: {e}")
-                print("→ Falling back to next available engine...")
-                # Fall through to next engine
+        # Identical requests are copied from the cache instead of re-synthesized
+        key = _synthesis_cache_key(self._backend, voice, speed, text)
+        with self._memory_cache_lock:
+            audio = self._memory_cache.get(key)
+            if audio is not None:
+                self._memory_cache.move_to_end(key)
+        if audio is not None:
+            output_path.write_bytes(audio)
+            return output_path
+
+        cached = self._cache_dir / f"{key}.wav"
+        if audio_cache.fetch(cached, output_path):
+            return output_path
+
+        backend = self._synthesize(text, voice, output_path, speed)
+        # Only the preferred backend's output is reused; fallbacks and
+        # placeholder tones are regenerated so a recovered backend takes over
+        if backend is not None and backend == self._backend:
+            self._store_in_cache(output_path, cached, key)
+        return output_path
 
-        # Try gTTS as fallback (good quality)
-        if self._use_gtts:
+    def _synthesize(
+        self,
+        text: str,
+        voice: VoiceProfile,
+        output_path: Path,
+        speed: float,
+    ) -> Optional[str]:
+        """Write speech to output_path; return the backend used (None for placeholder audio)."""
+        for backend in self._backends:
             try:
-                # Generate speech using Google TTS (produces MP3)
-                import tempfile
-                tts_obj = gTTS(text=text, lang='ko', slow=False)
-
-                # Save to temporary MP3 file first
-                with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp_file:
-                    tmp_path = tmp_file.name
-                    tts_obj.save(tmp_path)
-
-                # Convert MP3 to WAV using pydub (requires ffmpeg)
-                try:
-                    audio = AudioSegment.from_mp3(tmp_path)
-                    audio.export(str(output_path), format='wav')
-                except Exception as conv_err:
-                    # Clean up temp file before raising
-                    os.unlink(tmp_path)
-                    raise Exception(
-                        f"MP3 to WAV conversion failed. ffmpeg is required!\n"
-                        f"Install ffmpeg:\n"
-                        f"  macOS: brew install ffmpeg\n"
-                        f"  Linux: sudo apt install ffmpeg\n"
-                        f"  Windows: Download from ffmpeg.org\n"
-                        f"Error: {conv_err}"
-                    )
-
-                # Clean up temporary MP3 file
-                os.unlink(tmp_path)
-
-                print(f"✓ Generated speech using gTTS")
-                return output_path
+                backend.synthesize(text, voice, output_path, speed)
+                return backend.name
             except Exception as e:
-                print(f"✗ gTTS synthesis failed: {e}")
+                print(f"✗ {backend.name} synthesis failed: {e}")
                 print("→ Falling back to next available engine...")
                 # Fall through to next engine
 
-        # Try Coqui TTS as fallback
-        if self._use_coqui and self._tts_model is not None:
-            try:
-                # Generate speech using Coqui TTS
-                self._tts_model.tts_to_file(
-                    text=text,
-                    file_path=str(output_path),
-                    language="ko"  # Korean language
-                )
-                print(f"Generated speech using Coqui TTS")
-                return output_path
-            except Exception as e:
-                print(f"Warning: Coqui TTS synthesis failed: {e}")
-                print("Falling back to placeholder audio")
-                # Fall through to placeholder generation
-
         # Fallback to placeholder audio
         print("⚠️  WARNING: Generating placeholder audio (sine wave) - NOT real speech!")
         print("⚠️  All TTS engines failed. Please install ffmpeg:")
@@ -310,26 +345,269 @@ class LocalKoreanTTSEngine:
         print("   Linux: sudo apt install ffmpeg")
         print("   Windows: Download from ffmpeg.org")
         buffer = _text_to_wave(text, sample_rate=voice.sample_rate)
-        with wave.open(str(output_path), "wb") as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)  # 16-bit audio
-            wav_file.setframerate(voice.sample_rate)
-            wav_file.writeframes(buffer)
-
-        return output_path
+        _write_mono_pcm16_wav(output_path, buffer, voice.sample_rate)
+
+        return None
+
+    def _synthesize_edge(self, text: str, voice: VoiceProfile, output_path: Path, speed: float) -> None:
+        """Generate speech using Microsoft Edge TTS (best quality for Korean)."""
+        # Get the edge voice for this profile
+        edge_voice = voice.edge_voice or "ko-KR-SunHiNeural"
+
+        # Calculate rate percentage from speed multiplier
+        # speed: 1.0 = 0%, 0.5 = -50%, 2.0 = +100%
+        rate_percent = int((speed - 1.0) * 100)
+        rate_percent = max(-50, min(100, rate_percent))  # Clamp to valid range
+        rate_str = f"{rate_percent:+d}%"
+
+        # Longer texts are requested sentence by sentence, concurrently
+        sentences = _split_sentences(text)
+        if len(sentences) <= 1:
+            sentences = [text]
+
+        if self._ffmpeg_binary:
+            # Decode while the audio is still arriving
+            self._run_async(
+                _pipe_mp3_to_wav(
+                    _ffmpeg_decode_command(self._ffmpeg_binary, output_path, voice.sample_rate),
+                    lambda write: _fetch_edge_audio(sentences, edge_voice, rate_str, write),
+                )
+            )
+        else:
+            # Without an ffmpeg binary to pipe into, collect the MP3 in memory
+            buffer = io.BytesIO()
+
+            async def _collect(data: bytes) -> None:
+                buffer.write(data)
+
+            self._run_async(_fetch_edge_audio(sentences, edge_voice, rate_str, _collect))
+
+            # Convert MP3 to WAV using pydub (requires ffmpeg)
+            _mp3_to_wav(buffer.getvalue(), output_path, None)
+
+        print(f"✓ Generated speech using edge-tts ({edge_voice})")
+
+    def _synthesize_gtts(self, text: str, voice: VoiceProfile, output_path: Path, speed: float) -> None:
+        """Generate speech using Google TTS (produces MP3)."""
+        tts_obj = _load_gtts()(text=text, lang='ko', slow=False)
+        buffer = io.BytesIO()
+        tts_obj.write_to_fp(buffer)
+
+        # Convert MP3 to WAV, directly with ffmpeg when available
+        _mp3_to_wav(buffer.getvalue(), output_path, self._ffmpeg_binary, voice.sample_rate)
+
+        print(f"✓ Generated speech using gTTS")
+
+    def _synthesize_coqui(self, text: str, voice: VoiceProfile, output_path: Path, speed: float) -> None:
+        """Generate speech using the loaded Coqui TTS model."""
+        self._tts_model.tts_to_file(
+            text=text,
+            file_path=str(output_path),
+            language="ko"  # Korean language
+        )
+        print(f"Generated speech using Coqui TTS")
+
+    def _store_in_cache(self, source: Path, cached: Path, key: str) -> None:
+        """Keep a fresh result in memory and copy it into the cache atomically (best effort)."""
+        try:
+            audio = source.read_bytes()
+            self._remember(key, audio)
+            audio_cache.store(cached, audio, TTS_CACHE_MAX_FILES)
+        except OSError as exc:
+            print(f"Warning: could not cache synthesized audio: {exc}")
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        """Add audio to the in-memory cache, dropping least recently used entries."""
+        if len(audio) > TTS_MEMORY_CACHE_MAX_BYTES:
+            return
+        with self._memory_cache_lock:
+            previous = self._memory_cache.pop(key, None)
+            if previous is not None:
+                self._memory_cache_bytes -= len(previous)
+            self._memory_cache[key] = audio
+            self._memory_cache_bytes += len(audio)
+            while (
+                len(self._memory_cache) > TTS_MEMORY_CACHE_MAX_ITEMS
+                or self._memory_cache_bytes > TTS_MEMORY_CACHE_MAX_BYTES
+            ):
+                _, evicted = self._memory_cache.popitem(last=False)
+                self._memory_cache_bytes -= len(evicted)
 
     def voice_for(self, voice_name: str) -> VoiceProfile:
-        return self._voice_lookup.get(voice_name, AVAILABLE_VOICES[0])
+        return _VOICE_LOOKUP.get(voice_name, _DEFAULT_VOICE)
+
+
+def _synthesis_cache_key(backend: Optional[str], voice: VoiceProfile, speed: float, text: str) -> str:
+    """Stable cache key for one utterance."""
+    return hashlib.blake2b(
+        f"{backend}|{voice.name}|{voice.edge_voice}|{speed}|{text}".encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+
+
+async def _fetch_edge_audio(
+    sentences: List[str],
+    edge_voice: str,
+    rate: str,
+    write: Callable[[bytes], Awaitable[None]],
+) -> None:
+    """Stream MP3 audio for sentences into write() in order, fetching several at once.
+
+    At most EDGE_TTS_MAX_CONCURRENCY sentences are fetched or buffered ahead
+    of the one being written, so memory stays bounded for long texts.
+    """
+    queues: List[asyncio.Queue] = [asyncio.Queue() for _ in sentences]
+    # Sentence i may start once sentence i - EDGE_TTS_MAX_CONCURRENCY is written
+    may_start = [asyncio.Event() for _ in sentences]
+    for event in may_start[:EDGE_TTS_MAX_CONCURRENCY]:
+        event.set()
+
+    async def _stream(sentence: str, queue: asyncio.Queue, start: asyncio.Event) -> None:
+        try:
+            await start.wait()
+            communicate = _load_edge_tts().Communicate(sentence, edge_voice, rate=rate, volume="+0%")
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    queue.put_nowait(chunk["data"])
+        finally:
+            queue.put_nowait(None)
+
+    tasks = [
+        asyncio.ensure_future(_stream(sentence, queue, start))
+        for sentence, queue, start in zip(sentences, queues, may_start)
+    ]
+    try:
+        for index, (task, queue) in enumerate(zip(tasks, queues)):
+            while (data := await queue.get()) is not None:
+                await write(data)
+            await task  # Re-raise a failed request
+            if index + EDGE_TTS_MAX_CONCURRENCY < len(may_start):
+                may_start[index + EDGE_TTS_MAX_CONCURRENCY].set()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _ffmpeg_decode_command(ffmpeg: str, output_path: Path, sample_rate: int) -> List[str]:
+    """ffmpeg arguments decoding MP3 on stdin to a mono WAV file."""
+    return [
+        ffmpeg, "-hide_banner", "-loglevel", "error",
+        "-f", "mp3", "-i", "pipe:0",
+        "-ar", str(sample_rate), "-ac", "1",
+        "-y", str(output_path),
+    ]
+
+
+async def _pipe_mp3_to_wav(
+    command: List[str],
+    feed: Callable[[Callable[[bytes], Awaitable[None]]], Awaitable[None]],
+) -> None:
+    """Run the ffmpeg decode command while feed(write) is still producing its MP3 input."""
+    decoder = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    async def _write(data: bytes) -> None:
+        decoder.stdin.write(data)
+        await decoder.stdin.drain()
+
+    try:
+        await feed(_write)
+    except BaseException:
+        decoder.kill()
+        await decoder.wait()
+        raise
+    decoder.stdin.close()
+    try:
+        _, stderr = await asyncio.wait_for(decoder.communicate(), FFMPEG_DECODE_TIMEOUT_S)
+    except asyncio.TimeoutError as decode_err:
+        decoder.kill()
+        await decoder.wait()
+        raise Exception(
+            f"ffmpeg did not finish decoding the MP3 stream within {FFMPEG_DECODE_TIMEOUT_S:g}s"
+        ) from decode_err
+    if decoder.returncode != 0:
+        raise Exception(f"ffmpeg could not decode the MP3 stream: {stderr.decode(errors='replace').strip()}")
+
+
+def _mp3_to_wav(
+    mp3: bytes,
+    output_path: Path,
+    ffmpeg: Optional[str],
+    sample_rate: int = 24000,
+) -> None:
+    """Decode in-memory MP3 data to a WAV file, directly with ffmpeg or via pydub."""
+    try:
+        if ffmpeg:
+            subprocess.run(
+                _ffmpeg_decode_command(ffmpeg, output_path, sample_rate),
+                input=mp3,
+                capture_output=True,
+                check=True,
+                timeout=FFMPEG_DECODE_TIMEOUT_S,
+            )
+        else:
+            _load_pydub().from_file(io.BytesIO(mp3), format="mp3").export(str(output_path), format="wav")
+    except subprocess.TimeoutExpired as decode_err:
+        raise Exception(f"ffmpeg did not finish decoding the MP3 data within {decode_err.timeout:g}s") from decode_err
+    except subprocess.CalledProcessError as decode_err:
+        raise Exception(
+            f"ffmpeg could not decode the MP3 data: {decode_err.stderr.decode(errors='replace').strip()}"
+        ) from decode_err
+    except Exception as conv_err:
+        raise Exception(
+            f"MP3 to WAV conversion failed. ffmpeg is required!\n"
+            f"Install ffmpeg:\n"
+            f"  macOS: brew install ffmpeg\n"
+            f"  Linux: sudo apt install ffmpeg\n"
+            f"  Windows: Download from ffmpeg.org\n"
+            f"Error: {conv_err}"
+        ) from conv_err
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text on sentence-ending punctuation and line breaks."""
+    return [part.strip() for part in _SENTENCE_BREAK.split(text.strip()) if part.strip()]
+
+
+def _write_mono_pcm16_wav(output_path: Path, pcm: bytes, sample_rate: int) -> None:
+    """Write 16-bit mono PCM behind a prebuilt 44-byte RIFF header."""
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(pcm), b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", len(pcm),
+    )
+    with open(output_path, "wb") as wav_file:
+        wav_file.write(header)
+        wav_file.write(pcm)
+
+
+# One sine period as int16; placeholder tones index it with a fixed-point phase
+_SINE_TABLE_BITS = 12
+_SINE_TABLE = (
+    32767 * np.sin(np.linspace(0, 2 * np.pi, 1 << _SINE_TABLE_BITS, endpoint=False))
+).astype(np.int16)
+_PHASE_FRACTION_BITS = 16
+
+
+def _sine_table_lookup(cycles_per_sample: float, total_samples: int) -> np.ndarray:
+    """Table sine for n = 0..total_samples-1 using a wrapping uint32 phase accumulator."""
+    step = np.uint32(round(cycles_per_sample * (1 << (_SINE_TABLE_BITS + _PHASE_FRACTION_BITS))))
+    phases = np.arange(total_samples, dtype=np.uint32) * step  # wraps mod 2**32, a whole number of periods
+    return _SINE_TABLE[(phases >> _PHASE_FRACTION_BITS) & ((1 << _SINE_TABLE_BITS) - 1)]
 
 
 def _text_to_wave(text: str, sample_rate: int) -> bytes:
     duration = max(0.35, min(4.0, len(text) * 0.08))
     total_samples = int(sample_rate * duration)
-    base_freq = 200 + (sum(map(ord, text)) % 200)
-    samples = array("h")
-    for n in range(total_samples):
-        angle = 2 * math.pi * base_freq * (n / sample_rate)
-        amplitude = 0.25 + 0.05 * math.sin(n / 500)
-        value = int(32767 * amplitude * math.sin(angle))
-        samples.append(value)
+    base_freq = 200 + (zlib.crc32(text.encode("utf-8")) % 200)
+    carrier = _sine_table_lookup(base_freq / sample_rate, total_samples)
+    envelope = _sine_table_lookup(1 / (500 * 2 * np.pi), total_samples)
+    amplitude = np.float32(0.25) + np.float32(0.05 / 32767) * envelope
+    samples = (carrier * amplitude).astype(np.int16)
     return samples.tobytes()
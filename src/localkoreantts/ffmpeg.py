@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 import os
 import shutil
 import subprocess
-from typing import Iterable, Optional
+import sys
+from typing import Iterable, List, Optional, Tuple
 
 LK_TTS_FFMPEG_ENV = "LK_TTS_FFMPEG_BIN"
 
@@ -16,6 +18,47 @@ COMMON_MAC_PATHS = (
     "/opt/local/bin/ffmpeg",
 )
 
+# Directories probed for pydub's ffmpeg/ffprobe when they are not on PATH.
+COMMON_BINARY_DIRS = (
+    "/opt/homebrew/bin",
+    "/usr/local/bin",
+    "/opt/local/bin",
+    "/usr/bin",
+)
+
+
+def binary_search_paths(binary: str = "ffmpeg") -> List[str]:
+    """Return the fallback locations checked for ``binary``, bundle first."""
+
+    candidates = []
+    if getattr(sys, "frozen", False):
+        candidates.append(str(Path(sys._MEIPASS) / binary))
+    candidates.extend(f"{directory}/{binary}" for directory in COMMON_BINARY_DIRS)
+    return candidates
+
+
+def _scan_common_paths(binary: str) -> Optional[str]:
+    for candidate in binary_search_paths(binary):
+        if Path(candidate).exists():
+            return candidate
+    return None
+
+
+def _locate_binary(binary: str) -> Optional[str]:
+    # A PyInstaller bundle ships its own binaries, which win over PATH.
+    if getattr(sys, "frozen", False):
+        bundled = Path(sys._MEIPASS) / binary
+        if bundled.exists():
+            return str(bundled)
+    return shutil.which(binary) or _scan_common_paths(binary)
+
+
+@lru_cache(maxsize=1)
+def find_ffmpeg_binaries() -> Tuple[Optional[str], Optional[str]]:
+    """Return ``(ffmpeg, ffprobe)`` paths for pydub, probed once per process."""
+
+    return _locate_binary("ffmpeg"), _locate_binary("ffprobe")
+
 
 def _candidate_paths() -> Iterable[Path]:
     seen = set()
@@ -39,9 +82,31 @@ def _candidate_paths() -> Iterable[Path]:
         yield path
 
 
+class _ProbeMiss(Exception):
+    """Raised inside a cached probe so that a failed lookup is not remembered."""
+
+
 def detect_ffmpeg_path(explicit: Optional[str] = None) -> Optional[Path]:
-    """Return the ffmpeg binary path if available."""
+    """Return the ffmpeg binary path if available.
+
+    A found binary is remembered per ``explicit``/``PATH``/``LK_TTS_FFMPEG_BIN``
+    combination; a miss is not, so installing ffmpeg later is noticed. Call
+    ``detect_ffmpeg_path.cache_clear()`` to force a fresh lookup.
+    """
+
+    try:
+        return _detect_ffmpeg_path(
+            explicit, os.environ.get("PATH"), os.environ.get(LK_TTS_FFMPEG_ENV)
+        )
+    except _ProbeMiss:
+        return None
+
 
+@lru_cache(maxsize=8)
+def _detect_ffmpeg_path(
+    explicit: Optional[str], search_path: Optional[str], env_path: Optional[str]
+) -> Path:
+    # The environment arguments only key the cache; _candidate_paths reads them.
     if explicit:
         path = Path(explicit).expanduser()
         if path.is_file() and os.access(path, os.X_OK):
@@ -51,7 +116,10 @@ def detect_ffmpeg_path(explicit: Optional[str] = None) -> Optional[Path]:
     for path in _candidate_paths():
         if path.is_file() and os.access(path, os.X_OK):
             return path
-    return None
+    raise _ProbeMiss
+
+
+detect_ffmpeg_path.cache_clear = _detect_ffmpeg_path.cache_clear
 
 
 def find_ffmpeg(explicit: Optional[str] = None) -> Path:
@@ -66,8 +134,25 @@ def find_ffmpeg(explicit: Optional[str] = None) -> Path:
 
 
 def describe_ffmpeg(path: Path) -> str:
-    """Return the version string for diagnostics."""
+    """Return the version string for diagnostics.
+
+    Probed once per binary and modification time, so an upgraded ffmpeg is
+    described afresh; a failed probe is retried on the next call.
+    """
 
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    try:
+        return _describe_ffmpeg(Path(path), mtime_ns)
+    except _ProbeMiss:
+        return "ffmpeg=<unavailable>"
+
+
+@lru_cache(maxsize=4)
+def _describe_ffmpeg(path: Path, mtime_ns: Optional[int]) -> str:
+    # mtime_ns only keys the cache.
     try:
         result = subprocess.run(
             [str(path), "-version"],
@@ -76,8 +161,11 @@ def describe_ffmpeg(path: Path) -> str:
             text=True,
             timeout=2,
         )
-    except OSError:
-        return "ffmpeg=<unavailable>"
+    except (OSError, subprocess.TimeoutExpired):
+        raise _ProbeMiss
 
     first_line = result.stdout.splitlines()[0] if result.stdout else "ffmpeg"
     return first_line.strip()
+
+
+describe_ffmpeg.cache_clear = _describe_ffmpeg.cache_clear
@@ -8,20 +8,26 @@ from __future__ import annotations
 
 import sys
 import os
-import tempfile
+import hashlib
+import json
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional, Dict
+from typing import Callable, Optional, Dict, List, Tuple
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from .cli import _voice_lines
+from . import audio_cache
 from .engine import LocalKoreanTTSEngine
+from .ffmpeg import binary_search_paths, find_ffmpeg_binaries
 from .paths import PathConfig, resolve_path_config
 
 IS_MAC = sys.platform == "darwin"
 
+# Rendered dialogs kept in the cache; least recently used beyond this are evicted
+DIALOG_CACHE_MAX_FILES = 64
+
 
 # Background synthesis worker thread
 class SynthesisWorker(QtCore.QThread):
@@ -49,9 +55,6 @@ class SynthesisWorker(QtCore.QThread):
     def run(self):
         """Execute synthesis in background thread."""
         try:
-            self.progress.emit(10, "텍스트 준비 중...")
-            QtCore.QThread.msleep(100)
-
             self.progress.emit(30, "음성 합성 중...")
             result = self.engine.synthesize_to_file(
                 text=self.text,
@@ -60,9 +63,6 @@ class SynthesisWorker(QtCore.QThread):
                 speed=self.speed
             )
 
-            self.progress.emit(90, "파일 저장 중...")
-            QtCore.QThread.msleep(100)
-
             self.progress.emit(100, "완료!")
             self.finished.emit(result)
 
@@ -82,122 +82,107 @@ class DialogSynthesisWorker(QtCore.QThread):
         self,
         script_text: str,
         output_path: Path,
-        speaker_config: Dict,
-        audio_settings: Dict
+        speaker_map: Dict,
+        audio_settings: Dict,
+        engine_cache: Optional[Dict] = None,
+        cache_dir: Optional[Path] = None,
     ):
         super().__init__()
         self.script_text = script_text
         self.output_path = output_path
-        self.speaker_config = speaker_config
+        self.speaker_map = speaker_map
         self.audio_settings = audio_settings
+        # Shared with the window; only one dialog worker runs at a time
+        self.engine_cache = {} if engine_cache is None else engine_cache
+        self.cache_dir = cache_dir
 
     def run(self):
         """Execute dialog synthesis in background thread."""
         try:
-            # Import dialog-tts modules
-            sys.path.insert(0, str(Path(__file__).parent.parent.parent / "dialog-tts"))
-            from dialog_tts import DialogTTSEngine, SpeakerConfig, apply_speaker_name_mapping
+            # dialog-tts was imported when the dialog tab was first shown
+            _load_dialog_tts()
 
             self.progress.emit(10, "화자 설정 중...")
-
-            # Helper function to extract short voice name from full name
-            # e.g., "SunHi (여성, 밝고 친근함)" -> "SunHi"
-            def extract_voice_name(full_name: str) -> str:
-                return full_name.split(' ')[0].strip()
-
-            # Extract voice names
-            voice_a_name = extract_voice_name(self.speaker_config['voice_a'])
-            voice_b_name = extract_voice_name(self.speaker_config['voice_b'])
+            speaker_map = self.speaker_map
 
             # Debug logging
             print("=" * 60)
             print("대화 합성 설정:")
-            print(f"  화자 A: {voice_a_name} (속도: {self.speaker_config['rate_a']} WPM, 패닝: {self.speaker_config['pan_a']})")
-            print(f"  화자 B: {voice_b_name} (속도: {self.speaker_config['rate_b']} WPM, 패닝: {self.speaker_config['pan_b']})")
+            for name, config in speaker_map.items():
+                print(f"  {name}: {config.voice_name} (속도: {config.rate_wpm} WPM, 패닝: {config.pan})")
             print("=" * 60)
 
-            # Create speaker map
-            speaker_map = {}
-
-            # Speaker A
-            config_a = {
-                'voice_hint': 'ko_KR',
-                'voice_name': voice_a_name,
-                'rate_wpm': self.speaker_config['rate_a'],
-                'gain_db': 0.0,
-                'pan': self.speaker_config['pan_a'],
-                'aliases': []
-            }
-            speaker_map['A'] = SpeakerConfig(config_a, engine='edge')
-
-            # Speaker B
-            config_b = {
-                'voice_hint': 'ko_KR',
-                'voice_name': voice_b_name,
-                'rate_wpm': self.speaker_config['rate_b'],
-                'gain_db': 0.0,
-                'pan': self.speaker_config['pan_b'],
-                'aliases': []
-            }
-            speaker_map['B'] = SpeakerConfig(config_b, engine='edge')
-
-            # Apply custom names if provided
-            custom_names = []
-            if self.speaker_config.get('name_a'):
-                custom_names.append(self.speaker_config['name_a'])
-            if self.speaker_config.get('name_b'):
-                custom_names.append(self.speaker_config['name_b'])
-
-            if custom_names:
-                speaker_map = apply_speaker_name_mapping(speaker_map, custom_names)
-
             self.progress.emit(25, "TTS 엔진 초기화 중...")
 
-            # Initialize engine
-            engine = DialogTTSEngine(
-                engine='edge',
-                sample_rate=self.audio_settings['sample_rate'],
-                stereo=self.audio_settings['stereo']
-            )
-
-            self.progress.emit(35, "스크립트 준비 중...")
-
-            # Save script to temp file
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.txt',
-                delete=False,
-                encoding='utf-8'
-            ) as f:
-                f.write(self.script_text)
-                script_path = Path(f.name)
-
-            try:
-                self.progress.emit(40, "대화 합성 중... (시간이 걸릴 수 있습니다)")
-
-                # Synthesize
-                engine.synthesize_dialog(
-                    script_path=script_path,
-                    speaker_map=speaker_map,
-                    output_path=self.output_path,
-                    gap_ms=self.audio_settings['gap_ms'],
-                    xfade_ms=20,
-                    breath_ms=80,
-                    normalize_dbfs=-1.0
+            # Initialize engine (reused across generations with the same format)
+            key = (self.audio_settings['sample_rate'], self.audio_settings['stereo'])
+            engine = self.engine_cache.get(key)
+            if engine is None:
+                engine = DialogTTSEngine(
+                    engine='edge',
+                    sample_rate=key[0],
+                    stereo=key[1]
                 )
+                self.engine_cache[key] = engine
 
-                self.progress.emit(95, "파일 저장 중...")
-                QtCore.QThread.msleep(100)
-
-                self.progress.emit(100, "완료!")
+            # Identical requests are copied from the cache instead of re-synthesized
+            cached = self._cached_path(engine)
+            if cached is not None and audio_cache.fetch(cached, self.output_path):
+                self.progress.emit(100, "캐시에서 불러왔습니다")
                 self.finished.emit(self.output_path)
+                return
 
-            finally:
-                script_path.unlink(missing_ok=True)
+            self.progress.emit(40, "대화 합성 중... (시간이 걸릴 수 있습니다)")
+
+            # Synthesize
+            engine.synthesize_dialog_text(
+                script=self.script_text,
+                speaker_map=speaker_map,
+                output_path=self.output_path,
+                gap_ms=self.audio_settings['gap_ms'],
+                xfade_ms=20,
+                breath_ms=80,
+                normalize_dbfs=-1.0
+            )
+            # Only edge-tts renders are reused; a fallback backend's output is
+            # regenerated so edge-tts takes over once it is available again
+            if cached is not None and engine.backend_name == 'edge':
+                try:
+                    audio_cache.store(cached, self.output_path.read_bytes(), DIALOG_CACHE_MAX_FILES)
+                except OSError as exc:
+                    print(f"Warning: could not cache dialog audio: {exc}")
+
+            self.progress.emit(100, "완료!")
+            self.finished.emit(self.output_path)
 
         except Exception as e:
             self.error.emit(str(e))
 
+    def _cached_path(self, engine) -> Optional[Path]:
+        """Cache file for this request and backend, if caching is enabled.
+
+        Referenced SFX files are keyed by size and mtime, so editing one
+        invalidates the render.
+        """
+        if self.cache_dir is None:
+            return None
+        speakers = {name: config.config for name, config in self.speaker_map.items()}
+        sfx_files = []
+        for path in engine.sfx_paths(self.script_text):
+            try:
+                stat = path.stat()
+                sfx_files.append([str(path), stat.st_size, stat.st_mtime_ns])
+            except OSError:
+                sfx_files.append([str(path), None, None])
+        payload = json.dumps(
+            [self.script_text, speakers, self.audio_settings, engine.backend_name, sfx_files],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        key = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}{self.output_path.suffix.lower()}"
+
 # Modern UI stylesheet
 MODERN_STYLESHEET = """
 QMainWindow {
@@ -911,16 +896,12 @@ def _is_dark_mode() -> bool:
     return False
 
 
-# Import dialog-tts modules if available
+# dialog-tts is located at import time but imported the first time its tab opens
 _DIALOG_TTS_AVAILABLE = False
 DialogTTSEngine = None
 SpeakerConfig = None
 apply_speaker_name_mapping = None
 
-print("=" * 60)
-print("Loading Dialog-TTS features...")
-print("=" * 60)
-
 def _candidate_dialog_tts_dirs() -> list[Path]:
     """Return possible locations for the dialog-tts repo."""
     base_dir = Path(__file__).resolve().parent.parent.parent
@@ -947,62 +928,66 @@ def _candidate_dialog_tts_dirs() -> list[Path]:
     return unique_candidates
 
 
-try:
+def _find_dialog_tts_dir() -> Optional[Path]:
+    """Return the dialog-tts directory containing dialog_tts.py, if any."""
     candidates = _candidate_dialog_tts_dirs()
-    dialog_tts_dir = None
     for candidate in candidates:
-        print(f"Checking dialog-tts directory: {candidate}")
-        if candidate.exists():
-            dialog_tts_dir = candidate
-            break
-
-    if dialog_tts_dir is None:
-        expected = candidates[0]
-        print("✗ dialog-tts directory not found!")
-        print(f"  Expected: {expected}")
-        print("  Create it or clone the dialog-tts repository")
-    else:
-        print("✓ dialog-tts directory found")
-        dialog_tts_py = dialog_tts_dir / "dialog_tts.py"
-        if not dialog_tts_py.exists():
-            print(f"✗ dialog_tts.py not found: {dialog_tts_py}")
-        else:
-            print("✓ dialog_tts.py found")
-            sys.path.insert(0, str(dialog_tts_dir))
-            print("✓ Added to sys.path")
-
-            print("Importing DialogTTSEngine...")
-            from dialog_tts import DialogTTSEngine as DTTSEngine
-            print("Importing SpeakerConfig...")
-            from dialog_tts import SpeakerConfig as SConfig
-            print("Importing apply_speaker_name_mapping...")
-            from dialog_tts import apply_speaker_name_mapping as apply_mapping
-
-            DialogTTSEngine = DTTSEngine
-            SpeakerConfig = SConfig
-            apply_speaker_name_mapping = apply_mapping
-            _DIALOG_TTS_AVAILABLE = True
+        if (candidate / "dialog_tts.py").exists():
+            return candidate
+    print("✗ dialog-tts directory not found!")
+    print(f"  Expected: {candidates[0]}")
+    print("  Create it or clone the dialog-tts repository")
+    return None
 
-            print("=" * 60)
-            print("✓ Dialog-TTS features loaded successfully!")
-            print("  대화 형식 탭이 활성화됩니다")
-            print("=" * 60)
 
-except Exception as e:
-    print("=" * 60)
-    print("✗ Dialog-TTS features not available")
-    print("=" * 60)
-    print(f"Error: {e}")
-    print(f"Error type: {type(e).__name__}")
+_DIALOG_TTS_DIR = _find_dialog_tts_dir()
+_DIALOG_TTS_AVAILABLE = _DIALOG_TTS_DIR is not None
+_dialog_tts_loaded = False
 
-    # Show traceback for debugging
-    import traceback
-    print("\nFull error traceback:")
-    traceback.print_exc()
 
-    print("\n대화 형식 탭은 표시되지 않습니다.")
-    print("혼자 말하기 모드만 사용 가능합니다.")
+def _load_dialog_tts() -> bool:
+    """Import dialog-tts on first use; return whether its features are usable."""
+    global DialogTTSEngine, SpeakerConfig, apply_speaker_name_mapping
+    global _DIALOG_TTS_AVAILABLE, _dialog_tts_loaded
+    if _dialog_tts_loaded or not _DIALOG_TTS_AVAILABLE:
+        return _DIALOG_TTS_AVAILABLE
+
+    print("=" * 60)
+    print("Loading Dialog-TTS features...")
     print("=" * 60)
+    try:
+        if str(_DIALOG_TTS_DIR) not in sys.path:
+            sys.path.insert(0, str(_DIALOG_TTS_DIR))
+            print(f"✓ Added {_DIALOG_TTS_DIR} to sys.path")
+
+        from dialog_tts import DialogTTSEngine as DTTSEngine
+        from dialog_tts import SpeakerConfig as SConfig
+        from dialog_tts import apply_speaker_name_mapping as apply_mapping
+
+        DialogTTSEngine = DTTSEngine
+        SpeakerConfig = SConfig
+        apply_speaker_name_mapping = apply_mapping
+        _dialog_tts_loaded = True
+
+        print("✓ Dialog-TTS features loaded successfully!")
+        print("  대화 형식 탭이 활성화됩니다")
+        print("=" * 60)
+    except Exception as e:
+        _DIALOG_TTS_AVAILABLE = False
+        print("✗ Dialog-TTS features not available")
+        print("=" * 60)
+        print(f"Error: {e}")
+        print(f"Error type: {type(e).__name__}")
+
+        # Show traceback for debugging
+        import traceback
+        print("\nFull error traceback:")
+        traceback.print_exc()
+
+        print("\n대화 형식 탭은 표시되지 않습니다.")
+        print("혼자 말하기 모드만 사용 가능합니다.")
+        print("=" * 60)
+    return _DIALOG_TTS_AVAILABLE
 
 
 class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
@@ -1027,6 +1012,8 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
         self._engine_factory = engine_factory or LocalKoreanTTSEngine
         self._config = (path_config or resolve_path_config()).ensure()
         self._engine = self._build_engine()
+        # Voice names shared by the solo and dialog tabs' combo boxes
+        self._voice_names = [voice.name for voice in self._engine.voices()]
 
         # Track last generated file for playback
         self._last_output_file: Optional[Path] = None
@@ -1043,13 +1030,36 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
         # Worker threads
         self._synthesis_worker: Optional[SynthesisWorker] = None
         self._dialog_worker: Optional[DialogSynthesisWorker] = None
+        self._speaker_map: Dict = {}
+        # Dialog engines keyed by (sample_rate, stereo), built once by the worker
+        self._dialog_engines: Dict[Tuple[int, bool], object] = {}
+        self._mapped_speaker_names: tuple[str, str] = ("", "")
+
+        # Input-derived UI state is refreshed once typing pauses, not per keystroke
+        self._enable_timer = QtCore.QTimer(self)
+        self._enable_timer.setSingleShot(True)
+        self._enable_timer.setInterval(150)
+        self._enable_timer.timeout.connect(self._update_generate_enabled)
+        self._enable_timer.timeout.connect(self._update_char_count)
+
+        # Log lines are queued and appended in one batch per flush
+        self._log_queue: List[str] = []
+        self._dialog_log_queue: List[str] = []
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
 
         self._tabs = QtWidgets.QTabWidget()
         self._tabs.addTab(self._build_synthesis_tab(), "🎤 혼자 말하기")
 
-        # Log dialog-tts availability
+        # The dialog tab is a placeholder until first shown, when dialog-tts is imported
+        self._dialog_tab_index = -1
         if _DIALOG_TTS_AVAILABLE:
-            self._tabs.addTab(self._build_dialog_tab(), "💬 대화 형식")
+            placeholder = QtWidgets.QLabel("대화 형식 기능을 불러오는 중...")
+            placeholder.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+            self._dialog_tab_index = self._tabs.addTab(placeholder, "💬 대화 형식")
+            self._tabs.currentChanged.connect(self._ensure_dialog_tab)
             print("✓ 대화 형식 탭이 추가되었습니다")
         else:
             print("✗ 대화 형식 탭을 사용할 수 없습니다 (dialog-tts import 실패)")
@@ -1067,6 +1077,26 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
             self._append_log("⚠️  대화 형식 기능 사용 불가 - python diagnose.py 실행")
         self._notify_ffmpeg_missing()
 
+    def _ensure_dialog_tab(self, index: int) -> None:
+        """Swap the dialog placeholder for the real tab the first time it is shown."""
+        if index != self._dialog_tab_index:
+            return
+        self._tabs.currentChanged.disconnect(self._ensure_dialog_tab)
+        self._dialog_tab_index = -1
+        if not _load_dialog_tts():
+            self._tabs.widget(index).setText(
+                "대화 형식 기능을 사용할 수 없습니다.\n진단: python diagnose.py 실행"
+            )
+            self._append_log("⚠️  대화 형식 기능 사용 불가 - python diagnose.py 실행")
+            return
+        placeholder = self._tabs.widget(index)
+        self._tabs.blockSignals(True)
+        self._tabs.removeTab(index)
+        self._tabs.insertTab(index, self._build_dialog_tab(), "💬 대화 형식")
+        self._tabs.setCurrentIndex(index)
+        self._tabs.blockSignals(False)
+        placeholder.deleteLater()
+
     def _build_engine(self) -> LocalKoreanTTSEngine:
         try:
             return self._engine_factory(path_config=self._config)
@@ -1094,8 +1124,7 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
         self.text_edit = QtWidgets.QTextEdit()
         self.text_edit.setPlaceholderText("여기에 합성할 텍스트를 입력하세요...")
         self.text_edit.setMinimumHeight(200)  # 더 크게 늘림
-        self.text_edit.textChanged.connect(self._update_generate_enabled)
-        self.text_edit.textChanged.connect(self._update_char_count)
+        self.text_edit.textChanged.connect(self._enable_timer.start)
         self.text_edit.setToolTip("합성할 한국어 텍스트를 입력하세요")
         input_layout.addWidget(self.text_edit)
 
@@ -1109,7 +1138,7 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
         # Voice selection
         settings_layout.addWidget(QtWidgets.QLabel("Voice:"), 0, 0)
         self.voice_combo = QtWidgets.QComboBox()
-        self.voice_combo.addItems([v.name for v in self._engine.voices()])
+        self.voice_combo.addItems(self._voice_names)
         self.voice_combo.setToolTip("음성 선택")
         settings_layout.addWidget(self.voice_combo, 0, 1)
 
@@ -1150,7 +1179,7 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
         downloads_dir = Path.home() / "Downloads"
         downloads_dir.mkdir(parents=True, exist_ok=True)
         self.output_edit = QtWidgets.QLineEdit(str(downloads_dir / "latest.wav"))
-        self.output_edit.textChanged.connect(self._update_generate_enabled)
+        self.output_edit.textChanged.connect(self._enable_timer.start)
         self.output_edit.setToolTip("출력 파일 경로")
         output_row.addWidget(self.output_edit)
 
@@ -1266,7 +1295,7 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
         speaker_layout.addWidget(QtWidgets.QLabel("목소리:"), 1, 2)
         self.speaker_a_voice = QtWidgets.QComboBox()
         # Use the same voice list as the solo mode
-        self.speaker_a_voice.addItems([v.name for v in self._engine.voices()])
+        self.speaker_a_voice.addItems(self._voice_names)
         self.speaker_a_voice.setToolTip("화자 A의 TTS 목소리")
         speaker_layout.addWidget(self.speaker_a_voice, 1, 3)
 
@@ -1307,8 +1336,8 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
         speaker_layout.addWidget(QtWidgets.QLabel("목소리:"), 5, 2)
         self.speaker_b_voice = QtWidgets.QComboBox()
         # Use the same voice list as the solo mode
-        self.speaker_b_voice.addItems([v.name for v in self._engine.voices()])
-        self.speaker_b_voice.setCurrentIndex(min(5, len(self._engine.voices()) - 1))  # Default to a male voice
+        self.speaker_b_voice.addItems(self._voice_names)
+        self.speaker_b_voice.setCurrentIndex(min(5, len(self._voice_names) - 1))  # Default to a male voice
         self.speaker_b_voice.setToolTip("화자 B의 TTS 목소리")
         speaker_layout.addWidget(self.speaker_b_voice, 5, 3)
 
@@ -1330,6 +1359,15 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
 
         layout.addWidget(speaker_group)
 
+        # Keep the speaker map current as the controls change
+        for name_edit in (self.speaker_a_name, self.speaker_b_name):
+            name_edit.editingFinished.connect(self._refresh_speaker_map)
+        for voice_combo in (self.speaker_a_voice, self.speaker_b_voice):
+            voice_combo.currentIndexChanged.connect(self._refresh_speaker_map)
+        for spin in (self.speaker_a_rate, self.speaker_b_rate, self.speaker_a_pan, self.speaker_b_pan):
+            spin.valueChanged.connect(self._refresh_speaker_map)
+        self._refresh_speaker_map()
+
         # Audio settings
         audio_group = QtWidgets.QGroupBox("Audio Settings")
         audio_layout = QtWidgets.QGridLayout(audio_group)
@@ -1477,9 +1515,34 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
                 model_dir=Path(directory),
                 cache_dir=self._config.cache_dir,
             ).ensure()
-            self._engine = self._build_engine()
+            # Reconfigure in place; custom engine factories may not support it
+            if hasattr(self._engine, "set_model_dir"):
+                self._engine.set_model_dir(self._config.model_dir)
+            else:
+                self._engine = self._build_engine()
+            self._refresh_voices()
             self._append_log(f"Model directory set to {directory}")
 
+    def _refresh_voices(self) -> None:
+        """Reload every voice list, keeping each current selection if it still exists."""
+        self._voice_names = [voice.name for voice in self._engine.voices()]
+        self._reload_voice_combo(self.voice_combo)
+        # The dialog tab is built on first view; until then it has no combos
+        if hasattr(self, 'speaker_a_voice'):
+            for combo in (self.speaker_a_voice, self.speaker_b_voice):
+                combo.blockSignals(True)
+                self._reload_voice_combo(combo)
+                combo.blockSignals(False)
+            self._refresh_speaker_map()
+
+    def _reload_voice_combo(self, combo: QtWidgets.QComboBox) -> None:
+        current = combo.currentText()
+        combo.clear()
+        combo.addItems(self._voice_names)
+        index = combo.findText(current)
+        if index >= 0:
+            combo.setCurrentIndex(index)
+
     def _choose_ffmpeg_path(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
@@ -1584,10 +1647,12 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
             speed=speed
         )
 
-        # Connect signals
-        self._synthesis_worker.progress.connect(self._on_synthesis_progress)
-        self._synthesis_worker.finished.connect(self._on_synthesis_finished)
-        self._synthesis_worker.error.connect(self._on_synthesis_error)
+        # Connect signals (queued: slots run on the GUI thread's event loop,
+        # so repaints happen without re-entering Python from a slot)
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        self._synthesis_worker.progress.connect(self._on_synthesis_progress, queued)
+        self._synthesis_worker.finished.connect(self._on_synthesis_finished, queued)
+        self._synthesis_worker.error.connect(self._on_synthesis_error, queued)
 
         # Start worker
         self._synthesis_worker.start()
@@ -1644,37 +1709,31 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
 
     def _append_log(self, message: str) -> None:
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_view.appendPlainText(f"[{timestamp}] {message}")
-        self.log_view.ensureCursorVisible()
-        QtWidgets.QApplication.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents)
+        self._log_queue.append(f"[{timestamp}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        """Append queued log lines to the synthesis and dialog log panels."""
+        self._log_timer.stop()
+        for view, queue in (
+            (self.log_view, self._log_queue),
+            (getattr(self, "dialog_log_view", None), self._dialog_log_queue),
+        ):
+            if view is None or not queue:
+                continue
+            view.appendPlainText("\n".join(queue))
+            view.ensureCursorVisible()
+            queue.clear()
 
     def _update_generate_enabled(self) -> None:
-        has_text = bool(self.text_edit.toPlainText().strip())
-        has_output = bool(self.output_edit.text().strip())
+        # Cheap emptiness checks; _handle_generate still rejects whitespace-only input
+        has_text = not self.text_edit.document().isEmpty()
+        has_output = bool(self.output_edit.text())
         self.generate_btn.setEnabled(has_text and has_output)
 
     def _notify_ffmpeg_missing(self) -> None:
-        # Check if ffmpeg is available in multiple locations
-        import shutil
-
-        ffmpeg_locations = [
-            shutil.which('ffmpeg'),  # System PATH
-            '/opt/homebrew/bin/ffmpeg',  # Homebrew Apple Silicon
-            '/usr/local/bin/ffmpeg',  # Homebrew Intel
-            '/opt/local/bin/ffmpeg',  # MacPorts
-        ]
-
-        # Check if running from bundled app
-        if getattr(sys, 'frozen', False):
-            bundle_dir = Path(sys._MEIPASS)
-            ffmpeg_locations.insert(0, str(bundle_dir / 'ffmpeg'))
-
-        # Check if ffmpeg exists in any location
-        ffmpeg_found = None
-        for location in ffmpeg_locations:
-            if location and Path(location).exists():
-                ffmpeg_found = location
-                break
+        ffmpeg_found, _ = find_ffmpeg_binaries()
 
         if self._engine.ffmpeg_path or ffmpeg_found:
             if ffmpeg_found:
@@ -1692,9 +1751,9 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
             "확인한 경로:\n"
         )
 
-        for loc in ffmpeg_locations:
-            if loc:
-                message += f"  ✗ {loc}\n"
+        message += "  ✗ PATH\n"
+        for loc in binary_search_paths("ffmpeg"):
+            message += f"  ✗ {loc}\n"
 
         message += "\n설치 후 GUI를 재시작하세요."
 
@@ -1726,9 +1785,49 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
     def _dialog_log(self, message: str) -> None:
         """Add message to dialog log."""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.dialog_log_view.appendPlainText(f"[{timestamp}] {message}")
-        self.dialog_log_view.ensureCursorVisible()
-        QtWidgets.QApplication.processEvents()
+        self._dialog_log_queue.append(f"[{timestamp}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _refresh_speaker_map(self) -> None:
+        """Rebuild the dialog speaker map from the speaker controls."""
+
+        def speaker_config(voice: str, rate: int, pan: float) -> SpeakerConfig:
+            # "SunHi (여성, 밝고 친근함)" -> "SunHi"
+            config = {
+                'voice_hint': 'ko_KR',
+                'voice_name': voice.split(' ')[0].strip(),
+                'rate_wpm': rate,
+                'gain_db': 0.0,
+                'pan': pan,
+                'aliases': []
+            }
+            return SpeakerConfig(config, engine='edge')
+
+        speaker_map = {
+            'A': speaker_config(
+                self.speaker_a_voice.currentText(),
+                self.speaker_a_rate.value(),
+                self.speaker_a_pan.value(),
+            ),
+            'B': speaker_config(
+                self.speaker_b_voice.currentText(),
+                self.speaker_b_rate.value(),
+                self.speaker_b_pan.value(),
+            ),
+        }
+
+        names = self._speaker_names()
+        custom_names = [name for name in names if name]
+        if custom_names:
+            speaker_map = apply_speaker_name_mapping(speaker_map, custom_names)
+
+        # Replace rather than mutate: a running worker keeps its own snapshot
+        self._speaker_map = speaker_map
+        self._mapped_speaker_names = names
+
+    def _speaker_names(self) -> tuple[str, str]:
+        return (self.speaker_a_name.text().strip(), self.speaker_b_name.text().strip())
 
     def _handle_dialog_generate(self) -> None:
         """Start dialog synthesis in background thread."""
@@ -1752,17 +1851,9 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
             self._show_warning("Invalid path", f"Output directory does not exist: {output_path.parent}")
             return
 
-        # Prepare speaker config
-        speaker_config = {
-            'voice_a': self.speaker_a_voice.currentText(),
-            'voice_b': self.speaker_b_voice.currentText(),
-            'name_a': self.speaker_a_name.text().strip(),
-            'name_b': self.speaker_b_name.text().strip(),
-            'rate_a': self.speaker_a_rate.value(),
-            'rate_b': self.speaker_b_rate.value(),
-            'pan_a': self.speaker_a_pan.value(),
-            'pan_b': self.speaker_b_pan.value(),
-        }
+        # A name edited without leaving the field hasn't fired editingFinished
+        if self._speaker_names() != self._mapped_speaker_names:
+            self._refresh_speaker_map()
 
         # Prepare audio settings
         audio_settings = {
@@ -1782,12 +1873,15 @@ class LocalKoreanTTSWindow(QtWidgets.QMainWindow):
         self._dialog_worker = DialogSynthesisWorker(
             script_text=script,
             output_path=output_path,
-            speaker_config=speaker_config,
-            audio_settings=audio_settings
+            speaker_map=self._speaker_map,
+            audio_settings=audio_settings,
+            engine_cache=self._dialog_engines,
+            cache_dir=self._config.cache_dir / "dialog",
         )
-        self._dialog_worker.progress.connect(self._on_dialog_progress)
-        self._dialog_worker.finished.connect(self._on_dialog_finished)
-        self._dialog_worker.error.connect(self._on_dialog_error)
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        self._dialog_worker.progress.connect(self._on_dialog_progress, queued)
+        self._dialog_worker.finished.connect(self._on_dialog_finished, queued)
+        self._dialog_worker.error.connect(self._on_dialog_error, queued)
         self._dialog_worker.start()
 
     def _on_dialog_progress(self, value: int, message: str) -> None:
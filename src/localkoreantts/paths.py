@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import os
 import platform
@@ -13,6 +14,17 @@ LK_TTS_CACHE_ENV = "LK_TTS_CACHE_DIR"
 
 _SYSTEM = platform.system()
 
+# Environment variables that decide where the directories resolve to
+_PATH_ENV_VARS = (
+    LK_TTS_MODEL_ENV,
+    LK_TTS_CACHE_ENV,
+    "XDG_DATA_HOME",
+    "XDG_CACHE_HOME",
+    "LOCALAPPDATA",
+    "APPDATA",
+    "HOME",
+)
+
 
 def _expand_env_path(value: str | Path) -> Path:
     return Path(value).expanduser()
@@ -68,8 +80,19 @@ class PathConfig:
 
 
 def resolve_path_config() -> PathConfig:
-    """Resolve the directories, honoring environment overrides."""
+    """Resolve the directories, honoring environment overrides.
+
+    Resolved (and created) once per distinct environment; call
+    ``resolve_path_config.cache_clear()`` to force a fresh lookup.
+    """
+
+    env = tuple(os.environ.get(name) for name in _PATH_ENV_VARS)
+    return _resolve_path_config(_SYSTEM, env)
 
+
+@lru_cache(maxsize=8)
+def _resolve_path_config(system: str, env: Tuple[str | None, ...]) -> PathConfig:
+    # The arguments only key the cache; the helpers read the same values.
     model_dir = Path(
         os.environ.get(LK_TTS_MODEL_ENV, _default_model_dir())
     ).expanduser()
@@ -81,6 +104,9 @@ def resolve_path_config() -> PathConfig:
     return config
 
 
+resolve_path_config.cache_clear = _resolve_path_config.cache_clear
+
+
 def describe_environment() -> str:
     """Human readable description used in logs and diagnostics."""
 
@@ -10,9 +10,27 @@ def _mock_sounddevice(monkeypatch):
 
     from localkoreantts import audio_io
 
+    class DummyStream:
+        def __init__(self, sd, **kwargs):
+            self.frames = 0
+            sd.stream_calls.append({"kwargs": kwargs, "stream": self})
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def write(self, block):
+            self.frames += len(block)
+
     class DummySD:
         def __init__(self):
             self.play_calls = []
+            self.stream_calls = []
+
+        def OutputStream(self, **kwargs):
+            return DummyStream(self, **kwargs)
 
         def play(self, data, samplerate=None, device=None):
             self.play_calls.append(
@@ -25,6 +43,22 @@ def _mock_sounddevice(monkeypatch):
     monkeypatch.setattr(audio_io, "sd", DummySD())
 
 
+@pytest.fixture(autouse=True)
+def _clear_resolution_caches():
+    """Forget memoized path/ffmpeg lookups so each test sees its own patches."""
+
+    from localkoreantts.ffmpeg import describe_ffmpeg, detect_ffmpeg_path
+    from localkoreantts.paths import resolve_path_config
+
+    detect_ffmpeg_path.cache_clear()
+    describe_ffmpeg.cache_clear()
+    resolve_path_config.cache_clear()
+    yield
+    detect_ffmpeg_path.cache_clear()
+    describe_ffmpeg.cache_clear()
+    resolve_path_config.cache_clear()
+
+
 @pytest.fixture(autouse=True)
 def _mock_ffmpeg_bin(monkeypatch, tmp_path_factory):
     """Provide a dummy ffmpeg binary path so detection never hits the host system."""
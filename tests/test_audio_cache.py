@@ -0,0 +1,67 @@
+import os
+import shutil
+
+import pytest
+
+from localkoreantts import audio_cache
+
+
+def test_materialize_copies_cached_audio(tmp_path):
+    source = tmp_path / "cached.wav"
+    source.write_bytes(b"RIFF" + bytes(range(256)) * 64)
+    target = tmp_path / "out.wav"
+    target.write_bytes(b"stale and longer than nothing")
+
+    audio_cache.materialize(source, target)
+    target.write_bytes(b"rewritten")
+
+    assert source.read_bytes() == b"RIFF" + bytes(range(256)) * 64
+
+    audio_cache.materialize(source, target)
+    assert target.read_bytes() == source.read_bytes()
+    with pytest.raises(OSError):
+        audio_cache.materialize(tmp_path / "missing.wav", target)
+
+
+def test_materialize_keeps_existing_output_when_clone_source_is_missing(tmp_path, monkeypatch):
+    def fake_clonefile(source, target, flags):
+        # Like clonefile(2): fails on a missing source or an existing destination
+        if not os.path.exists(source) or os.path.exists(target):
+            return -1
+        shutil.copyfile(source, target)
+        return 0
+
+    monkeypatch.setattr(audio_cache, "_macos_clonefile", lambda: fake_clonefile)
+    target = tmp_path / "latest.wav"
+    target.write_bytes(b"previous output")
+
+    with pytest.raises(OSError):
+        audio_cache.materialize(tmp_path / "missing.wav", target)
+    assert target.read_bytes() == b"previous output"
+
+    source = tmp_path / "cached.wav"
+    source.write_bytes(b"cached audio")
+    audio_cache.materialize(source, target)
+    assert target.read_bytes() == b"cached audio"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cached.wav", "latest.wav"]
+
+
+def test_store_replaces_atomically_and_evicts_oldest(tmp_path):
+    cache_dir = tmp_path / "cache"
+    for index, name in enumerate(["a.wav", "b.wav", "c.wav"]):
+        audio_cache.store(cache_dir / name, name.encode(), max_files=2)
+        os.utime(cache_dir / name, (index, index))
+
+    assert sorted(path.name for path in cache_dir.iterdir()) == ["b.wav", "c.wav"]
+    assert (cache_dir / "c.wav").read_bytes() == b"c.wav"
+
+
+def test_fetch_reports_misses(tmp_path):
+    target = tmp_path / "out.wav"
+    assert not audio_cache.fetch(tmp_path / "missing.wav", target)
+    assert not target.exists()
+
+    cached = tmp_path / "cached.wav"
+    cached.write_bytes(b"audio")
+    assert audio_cache.fetch(cached, target)
+    assert target.read_bytes() == b"audio"
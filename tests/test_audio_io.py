@@ -20,49 +20,45 @@ def _write_silence(path: Path, samplerate: int = 22050) -> None:
     sf.write(str(path), data, samplerate)
 
 
-def test_play_wav_invokes_sounddevice(monkeypatch, tmp_path):
+def test_play_wav_streams_blocks(tmp_path):
     wav_path = tmp_path / "sample.wav"
     _write_silence(wav_path, samplerate=12345)
 
-    calls = {"play": None, "wait": False}
-
-    class DummySD:
-        def play(self, data, samplerate=None, device=None):
-            calls["play"] = {"samplerate": samplerate, "device": device, "size": len(data)}
-
-        def wait(self):
-            calls["wait"] = True
-
-    monkeypatch.setattr(audio_io, "sd", DummySD())
-
     play_wav(wav_path, device="Built-in Output")
 
-    assert calls["play"]["samplerate"] == 12345
-    assert calls["play"]["device"] == "Built-in Output"
-    assert calls["wait"] is True
+    (call,) = audio_io.sd.stream_calls
+    assert call["kwargs"]["samplerate"] == 12345
+    assert call["kwargs"]["device"] == "Built-in Output"
+    assert call["kwargs"]["channels"] == 1
+    assert call["stream"].frames == 12345
+    assert audio_io.sd.play_calls == []
 
 
 def test_play_wav_respects_env_samplerate(monkeypatch, tmp_path):
     wav_path = tmp_path / "sample.wav"
     _write_silence(wav_path, samplerate=16000)
+    monkeypatch.setenv(LK_TTS_SAMPLE_RATE_ENV, "44100")
 
-    class DummySD:
-        def __init__(self):
-            self.used_rate = None
+    play_wav(wav_path)
 
-        def play(self, data, samplerate=None, device=None):
-            self.used_rate = samplerate
+    assert audio_io.sd.stream_calls[0]["kwargs"]["samplerate"] == 44100
 
-        def wait(self):
-            pass
 
-    dummy = DummySD()
-    monkeypatch.setattr(audio_io, "sd", dummy)
-    monkeypatch.setenv(LK_TTS_SAMPLE_RATE_ENV, "44100")
+def test_play_wav_without_soundfile_plays_whole_buffer(monkeypatch, tmp_path):
+    wav_path = tmp_path / "sample.wav"
+    wav_path.write_bytes(b"\x00\x00")
+    monkeypatch.setattr(audio_io, "sf", None)
+
+    class DummyReader:
+        @staticmethod
+        def read(path):
+            return 11025, np.array([0, 1], dtype=np.int16)
+
+    monkeypatch.setattr(audio_io, "scipy_wavfile", DummyReader)
 
     play_wav(wav_path)
 
-    assert dummy.used_rate == 44100
+    assert audio_io.sd.play_calls == [{"samples": 2, "samplerate": 11025, "device": None}]
 
 
 def test_play_wav_skip_flag(monkeypatch, tmp_path):
@@ -76,6 +72,9 @@ def test_play_wav_skip_flag(monkeypatch, tmp_path):
         def wait(self):
             raise AssertionError("Should not be called")
 
+        def OutputStream(self, **kwargs):
+            raise AssertionError("Should not be called")
+
     monkeypatch.setattr(audio_io, "sd", DummySD())
 
     play_wav(wav_path, skip_play=True)
@@ -130,6 +129,17 @@ def test_load_wave_with_scipy(monkeypatch, tmp_path):
     assert data.dtype == np.float32
 
 
+def test_load_wave_decodes_pcm16_as_float32(tmp_path):
+    wav_path = tmp_path / "pcm16.wav"
+    sf.write(str(wav_path), np.array([0, 16384, -32768], dtype=np.int16), 8000, subtype="PCM_16")
+
+    data, rate = _load_wave(wav_path)
+
+    assert rate == 8000
+    assert data.dtype == np.float32
+    assert data.tolist() == [0.0, 0.5, -1.0]
+
+
 def test_coerce_to_float32_from_int():
     data = np.array([0, 32767, -32768], dtype=np.int16)
     converted = _coerce_to_float32(data)
@@ -1,3 +1,4 @@
+import io
 import json
 from pathlib import Path
 
@@ -43,6 +44,53 @@ def test_cli_generates_wave(tmp_path, monkeypatch):
     assert meta["lang"] == "ko-KR"
 
 
+def test_cli_reads_text_from_stdin(tmp_path, monkeypatch):
+    _, _, destination, _ = _prepare_cli_io(tmp_path, monkeypatch)
+    monkeypatch.setattr(cli.sys, "stdin", io.TextIOWrapper(io.BytesIO("표준 입력".encode("utf-8"))))
+
+    exit_code = cli.main(["--input-file", "-", "--out", str(destination)])
+
+    assert exit_code == 0
+    meta_path = destination.with_name(destination.stem + ".meta.json")
+    assert json.loads(meta_path.read_text(encoding="utf-8"))["text"] == "표준 입력"
+
+
+def test_cli_metadata_without_orjson_is_indented(tmp_path, monkeypatch):
+    _, _, destination, input_file = _prepare_cli_io(tmp_path, monkeypatch)
+    monkeypatch.setattr(cli, "orjson", None)
+
+    exit_code = cli.main(["--in", str(input_file), "--out", str(destination)])
+
+    assert exit_code == 0
+    meta_text = destination.with_name(destination.stem + ".meta.json").read_text(encoding="utf-8")
+    meta = json.loads(meta_text)
+    assert meta_text == json.dumps(meta, ensure_ascii=False, indent=2)
+
+
+def test_cli_serve_answers_each_request(tmp_path, monkeypatch, capsys):
+    _prepare_cli_io(tmp_path, monkeypatch)
+    first = tmp_path / "first.wav"
+    requests = [
+        json.dumps({"text": "첫 번째", "output": str(first)}),
+        json.dumps({"output": str(tmp_path / "missing-text.wav")}),
+    ]
+    monkeypatch.setattr(cli.sys, "stdin", io.StringIO("\n".join(requests) + "\n"))
+
+    exit_code = cli.main(["--serve"])
+
+    replies = [
+        json.loads(line[len(cli.SERVE_REPLY_MARKER):])
+        for line in capsys.readouterr().out.splitlines()
+        if line.startswith(cli.SERVE_REPLY_MARKER)
+    ]
+    assert exit_code == 0
+    assert len(replies) == 3
+    assert replies[0] == {"ok": True, "ready": True}
+    assert replies[1] == {"ok": True, "output": str(first)}
+    assert first.exists()
+    assert replies[2]["ok"] is False
+
+
 def test_cli_describe_lists_environment(tmp_path, monkeypatch, capsys):
     model_dir, cache_dir, destination, _ = _prepare_cli_io(tmp_path, monkeypatch)
 
@@ -59,6 +107,7 @@ def test_cli_describe_lists_environment(tmp_path, monkeypatch, capsys):
     captured = capsys.readouterr()
     assert "platform=" in captured.out
     assert str(model_dir) in captured.out
+    assert "ffmpeg=mocked" in captured.out
     assert exit_code == 0
 
 
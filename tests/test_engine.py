@@ -1,6 +1,24 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+import numpy as np
 import pytest
 
-from localkoreantts.engine import LocalKoreanTTSEngine, resolve_path_config
+from localkoreantts import engine as engine_module
+from localkoreantts.engine import (
+    LocalKoreanTTSEngine,
+    EDGE_TTS_MAX_CONCURRENCY,
+    _Backend,
+    _fetch_edge_audio,
+    _mp3_to_wav,
+    _pipe_mp3_to_wav,
+    _sine_table_lookup,
+    _split_sentences,
+    resolve_path_config,
+)
+from localkoreantts.paths import PathConfig
 
 
 def test_engine_rejects_empty_text(tmp_path, monkeypatch):
@@ -8,3 +26,256 @@ def test_engine_rejects_empty_text(tmp_path, monkeypatch):
     engine = LocalKoreanTTSEngine(path_config=config)
     with pytest.raises(ValueError):
         engine.synthesize_to_file("", "standard-female", tmp_path / "out.wav")
+
+
+def _counting_engine(tmp_path, monkeypatch, backend):
+    """Engine preferring edge-tts whose synthesis reports ``backend`` and counts calls."""
+    config = PathConfig(model_dir=tmp_path / "model", cache_dir=tmp_path / "cache")
+    engine = LocalKoreanTTSEngine(path_config=config)
+    engine._backend = "edge-tts"
+    engine.calls = []
+
+    def fake_synthesize(text, voice, output_path, speed):
+        engine.calls.append(text)
+        output_path.write_bytes(f"{voice.name}:{speed}:{text}".encode("utf-8"))
+        return backend
+
+    monkeypatch.setattr(engine, "_synthesize", fake_synthesize)
+    return engine
+
+
+def test_repeated_request_served_from_cache(tmp_path, monkeypatch):
+    engine = _counting_engine(tmp_path, monkeypatch, backend="edge-tts")
+    voice = engine.voices()[0].name
+
+    first = engine.synthesize_to_file("안녕하세요", voice, tmp_path / "1.wav")
+    second = engine.synthesize_to_file("안녕하세요", voice, tmp_path / "2.wav")
+    engine.synthesize_to_file("안녕하세요", voice, tmp_path / "3.wav", speed=1.2)
+
+    assert engine.calls == ["안녕하세요", "안녕하세요"]
+    assert second.read_bytes() == first.read_bytes()
+
+
+def test_recent_results_served_from_memory(tmp_path, monkeypatch):
+    engine = _counting_engine(tmp_path, monkeypatch, backend="edge-tts")
+    voice = engine.voices()[0].name
+
+    first = engine.synthesize_to_file("네", voice, tmp_path / "1.wav")
+    for cached in (tmp_path / "cache" / "tts").glob("*.wav"):
+        cached.unlink()
+    second = engine.synthesize_to_file("네", voice, tmp_path / "2.wav")
+
+    assert engine.calls == ["네"]
+    assert second.read_bytes() == first.read_bytes()
+
+
+def test_disk_cache_shared_between_engines(tmp_path, monkeypatch):
+    voice = "SunHi (여성, 밝고 친근함)"
+    _counting_engine(tmp_path, monkeypatch, backend="edge-tts").synthesize_to_file(
+        "네", voice, tmp_path / "1.wav"
+    )
+    engine = _counting_engine(tmp_path, monkeypatch, backend="edge-tts")
+    engine.synthesize_to_file("네", voice, tmp_path / "2.wav")
+
+    assert engine.calls == []
+
+
+def test_memory_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine_module, "TTS_MEMORY_CACHE_MAX_ITEMS", 2)
+    engine = _counting_engine(tmp_path, monkeypatch, backend="edge-tts")
+
+    engine._remember("a", b"1")
+    engine._remember("b", b"22")
+    engine._remember("c", b"333")
+
+    assert list(engine._memory_cache) == ["b", "c"]
+    assert engine._memory_cache_bytes == 5
+
+
+def test_placeholder_audio_is_not_cached(tmp_path, monkeypatch):
+    engine = _counting_engine(tmp_path, monkeypatch, backend=None)
+    voice = engine.voices()[0].name
+
+    engine.synthesize_to_file("네", voice, tmp_path / "1.wav")
+    engine.synthesize_to_file("네", voice, tmp_path / "2.wav")
+
+    assert engine.calls == ["네", "네"]
+    assert not list((tmp_path / "cache" / "tts").glob("*.wav"))
+
+
+def test_split_sentences_on_punctuation_and_newlines():
+    text = "안녕하세요. 반갑습니다!\n\n오늘은?  좋아요…끝"
+    assert _split_sentences(text) == ["안녕하세요.", "반갑습니다!", "오늘은?", "좋아요…끝"]
+    assert _split_sentences("하나") == ["하나"]
+
+
+def test_async_work_reuses_one_event_loop(tmp_path):
+    config = PathConfig(model_dir=tmp_path / "model", cache_dir=tmp_path / "cache")
+    engine = LocalKoreanTTSEngine(path_config=config)
+
+    async def running_loop():
+        return asyncio.get_running_loop()
+
+    first = engine._run_async(running_loop())
+    second = engine._run_async(running_loop())
+    thread = engine._loop_thread
+    engine.close()
+
+    assert first is second
+    assert not thread.is_alive()
+    assert first.is_closed()
+
+
+class _FakeCommunicate:
+    """edge-tts stand-in whose earlier sentences take longer to arrive."""
+
+    def __init__(self, text, voice, rate, volume):
+        self.text = text
+
+    async def stream(self):
+        await asyncio.sleep(0.01 * (4 - len(self.text)))
+        yield {"type": "WordBoundary"}
+        for char in self.text:
+            yield {"type": "audio", "data": char.encode("utf-8")}
+
+
+def _fake_ffmpeg(tmp_path):
+    """Executable standing in for ffmpeg: copies stdin to the output path."""
+    fake_ffmpeg = tmp_path / "ffmpeg"
+    fake_ffmpeg.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "open(sys.argv[-1], 'wb').write(sys.stdin.buffer.read())\n"
+    )
+    fake_ffmpeg.chmod(0o755)
+    return fake_ffmpeg
+
+
+def test_edge_audio_is_piped_to_ffmpeg_in_sentence_order(tmp_path, monkeypatch):
+    fake_ffmpeg = _fake_ffmpeg(tmp_path)
+    monkeypatch.setattr(engine_module, "edge_tts", type("edge", (), {"Communicate": _FakeCommunicate}))
+    config = PathConfig(model_dir=tmp_path / "model", cache_dir=tmp_path / "cache")
+    engine = LocalKoreanTTSEngine(path_config=config, ffmpeg_path=fake_ffmpeg)
+
+    output = tmp_path / "out.wav"
+    engine._synthesize_edge("가. 나나! 다다다?", engine.voices()[0], output, 1.0)
+    engine.close()
+
+    assert output.read_text(encoding="utf-8") == "가.나나!다다다?"
+
+
+def test_mp3_decoded_by_ffmpeg_directly(tmp_path):
+    output = tmp_path / "out.wav"
+    _mp3_to_wav(b"mp3 bytes", output, str(_fake_ffmpeg(tmp_path)), 24000)
+    assert output.read_bytes() == b"mp3 bytes"
+
+
+def test_mp3_decode_timeout_is_not_reported_as_missing_ffmpeg(tmp_path, monkeypatch):
+    def hung_ffmpeg(command, **kwargs):
+        raise subprocess.TimeoutExpired(command, kwargs["timeout"])
+
+    monkeypatch.setattr(engine_module.subprocess, "run", hung_ffmpeg)
+    with pytest.raises(Exception, match="did not finish") as excinfo:
+        _mp3_to_wav(b"mp3 bytes", tmp_path / "out.wav", "ffmpeg", 24000)
+    assert isinstance(excinfo.value.__cause__, subprocess.TimeoutExpired)
+
+
+def test_piped_decode_timeout_kills_ffmpeg(tmp_path, monkeypatch):
+    hung_ffmpeg = tmp_path / "ffmpeg"
+    hung_ffmpeg.write_text(
+        f"#!{sys.executable}\n"
+        "import sys, time\n"
+        "sys.stdin.buffer.read()\n"
+        "time.sleep(30)\n"
+    )
+    hung_ffmpeg.chmod(0o755)
+    monkeypatch.setattr(engine_module, "FFMPEG_DECODE_TIMEOUT_S", 0.2)
+
+    async def feed(write):
+        await write(b"mp3 bytes")
+
+    with pytest.raises(Exception, match="did not finish") as excinfo:
+        asyncio.run(_pipe_mp3_to_wav([str(hung_ffmpeg), str(tmp_path / "out.wav")], feed))
+    assert isinstance(excinfo.value.__cause__, asyncio.TimeoutError)
+
+
+def test_failing_backend_falls_through_to_next(tmp_path):
+    config = PathConfig(model_dir=tmp_path / "model", cache_dir=tmp_path / "cache")
+    engine = LocalKoreanTTSEngine(path_config=config)
+
+    def broken(text, voice, output_path, speed):
+        raise RuntimeError("offline")
+
+    def working(text, voice, output_path, speed):
+        output_path.write_bytes(text.encode("utf-8"))
+
+    engine._backends = [_Backend("edge-tts", broken), _Backend("gtts", working)]
+    output = tmp_path / "out.wav"
+
+    assert engine._synthesize("안녕", engine.voices()[0], output, 1.0) == "gtts"
+    assert output.read_text(encoding="utf-8") == "안녕"
+
+
+def test_edge_fetch_stays_a_bounded_window_ahead(monkeypatch):
+    started = []
+
+    class SlowFirstCommunicate:
+        def __init__(self, text, voice, rate, volume):
+            self.text = text
+
+        async def stream(self):
+            started.append(self.text)
+            if self.text == "0":
+                await asyncio.sleep(0.05)
+            yield {"type": "audio", "data": self.text.encode("utf-8")}
+
+    monkeypatch.setattr(engine_module, "edge_tts", type("edge", (), {"Communicate": SlowFirstCommunicate}))
+    written = []
+
+    async def write(data):
+        written.append((data.decode("utf-8"), len(started)))
+
+    sentences = [str(index) for index in range(10)]
+    asyncio.run(_fetch_edge_audio(sentences, "voice", "+0%", write))
+
+    assert [text for text, _ in written] == sentences
+    assert written[0][1] == EDGE_TTS_MAX_CONCURRENCY
+
+
+def test_sine_table_tracks_numpy_sine():
+    n = np.arange(24000)
+    expected = 32767 * np.sin(2 * np.pi * 317 * n / 24000)
+    assert np.abs(_sine_table_lookup(317 / 24000, 24000) - expected).max() < 64
+
+
+def test_set_model_dir_keeps_backends_and_cache(tmp_path):
+    config = PathConfig(model_dir=tmp_path / "models", cache_dir=tmp_path / "cache")
+    engine = LocalKoreanTTSEngine(path_config=config)
+    backends = engine._backends
+
+    engine.set_model_dir(tmp_path / "other-models")
+
+    assert engine.path_config.model_dir == tmp_path / "other-models"
+    assert engine.path_config.model_dir.is_dir()
+    assert engine.path_config.cache_dir == config.cache_dir
+    assert engine._backends is backends
+
+
+def test_engine_configures_pydub_ffmpeg_outside_path(tmp_path, monkeypatch):
+    pytest.importorskip("pydub")
+    fake_ffmpeg = _fake_ffmpeg(tmp_path)
+    audio_segment = engine_module._load_pydub()
+    for attribute in ("converter", "ffmpeg"):
+        monkeypatch.setattr(audio_segment, attribute, getattr(audio_segment, attribute, None))
+    monkeypatch.setenv("PATH", "/usr/bin")
+    monkeypatch.delenv("FFMPEG_BINARY", raising=False)
+    monkeypatch.setattr(engine_module, "find_ffmpeg_binaries", lambda: (str(fake_ffmpeg), None))
+    engine_module._configure_pydub_ffmpeg.cache_clear()
+    try:
+        config = PathConfig(model_dir=tmp_path / "model", cache_dir=tmp_path / "cache")
+        LocalKoreanTTSEngine(path_config=config, ffmpeg_path=fake_ffmpeg)
+
+        assert audio_segment.converter == str(fake_ffmpeg)
+        assert os.environ["PATH"].split(os.pathsep)[0] == str(tmp_path)
+    finally:
+        engine_module._configure_pydub_ffmpeg.cache_clear()
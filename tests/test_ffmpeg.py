@@ -1,3 +1,5 @@
+import os
+import subprocess
 from pathlib import Path
 
 import pytest
@@ -7,6 +9,7 @@ from localkoreantts.ffmpeg import (
     detect_ffmpeg_path,
     describe_ffmpeg,
     find_ffmpeg,
+    find_ffmpeg_binaries,
 )
 
 
@@ -48,6 +51,17 @@ def test_detect_ffmpeg_none_when_missing(monkeypatch):
     assert detect_ffmpeg_path() is None
 
 
+def test_detect_ffmpeg_notices_a_later_install(monkeypatch, tmp_path):
+    monkeypatch.delenv(LK_TTS_FFMPEG_ENV, raising=False)
+    monkeypatch.setattr("localkoreantts.ffmpeg.shutil.which", lambda _: None)
+    monkeypatch.setattr("localkoreantts.ffmpeg.COMMON_MAC_PATHS", ())
+    assert detect_ffmpeg_path() is None
+
+    installed = _make_exec(tmp_path / "ffmpeg")
+    monkeypatch.setattr("localkoreantts.ffmpeg.shutil.which", lambda _: str(installed))
+    assert detect_ffmpeg_path() == installed
+
+
 def test_detect_ffmpeg_uses_common_paths(monkeypatch, tmp_path):
     monkeypatch.setattr("localkoreantts.ffmpeg.shutil.which", lambda _: None)
     monkeypatch.delenv(LK_TTS_FFMPEG_ENV, raising=False)
@@ -68,8 +82,59 @@ def test_describe_ffmpeg(monkeypatch, tmp_path):
     output = describe_ffmpeg(binary)
     assert "ffmpeg version" in output
 
+    calls = []
+    real_run = subprocess.run
+
+    def counting_run(*args, **kwargs):
+        calls.append(args[0])
+        return real_run(*args, **kwargs)
+
+    monkeypatch.setattr("localkoreantts.ffmpeg.subprocess.run", counting_run)
+    assert describe_ffmpeg(binary) == output
+    assert calls == []
+
+    binary.write_text("#!/bin/sh\necho changed\n")
+    os.utime(binary, ns=(0, binary.stat().st_mtime_ns + 10**9))
+    assert describe_ffmpeg(binary) == "changed"
+    assert len(calls) == 1
+
+
+def test_describe_ffmpeg_reports_hung_binary(monkeypatch, tmp_path):
+    binary = _make_exec(tmp_path / "ffmpeg")
+    binary.write_text("#!/bin/sh\necho ffmpeg version recovered\n")
+    real_run = subprocess.run
+    hung = [True]
+
+    def run(*args, **kwargs):
+        if hung[0]:
+            raise subprocess.TimeoutExpired(args[0], kwargs.get("timeout"))
+        return real_run(*args, **kwargs)
+
+    monkeypatch.setattr("localkoreantts.ffmpeg.subprocess.run", run)
+    assert describe_ffmpeg(binary) == "ffmpeg=<unavailable>"
+
+    hung[0] = False
+    assert describe_ffmpeg(binary) == "ffmpeg version recovered"
+
 
 def test_detect_ffmpeg_explicit_success(tmp_path):
     binary = _make_exec(tmp_path / "explicit_ffmpeg")
     detected = detect_ffmpeg_path(str(binary))
     assert detected == binary
+
+
+def test_find_ffmpeg_binaries_probes_once(monkeypatch):
+    calls = []
+
+    def fake_which(name):
+        calls.append(name)
+        return f"/fake/bin/{name}"
+
+    monkeypatch.setattr("localkoreantts.ffmpeg.shutil.which", fake_which)
+    find_ffmpeg_binaries.cache_clear()
+    try:
+        assert find_ffmpeg_binaries() == ("/fake/bin/ffmpeg", "/fake/bin/ffprobe")
+        assert find_ffmpeg_binaries() == ("/fake/bin/ffmpeg", "/fake/bin/ffprobe")
+        assert calls == ["ffmpeg", "ffprobe"]
+    finally:
+        find_ffmpeg_binaries.cache_clear()
@@ -1,12 +1,13 @@
 import os
 import sys
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
 from PySide6.QtWidgets import QApplication
 
 from localkoreantts.engine import VoiceProfile
-from localkoreantts.gui import LocalKoreanTTSWindow
+from localkoreantts.gui import DialogSynthesisWorker, LocalKoreanTTSWindow
 from localkoreantts.paths import PathConfig
 
 
@@ -36,6 +37,7 @@ def test_gui_generate_invokes_engine(tmp_path):
     window._show_warning = lambda *_, **__: None
     window._show_error = lambda *_, **__: None
 
+    window._flush_log()
     assert "ffmpeg" in window.log_view.toPlainText().lower()
 
     window.text_edit.setPlainText("sample text")
@@ -45,3 +47,100 @@ def test_gui_generate_invokes_engine(tmp_path):
 
     fake_engine.synthesize_to_file.assert_called_once()
     window.close()
+
+
+def _render_dialog(tmp_path, engine, output_path, script="A: 안녕"):
+    """Run a dialog worker synchronously against engine; return its finished paths."""
+    speaker = SimpleNamespace(
+        config={"voice_name": "test"}, voice_name="test", rate_wpm=170, pan=0.0
+    )
+    worker = DialogSynthesisWorker(
+        script_text=script,
+        output_path=output_path,
+        speaker_map={"A": speaker},
+        audio_settings={"sample_rate": 24000, "stereo": True, "gap_ms": 250},
+        engine_cache={(24000, True): engine},
+        cache_dir=tmp_path / "cache",
+    )
+    finished = []
+    worker.finished.connect(finished.append)
+    worker.run()
+    return finished
+
+
+def _fake_dialog_engine(backend_name, sfx_paths=()):
+    engine = mock.MagicMock()
+    engine.backend_name = backend_name
+    engine.sfx_paths.side_effect = lambda script: list(sfx_paths) if "[sfx" in script else []
+    engine.synthesize_dialog_text.side_effect = (
+        lambda output_path, **_: output_path.write_bytes(b"RIFFdialog")
+    )
+    return engine
+
+
+def test_dialog_worker_reuses_cached_render(tmp_path):
+    _app = QApplication.instance() or QApplication([])
+    fake_engine = _fake_dialog_engine("edge")
+
+    assert _render_dialog(tmp_path, fake_engine, tmp_path / "first.wav") == [tmp_path / "first.wav"]
+    assert _render_dialog(tmp_path, fake_engine, tmp_path / "second.wav") == [tmp_path / "second.wav"]
+    assert (tmp_path / "second.wav").read_bytes() == b"RIFFdialog"
+    assert fake_engine.synthesize_dialog_text.call_count == 1
+
+    _render_dialog(tmp_path, fake_engine, tmp_path / "third.wav", script="A: 반가워")
+    assert fake_engine.synthesize_dialog_text.call_count == 2
+
+
+def test_dialog_worker_does_not_cache_fallback_backend(tmp_path):
+    _app = QApplication.instance() or QApplication([])
+    fake_engine = _fake_dialog_engine("mac")
+
+    _render_dialog(tmp_path, fake_engine, tmp_path / "first.wav")
+    _render_dialog(tmp_path, fake_engine, tmp_path / "second.wav")
+
+    assert fake_engine.synthesize_dialog_text.call_count == 2
+    assert not list((tmp_path / "cache").glob("*.wav"))
+
+
+def test_dialog_worker_rerenders_after_sfx_change(tmp_path):
+    _app = QApplication.instance() or QApplication([])
+    sfx = tmp_path / "ding.wav"
+    sfx.write_bytes(b"old")
+    fake_engine = _fake_dialog_engine("edge", sfx_paths=[sfx])
+    script = "A: 안녕\n[sfx=ding.wav]"
+
+    _render_dialog(tmp_path, fake_engine, tmp_path / "first.wav", script=script)
+    _render_dialog(tmp_path, fake_engine, tmp_path / "second.wav", script=script)
+    assert fake_engine.synthesize_dialog_text.call_count == 1
+
+    sfx.write_bytes(b"new and longer")
+    _render_dialog(tmp_path, fake_engine, tmp_path / "third.wav", script=script)
+    assert fake_engine.synthesize_dialog_text.call_count == 2
+
+
+def test_refresh_voices_updates_loaded_dialog_tab(tmp_path):
+    _app = QApplication.instance() or QApplication([])
+    fake_engine = mock.MagicMock()
+    fake_engine.voices.return_value = [
+        VoiceProfile(name=name, locale="ko-KR", sample_rate=24000) for name in ("SunHi", "InJoon")
+    ]
+    fake_engine.ffmpeg_path = None
+    config = PathConfig(model_dir=tmp_path / "models", cache_dir=tmp_path / "cache").ensure()
+    window = LocalKoreanTTSWindow(engine_factory=lambda **kwargs: fake_engine, path_config=config)
+
+    window._tabs.setCurrentIndex(window._dialog_tab_index)
+    if not hasattr(window, "speaker_a_voice"):
+        window.close()
+        pytest.skip("dialog-tts is not available")
+    window.speaker_b_voice.setCurrentText("InJoon")
+
+    fake_engine.voices.return_value = [
+        VoiceProfile(name=name, locale="ko-KR", sample_rate=24000) for name in ("Hyunsu", "InJoon", "SunHi")
+    ]
+    window._refresh_voices()
+
+    for combo in (window.voice_combo, window.speaker_a_voice, window.speaker_b_voice):
+        assert [combo.itemText(i) for i in range(combo.count())] == ["Hyunsu", "InJoon", "SunHi"]
+    assert window.speaker_a_voice.currentText() == "SunHi"
+    assert window.speaker_b_voice.currentText() == "InJoon"
+    window.close()
@@ -68,6 +68,7 @@ def test_gui_smoke_roundtrip(tmp_path, qtbot, monkeypatch):
     assert stub_engine.calls
     assert stub_engine.calls[0]["text"] == long_text
 
+    window._flush_log()
     logs = window.log_view.toPlainText()
     assert "Ready to synthesize" in logs
     assert "ffmpeg" in logs.lower()
@@ -54,3 +54,16 @@ def test_paths_describe_environment(monkeypatch, tmp_path):
     monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
     summary = describe_environment()
     assert "platform=" in summary
+
+
+def test_resolution_cached_per_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv(LK_TTS_MODEL_ENV, str(tmp_path / "models"))
+    monkeypatch.setenv(LK_TTS_CACHE_ENV, str(tmp_path / "cache"))
+
+    first = resolve_path_config()
+    assert resolve_path_config() is first
+
+    monkeypatch.setenv(LK_TTS_CACHE_ENV, str(tmp_path / "other-cache"))
+    second = resolve_path_config()
+    assert second.cache_dir == tmp_path / "other-cache"
+    assert second.model_dir == first.model_dir
@@ -0,0 +1,54 @@
+import errno
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "setup_test_model.py"
+
+
+@pytest.fixture
+def setup_script():
+    spec = importlib.util.spec_from_file_location("setup_test_model", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _make_extracted_model(root: Path) -> Path:
+    (root / "config").mkdir(parents=True)
+    (root / "config" / "model.json").write_text("{}", encoding="utf-8")
+    (root / "weights.pth").write_bytes(b"weights")
+    return root
+
+
+def _assert_installed(target: Path) -> None:
+    assert (target / "config" / "model.json").read_text(encoding="utf-8") == "{}"
+    assert (target / "weights.pth").read_bytes() == b"weights"
+
+
+def test_move_to_model_dir_renames_entries(setup_script, tmp_path):
+    source = _make_extracted_model(tmp_path / "extracted")
+    target = tmp_path / "models" / "sample"
+    target.mkdir(parents=True)
+    (target / "weights.pth").write_bytes(b"stale")
+
+    setup_script.move_to_model_dir(source, target)
+
+    _assert_installed(target)
+    assert list(source.iterdir()) == []
+
+
+def test_move_to_model_dir_copies_across_devices(setup_script, tmp_path, monkeypatch):
+    source = _make_extracted_model(tmp_path / "extracted")
+    target = tmp_path / "models" / "sample"
+
+    def cross_device(src, dst):
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+    monkeypatch.setattr(setup_script.os, "replace", cross_device)
+    setup_script.move_to_model_dir(source, target)
+
+    _assert_installed(target)
+    assert (source / "weights.pth").exists()